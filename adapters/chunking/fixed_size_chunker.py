@@ -1,59 +1,75 @@
-from typing import List
+from typing import Callable, Iterator, List, Optional
 
 from polyrag.core.ports.chunking_port import ChunkingPort
-from polyrag.core.models.models import Document, Chunk, ChunkType, ElementType
+from polyrag.core.models.models import Document, Chunk, ChunkMetadata, ChunkType, ElementType
 
 
 class FixedSizeChunker(ChunkingPort):
     """Adapter for fixed-size character-based chunking."""
 
-    def __init__(self, chunk_size: int = 500, chunk_overlap: int = 50):
+    # Per-chunk metadata keys, shared by every chunk's ChunkMetadata
+    _CHUNK_KEYS = ("chunk_index", "total_chunks")
+    _CHUNK_KEYS_SIMHASH = ("chunk_index", "total_chunks", "simhash")
+
+    def __init__(self, chunk_size: int = 500, chunk_overlap: int = 50, simhash: bool = False):
         """
         Initialize the FixedSizeChunker.
 
         Args:
             chunk_size: Maximum number of characters per chunk.
             chunk_overlap: Number of overlapping characters between chunks.
+            simhash: Store each chunk's SimHash fingerprint in
+                     metadata["simhash"] (as a signed int64), so a
+                     HybridRetriever with dedup_distance set does not
+                     re-hash stored chunks on every query.
         """
         if chunk_overlap >= chunk_size:
             raise ValueError("chunk_overlap must be less than chunk_size")
         
         self._chunk_size = chunk_size
         self._chunk_overlap = chunk_overlap
+        self._fingerprint: Optional[Callable[[str], int]] = None
+        if simhash:
+            # Imported here: the retriever package pulls in optional model dependencies
+            from polyrag.adapters.retriever.simhash import simhash64, to_int64
+            self._fingerprint = lambda text: to_int64(simhash64(text))
 
-    def chunk(self, document: Document) -> List[Chunk]:
+    def chunk(self, document: Document) -> Iterator[Chunk]:
         """
-        Splits a Document into a list of Chunks.
+        Splits a Document into Chunks, yielded lazily.
 
         Args:
             document: The document to split.
 
-        Returns:
-            A list of Chunk objects.
+        Yields:
+            Chunk objects in document order.
         """
-        chunks = []
-        
         # Process text elements
         for element in document.elements:
             if element.type == ElementType.TEXT:
                 text = element.content
                 text_chunks = self._split_text(text)
+                total_chunks = len(text_chunks)
+
+                # Merge element/document metadata once per element; chunks
+                # share it and only store their own index values
+                base_metadata = {**element.metadata, **document.metadata}
                 
                 for i, chunk_text in enumerate(text_chunks):
-                    chunk = Chunk(
+                    if self._fingerprint is not None:
+                        metadata = ChunkMetadata(
+                            base_metadata,
+                            self._CHUNK_KEYS_SIMHASH,
+                            (i, total_chunks, self._fingerprint(chunk_text))
+                        )
+                    else:
+                        metadata = ChunkMetadata(base_metadata, self._CHUNK_KEYS, (i, total_chunks))
+                    yield Chunk(
                         content=chunk_text,
                         chunk_type=ChunkType.TEXT,
                         source_document_id=document.id,
-                        metadata={
-                            "chunk_index": i,
-                            "total_chunks": len(text_chunks),
-                            **element.metadata,
-                            **document.metadata
-                        }
+                        metadata=metadata
                     )
-                    chunks.append(chunk)
-        
-        return chunks
 
     def _split_text(self, text: str) -> List[str]:
         """
@@ -68,19 +84,12 @@ class FixedSizeChunker(ChunkingPort):
         if not text:
             return []
 
-        chunks = []
-        start = 0
-        
-        while start < len(text):
-            end = start + self._chunk_size
-            chunk = text[start:end]
-            chunks.append(chunk)
-            
-            # Move start position, accounting for overlap
-            start = end - self._chunk_overlap
-            
-            # Avoid infinite loop if overlap equals or exceeds remaining text
-            if start >= len(text):
-                break
+        # Chunk start offsets follow directly from the stride, so the slices
+        # can be built in one comprehension without overlap bookkeeping
+        step = self._chunk_size - self._chunk_overlap
+        if len(text) <= step:
+            # Only one start offset exists, so the text is its own single chunk
+            return [text]
 
-        return chunks
+        size = self._chunk_size
+        return [text[start:start + size] for start in range(0, len(text), step)]
@@ -1,5 +1,5 @@
 import os
-from typing import List
+from typing import Iterator, List
 
 try:
     from pypdf import PdfReader
@@ -37,6 +37,41 @@ class PdfLoader(DocumentLoaderPort):
             FileNotFoundError: If the file does not exist.
             ValueError: If the file extension is not supported.
         """
+        reader, ext = self._open(file_path)
+        total_pages = len(reader.pages)
+
+        return Document(
+            elements=list(self._iter_elements(reader, file_path, total_pages)),
+            metadata={
+                "source_file": file_path,
+                "file_name": os.path.basename(file_path),
+                "file_extension": ext,
+                "total_pages": total_pages
+            }
+        )
+
+    def load_iter(self, file_path: str) -> Iterator[Element]:
+        """
+        Lazily extracts text elements page by page.
+
+        Lets callers start chunking/embedding early pages while later
+        pages are still being parsed.
+
+        Args:
+            file_path: Path to the PDF file.
+
+        Yields:
+            One TextElement per non-empty page.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If the file extension is not supported.
+        """
+        reader, _ = self._open(file_path)
+        yield from self._iter_elements(reader, file_path, len(reader.pages))
+
+    def _open(self, file_path: str):
+        """Validates the path and returns a PdfReader with the file extension."""
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
 
@@ -44,32 +79,24 @@ class PdfLoader(DocumentLoaderPort):
         if ext not in self.supported_extensions:
             raise ValueError(f"Unsupported file extension: {ext}")
 
-        reader = PdfReader(file_path)
-        elements = []
+        return PdfReader(file_path), ext
 
-        for page_num, page in enumerate(reader.pages):
-            text = page.extract_text()
-            if text and text.strip():
-                element = Element(
+    def _iter_elements(self, reader, file_path: str, total_pages: int) -> Iterator[Element]:
+        """Yields a TextElement for each page with extractable text."""
+        pages = reader.pages
+        for page_num in range(total_pages):
+            text = pages[page_num].extract_text()
+            # isspace() tests for blank pages without allocating a stripped copy
+            if text and not text.isspace():
+                yield Element(
                     content=text,
                     type=ElementType.TEXT,
                     metadata={
                         "source_file": file_path,
                         "page_number": page_num + 1,
-                        "total_pages": len(reader.pages)
+                        "total_pages": total_pages
                     }
                 )
-                elements.append(element)
-
-        return Document(
-            elements=elements,
-            metadata={
-                "source_file": file_path,
-                "file_name": os.path.basename(file_path),
-                "file_extension": ext,
-                "total_pages": len(reader.pages)
-            }
-        )
 
     @property
     def supported_extensions(self) -> List[str]:
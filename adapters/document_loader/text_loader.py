@@ -1,3 +1,4 @@
+import mmap
 import os
 from typing import List
 
@@ -8,6 +9,9 @@ from polyrag.core.models.models import Document, Element, ElementType
 class TextLoader(DocumentLoaderPort):
     """Adapter for loading text files (.txt, .md)."""
 
+    # Files above this size are memory-mapped instead of read into a bytes buffer
+    MMAP_THRESHOLD = 64 * 1024 * 1024
+
     def __init__(self, encoding: str = "utf-8"):
         """
         Initialize the TextLoader.
@@ -38,8 +42,7 @@ class TextLoader(DocumentLoaderPort):
         if ext not in self.supported_extensions:
             raise ValueError(f"Unsupported file extension: {ext}")
 
-        with open(file_path, "r", encoding=self._encoding) as f:
-            content = f.read()
+        content = self._read_text(file_path)
 
         element = Element(
             content=content,
@@ -56,6 +59,29 @@ class TextLoader(DocumentLoaderPort):
             }
         )
 
+    def _read_text(self, file_path: str) -> str:
+        """
+        Reads and decodes a file in one shot, bypassing the TextIOWrapper layer.
+
+        Args:
+            file_path: Path to the file to read.
+
+        Returns:
+            The decoded file content with universal newlines.
+        """
+        with open(file_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size > self.MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    content = mm[:].decode(self._encoding)
+            else:
+                content = f.read().decode(self._encoding)
+
+        # Match text-mode newline translation, skipping the scan when there is nothing to do
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        return content
+
     @property
     def supported_extensions(self) -> List[str]:
         """Returns a list of supported file extensions."""
@@ -3,3 +3,4 @@ from polyrag.adapters.embedding.fastembed_adapter import FastEmbedAdapter
 from polyrag.adapters.embedding.clip_adapter import CLIPAdapter
 from polyrag.adapters.embedding.colbert_adapter import ColBERTAdapter
 from polyrag.adapters.embedding.colpali_adapter import ColPaliAdapter
+from polyrag.adapters.embedding.embedding_cache import EmbeddingCache
@@ -0,0 +1,108 @@
+import hashlib
+import os
+from typing import List, Optional
+
+try:
+    import onnxruntime as ort
+except ImportError:
+    ort = None
+
+try:
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+except ImportError:
+    quantize_dynamic = None
+    QuantType = None
+
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "polyrag", "onnx")
+
+
+def require_onnxruntime():
+    """
+    Ensure onnxruntime is available.
+
+    Raises:
+        ImportError: If onnxruntime is not installed.
+    """
+    if ort is None:
+        raise ImportError(
+            "onnxruntime is required for the ONNX backend. "
+            "Install with: pip install onnxruntime (or onnxruntime-gpu)"
+        )
+
+
+def model_cache_dir(model_name: str, cache_dir: Optional[str] = None) -> str:
+    """
+    Returns (and creates) the directory holding exported graphs for a model.
+
+    Args:
+        model_name: Name of the source model.
+        cache_dir: Root cache directory. Defaults to ~/.cache/polyrag/onnx.
+
+    Returns:
+        Path to the model-specific export directory.
+    """
+    digest = hashlib.sha256(model_name.encode("utf-8")).hexdigest()[:16]
+    path = os.path.join(cache_dir or DEFAULT_CACHE_DIR, digest)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def cuda_available() -> bool:
+    """Returns True if onnxruntime can run on CUDA."""
+    require_onnxruntime()
+    return "CUDAExecutionProvider" in ort.get_available_providers()
+
+
+def get_providers() -> List[str]:
+    """Returns execution providers in preference order (CUDA first when available)."""
+    if cuda_available():
+        return ["CUDAExecutionProvider", "CPUExecutionProvider"]
+    return ["CPUExecutionProvider"]
+
+
+def maybe_quantize(path: str, quantize: Optional[str] = None) -> str:
+    """
+    Returns the model path to serve, producing an int8 variant if requested.
+
+    The dynamically quantized graph is written next to the original as
+    ``<path>.int8`` and reused on subsequent calls.
+
+    Args:
+        path: Path to the FP32 ONNX model.
+        quantize: None for the original model, or "int8".
+
+    Returns:
+        Path to the model file to load.
+
+    Raises:
+        ValueError: If the quantization mode is unknown.
+    """
+    if quantize is None:
+        return path
+    if quantize != "int8":
+        raise ValueError(f"Unsupported ONNX quantization: {quantize}")
+
+    require_onnxruntime()
+    quantized_path = path + ".int8"
+    if not os.path.exists(quantized_path):
+        quantize_dynamic(path, quantized_path, weight_type=QuantType.QInt8)
+    return quantized_path
+
+
+def create_session(path: str, providers: Optional[List[str]] = None) -> "ort.InferenceSession":
+    """
+    Create an inference session with full graph optimizations enabled.
+
+    Args:
+        path: Path to the ONNX model file.
+        providers: Execution providers. Defaults to get_providers().
+
+    Returns:
+        An onnxruntime InferenceSession.
+    """
+    require_onnxruntime()
+    sess_options = ort.SessionOptions()
+    sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    sess_options.intra_op_num_threads = os.cpu_count() or 0
+    return ort.InferenceSession(path, sess_options=sess_options, providers=providers or get_providers())
@@ -1,4 +1,8 @@
-from typing import List, Any, Union
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, Any, Union, Optional
+import numpy as np
 from PIL import Image
 
 try:
@@ -7,37 +11,157 @@ except ImportError:
     SentenceTransformer = None
 
 from polyrag.core.ports.embedding_port import TextEmbeddingPort, ImageEmbeddingPort
+from polyrag.adapters.embedding.embedding_cache import EmbeddingCache
+from polyrag.adapters.embedding import _onnx_utils
 
 
 class CLIPAdapter(TextEmbeddingPort, ImageEmbeddingPort):
     """
     Adapter for CLIP model using sentence-transformers.
-    
+
     Embeds both text and images into the same vector space,
     enabling cross-modal similarity search.
     """
 
-    def __init__(self, model_name: str = "clip-ViT-B-32"):
+    BACKENDS = ("torch", "onnx")
+
+    def __init__(
+        self,
+        model_name: str = "clip-ViT-B-32",
+        cache: Optional[EmbeddingCache] = None,
+        backend: str = "torch",
+        onnx_cache_dir: Optional[str] = None,
+        quantize: Optional[str] = None,
+        batch_size: int = 32
+    ):
         """
         Initialize the CLIP adapter.
 
         Args:
             model_name: The name of the CLIP model to use.
+            cache: Optional embedding cache for text inputs.
+            backend: Inference backend, "torch" or "onnx". The ONNX backend
+                     exports both towers once and serves them with onnxruntime.
+            onnx_cache_dir: Directory for exported ONNX graphs.
+            quantize: Set to "int8" to serve dynamically quantized ONNX towers
+                      (CPU only, requires the ONNX backend).
+            batch_size: Number of texts per length-sorted mini-batch.
 
         Raises:
-            ImportError: If sentence-transformers is not installed.
+            ImportError: If sentence-transformers (or onnxruntime for the
+                         ONNX backend) is not installed.
+            ValueError: If the backend is unknown.
         """
         if SentenceTransformer is None:
             raise ImportError(
                 "sentence-transformers is required for CLIPAdapter. "
                 "Install with: pip install sentence-transformers"
             )
-        
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown CLIP backend: {backend}")
+        if quantize is not None and backend != "onnx":
+            raise ValueError("quantize requires backend='onnx'")
+
         self._model_name = model_name
+        self._cache = cache
+        self._backend = backend
+        self._batch_size = batch_size
         self._model = SentenceTransformer(model_name)
-        self._dimension: int | None = None
+        self._text_session = None
+        self._vision_session = None
+        if backend == "onnx":
+            self._init_onnx(onnx_cache_dir, quantize)
+
+        # Resolve the dimension once so the embed methods stay branch-free
+        self._dimension: int = (
+            self._model.get_sentence_embedding_dimension()
+            or self._encode_text_batch(["dummy"]).shape[-1]
+        )
+
+    def _init_onnx(self, onnx_cache_dir: Optional[str], quantize: Optional[str]):
+        """Export the CLIP towers to ONNX (once per model) and open inference sessions."""
+        _onnx_utils.require_onnxruntime()
+
+        clip_module = self._model[0]
+        self._processor = clip_module.processor
+        # int8 kernels target the CPU; quantization starts from the FP32 export
+        use_fp16 = quantize is None and _onnx_utils.cuda_available()
+        providers = ["CPUExecutionProvider"] if quantize else None
+
+        export_dir = _onnx_utils.model_cache_dir(self._model_name, onnx_cache_dir)
+        suffix = ".fp16.onnx" if use_fp16 else ".onnx"
+        text_path = os.path.join(export_dir, "clip_textual" + suffix)
+        vision_path = os.path.join(export_dir, "clip_visual" + suffix)
+
+        if not (os.path.exists(text_path) and os.path.exists(vision_path)):
+            self._export_onnx(clip_module.model, text_path, vision_path, use_fp16)
+
+        self._text_session = _onnx_utils.create_session(
+            _onnx_utils.maybe_quantize(text_path, quantize), providers
+        )
+        self._vision_session = _onnx_utils.create_session(
+            _onnx_utils.maybe_quantize(vision_path, quantize), providers
+        )
+        self._pixel_dtype = np.float16 if use_fp16 else np.float32
+
+    def _export_onnx(self, clip_model: Any, text_path: str, vision_path: str, use_fp16: bool):
+        """Export the text and vision projection towers with dynamic batch axes."""
+        import copy
+        import torch
+
+        class _TextTower(torch.nn.Module):
+            def __init__(self, model):
+                super().__init__()
+                self.model = model
+
+            def forward(self, input_ids, attention_mask):
+                return self.model.get_text_features(input_ids=input_ids, attention_mask=attention_mask)
+
+        class _VisionTower(torch.nn.Module):
+            def __init__(self, model):
+                super().__init__()
+                self.model = model
 
-    def embed_text(self, text: str) -> List[float]:
+            def forward(self, pixel_values):
+                return self.model.get_image_features(pixel_values=pixel_values)
+
+        model = copy.deepcopy(clip_model).eval()
+        device = "cuda" if use_fp16 else "cpu"
+        if use_fp16:
+            model = model.half()
+        model = model.to(device)
+
+        tokens = self._processor(text=["a photo"], return_tensors="pt", padding=True)
+        pixels = self._processor(images=[Image.new("RGB", (224, 224))], return_tensors="pt")["pixel_values"]
+        pixels = pixels.to(device, dtype=torch.float16 if use_fp16 else torch.float32)
+
+        with torch.no_grad():
+            torch.onnx.export(
+                _TextTower(model),
+                (tokens["input_ids"].to(device), tokens["attention_mask"].to(device)),
+                text_path,
+                input_names=["input_ids", "attention_mask"],
+                output_names=["embeddings"],
+                dynamic_axes={
+                    "input_ids": {0: "batch", 1: "sequence"},
+                    "attention_mask": {0: "batch", 1: "sequence"},
+                    "embeddings": {0: "batch"},
+                },
+                opset_version=14,
+                do_constant_folding=True
+            )
+            torch.onnx.export(
+                _VisionTower(model),
+                (pixels,),
+                vision_path,
+                input_names=["pixel_values"],
+                output_names=["embeddings"],
+                dynamic_axes={"pixel_values": {0: "batch"}, "embeddings": {0: "batch"}},
+                opset_version=14,
+                do_constant_folding=True
+            )
+
+    def embed_text(self, text: str) -> np.ndarray:
         """
         Embeds a single text string.
 
@@ -45,15 +169,11 @@ class CLIPAdapter(TextEmbeddingPort, ImageEmbeddingPort):
             text: The text to embed.
 
         Returns:
-            The embedding vector.
+            The embedding vector as a float32 array.
         """
-        embedding = self._model.encode(text, convert_to_numpy=True)
-        result = embedding.tolist()
-        if self._dimension is None:
-            self._dimension = len(result)
-        return result
+        return self.embed_texts([text])[0]
 
-    def embed_texts(self, texts: List[str]) -> List[List[float]]:
+    def embed_texts(self, texts: List[str]) -> np.ndarray:
         """
         Embeds multiple text strings.
 
@@ -61,15 +181,51 @@ class CLIPAdapter(TextEmbeddingPort, ImageEmbeddingPort):
             texts: List of texts to embed.
 
         Returns:
-            List of embedding vectors.
+            A float32 array of shape (len(texts), dimension).
         """
-        embeddings = self._model.encode(texts, convert_to_numpy=True)
-        results = [emb.tolist() for emb in embeddings]
-        if self._dimension is None and results:
-            self._dimension = len(results[0])
+        if self._cache is not None and texts:
+            return np.asarray(
+                self._cache.embed_with_cache(self._model_name, texts, self._encode_texts_np),
+                dtype=np.float32
+            )
+        return self._encode_texts_np(texts)
+
+    def _encode_texts_np(self, texts: List[str]) -> np.ndarray:
+        """Runs the CLIP text tower on length-sorted mini-batches, returning input order."""
+        # Grouping similar lengths keeps padding close to each batch's longest text
+        order = np.argsort([len(t) for t in texts], kind="stable")
+        results = np.empty((len(texts), self._dimension), dtype=np.float32)
+
+        for start in range(0, len(order), self._batch_size):
+            indices = order[start:start + self._batch_size]
+            results[indices] = self._encode_text_batch([texts[i] for i in indices])
+
         return results
 
-    def embed_image(self, image: Any) -> List[float]:
+    def _encode_text_batch(self, texts: List[str]) -> np.ndarray:
+        """Runs the CLIP text tower on a single mini-batch."""
+        if self._text_session is not None:
+            tokens = self._processor(text=texts, return_tensors="np", padding=True, truncation=True)
+            return self._text_session.run(None, {
+                "input_ids": tokens["input_ids"].astype(np.int64),
+                "attention_mask": tokens["attention_mask"].astype(np.int64)
+            })[0]
+
+        return self._model.encode(texts, batch_size=len(texts), convert_to_numpy=True)
+
+    def _encode_images(self, images: List[Any]) -> np.ndarray:
+        """Runs the CLIP vision tower on a list of PIL images."""
+        if self._vision_session is not None:
+            pixels = self._processor(images=images, return_tensors="np")["pixel_values"]
+            embeddings = self._vision_session.run(None, {
+                "pixel_values": pixels.astype(self._pixel_dtype)
+            })[0]
+            return embeddings.astype(np.float32)
+
+        embeddings = self._model.encode(images, convert_to_numpy=True)
+        return np.asarray(embeddings, dtype=np.float32)
+
+    def embed_image(self, image: Any) -> np.ndarray:
         """
         Embeds a single image.
 
@@ -81,14 +237,10 @@ class CLIPAdapter(TextEmbeddingPort, ImageEmbeddingPort):
         """
         if isinstance(image, str):
             image = Image.open(image)
-        
-        embedding = self._model.encode(image, convert_to_numpy=True)
-        result = embedding.tolist()
-        if self._dimension is None:
-            self._dimension = len(result)
-        return result
-
-    def embed_images(self, images: List[Any]) -> List[List[float]]:
+
+        return self._encode_images([image])[0]
+
+    def embed_images(self, images: List[Any]) -> np.ndarray:
         """
         Embeds multiple images.
 
@@ -96,26 +248,92 @@ class CLIPAdapter(TextEmbeddingPort, ImageEmbeddingPort):
             images: List of file paths or PIL Image objects.
 
         Returns:
-            List of embedding vectors.
+            A float32 array of shape (len(images), dimension).
         """
-        pil_images = []
-        for img in images:
-            if isinstance(img, str):
-                pil_images.append(Image.open(img))
-            else:
-                pil_images.append(img)
-        
-        embeddings = self._model.encode(pil_images, convert_to_numpy=True)
-        results = [emb.tolist() for emb in embeddings]
-        if self._dimension is None and results:
-            self._dimension = len(results[0])
-        return results
+        paths = [img for img in images if isinstance(img, str)]
+        if len(paths) > 1:
+            # PIL releases the GIL while decoding, so files decode in parallel
+            with ThreadPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1)) as executor:
+                return self._encode_images(self._decode_images(images, executor))
+        return self._encode_images(self._decode_images(images))
+
+    def embed_images_batched(self, images: Iterable[Any], batch_size: int = 32) -> Iterator[np.ndarray]:
+        """
+        Embeds images in batches, preparing batch N+1 while batch N runs.
+
+        A producer thread decodes (in parallel) and preprocesses the next
+        batch; on CUDA its pixel tensor is pinned so the upload is issued
+        non-blocking and overlaps with the forward pass.
+
+        Args:
+            images: File paths or PIL images; any iterable, consumed lazily.
+            batch_size: Number of images per yielded matrix.
+
+        Yields:
+            Float32 arrays of shape (len(batch), dimension), in input order.
+        """
+        iterator = iter(images)
+        batches = iter(lambda: list(islice(iterator, batch_size)), [])
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as decoder, \
+                ThreadPoolExecutor(max_workers=1) as producer:
+            pending = None
+            for batch in batches:
+                prepared = producer.submit(self._prepare_image_batch, batch, decoder)
+                if pending is not None:
+                    yield self._encode_prepared_images(pending.result())
+                pending = prepared
+            if pending is not None:
+                yield self._encode_prepared_images(pending.result())
+
+    def _decode_images(self, images: List[Any], executor: Optional[ThreadPoolExecutor] = None) -> List[Any]:
+        """Returns PIL images, decoding file paths (in parallel when an executor is given)."""
+        paths = [img for img in images if isinstance(img, str)]
+        loaded = executor.map(self._load_image, paths) if executor is not None else map(self._load_image, paths)
+        decoded = dict(zip(paths, loaded))
+        return [decoded[img] if isinstance(img, str) else img for img in images]
+
+    def _prepare_image_batch(self, images: List[Any], executor: ThreadPoolExecutor) -> Any:
+        """
+        Decodes and preprocesses a batch off the inference thread.
+
+        Returns NumPy pixels for ONNX, a pinned pixel tensor for torch on
+        CUDA, and otherwise the PIL images for SentenceTransformer.encode.
+        """
+        pil_images = self._decode_images(images, executor)
+        if self._vision_session is not None:
+            return self._processor(images=pil_images, return_tensors="np")["pixel_values"]
+        if self._model.device.type == "cuda":
+            processor = self._model[0].processor
+            return processor(images=pil_images, return_tensors="pt")["pixel_values"].pin_memory()
+        return pil_images
+
+    def _encode_prepared_images(self, prepared: Any) -> np.ndarray:
+        """Runs the vision tower on a batch from _prepare_image_batch."""
+        if self._vision_session is not None:
+            return self._vision_session.run(None, {
+                "pixel_values": prepared.astype(self._pixel_dtype)
+            })[0].astype(np.float32)
+
+        if isinstance(prepared, list):
+            return np.asarray(self._model.encode(prepared, convert_to_numpy=True), dtype=np.float32)
+
+        import torch
+
+        clip_model = self._model[0].model
+        pixels = prepared.to(self._model.device, dtype=clip_model.dtype, non_blocking=True)
+        with torch.inference_mode():
+            embeddings = clip_model.get_image_features(pixel_values=pixels)
+        return embeddings.float().cpu().numpy()
+
+    @staticmethod
+    def _load_image(path: str) -> Image.Image:
+        """Opens and fully decodes an image file."""
+        image = Image.open(path)
+        image.load()
+        return image
 
     @property
     def dimension(self) -> int:
         """Returns the dimension of the embedding vector."""
-        if self._dimension is None:
-            # Compute dimension by embedding a dummy text
-            dummy = self._model.encode("dummy", convert_to_numpy=True)
-            self._dimension = len(dummy.tolist())
         return self._dimension
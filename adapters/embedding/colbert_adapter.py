@@ -1,11 +1,13 @@
-from typing import List, Union
+from typing import List, Tuple, Union
 import numpy as np
 
 try:
+    import torch
     from colbert import Searcher
     from colbert.infra import ColBERTConfig
     from colbert.modeling.checkpoint import Checkpoint
 except ImportError:
+    torch = None
     Searcher = None
     ColBERTConfig = None
     Checkpoint = None
@@ -24,7 +26,8 @@ class ColBERTAdapter(TextEmbeddingPort):
     def __init__(
         self,
         model_name: str = "colbert-ir/colbertv2.0",
-        device: str = "cpu"
+        device: str = "cpu",
+        batch_size: int = 32
     ):
         """
         Initialize the ColBERT adapter.
@@ -32,6 +35,7 @@ class ColBERTAdapter(TextEmbeddingPort):
         Args:
             model_name: ColBERT model name or path.
             device: Device to run on (cpu/cuda).
+            batch_size: Number of texts per length-sorted mini-batch.
 
         Raises:
             ImportError: If colbert is not installed.
@@ -43,6 +47,7 @@ class ColBERTAdapter(TextEmbeddingPort):
         
         self._model_name = model_name
         self._device = device
+        self._batch_size = batch_size
         
         # Initialize checkpoint for encoding
         self._config = ColBERTConfig(
@@ -53,7 +58,7 @@ class ColBERTAdapter(TextEmbeddingPort):
         self._checkpoint = Checkpoint(model_name, colbert_config=self._config)
         self._dimension: int = 128  # ColBERT default dimension
 
-    def embed_text(self, text: str) -> List[float]:
+    def embed_text(self, text: str) -> np.ndarray:
         """
         Embeds a single text string.
         
@@ -67,11 +72,10 @@ class ColBERTAdapter(TextEmbeddingPort):
             Pooled embedding vector.
         """
         embeddings = self._checkpoint.docFromText([text])
-        # Pool token embeddings (mean pooling)
-        pooled = embeddings[0].mean(dim=0).cpu().numpy()
-        return pooled.tolist()
+        # Pool on device so only the pooled vector is copied to the host
+        return self._mean_pool(embeddings)[0].float().cpu().numpy()
 
-    def embed_texts(self, texts: List[str]) -> List[List[float]]:
+    def embed_texts(self, texts: List[str]) -> np.ndarray:
         """
         Embeds multiple text strings.
 
@@ -79,15 +83,49 @@ class ColBERTAdapter(TextEmbeddingPort):
             texts: List of texts to embed.
 
         Returns:
-            List of pooled embedding vectors.
+            Float32 array of pooled embedding vectors, one row per text.
         """
-        embeddings = self._checkpoint.docFromText(texts)
-        results = []
-        for emb in embeddings:
-            pooled = emb.mean(dim=0).cpu().numpy()
-            results.append(pooled.tolist())
+        return self._pool_texts(texts)
+
+    def _pool_texts(self, texts: List[str]) -> np.ndarray:
+        """Encodes length-sorted mini-batches and mean-pools them, returning input order."""
+        # Length-sorted mini-batches avoid padding short texts up to doc_maxlen
+        order = np.argsort([len(t) for t in texts], kind="stable")
+        results = np.empty((len(texts), self._dimension), dtype=np.float32)
+
+        for start in range(0, len(order), self._batch_size):
+            indices = order[start:start + self._batch_size]
+            embeddings = self._checkpoint.docFromText([texts[i] for i in indices])
+            # Pool on device and convert the whole batch with one transfer
+            results[indices] = self._mean_pool(embeddings).float().cpu().numpy()
+
         return results
 
+    @staticmethod
+    def _mean_pool(embeddings) -> "torch.Tensor":
+        """
+        Mean-pools a batch of token embeddings on device in one reduction.
+
+        Matches the per-item mean(dim=0) that existing collections were
+        built with: a padded (B x T x D) tensor is averaged over all T rows,
+        and a list of (T_i x D) tensors over each item's own T_i.
+        """
+        if isinstance(embeddings, (list, tuple)):
+            counts = torch.tensor(
+                [e.shape[0] for e in embeddings],
+                device=embeddings[0].device,
+                dtype=embeddings[0].dtype
+            ).unsqueeze(1)
+            return ColBERTAdapter._pad_batch(embeddings).sum(dim=1) / counts
+        return embeddings.mean(dim=1)
+
+    @staticmethod
+    def _pad_batch(embeddings) -> "torch.Tensor":
+        """Returns token embeddings as a padded (B x T x D) tensor."""
+        if isinstance(embeddings, (list, tuple)):
+            return torch.nn.utils.rnn.pad_sequence(list(embeddings), batch_first=True)
+        return embeddings
+
     def embed_query_tokens(self, query: str) -> np.ndarray:
         """
         Get token-level embeddings for a query (for late interaction).
@@ -96,10 +134,28 @@ class ColBERTAdapter(TextEmbeddingPort):
             query: The query text.
 
         Returns:
-            Token-level embeddings as numpy array.
+            L2-normalized token-level embeddings as a read-only numpy array.
         """
         embeddings = self._checkpoint.queryFromText([query])
-        return embeddings[0].cpu().numpy()
+        return self._normalize_tokens(embeddings[0].float().cpu().numpy())
+
+    def embed_query_tokens_and_pooled(self, query: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get query token embeddings and their pooled vector from one forward pass.
+
+        Args:
+            query: The query text.
+
+        Returns:
+            Tuple of token-level embeddings (numpy array) and the pooled
+            embedding vector used for first-stage retrieval.
+        """
+        embeddings = self._checkpoint.queryFromText([query])
+        tokens = self._normalize_tokens(embeddings[0].float().cpu().numpy())
+        # The pooled vector is a reduction over the same token matrix
+        mask = np.any(tokens != 0, axis=1)
+        pooled = tokens[mask].mean(axis=0) if mask.any() else tokens.mean(axis=0)
+        return tokens, pooled
 
     def embed_doc_tokens(self, doc: str) -> np.ndarray:
         """
@@ -111,8 +167,39 @@ class ColBERTAdapter(TextEmbeddingPort):
         Returns:
             Token-level embeddings as numpy array.
         """
-        embeddings = self._checkpoint.docFromText([doc])
-        return embeddings[0].cpu().numpy()
+        return self.embed_docs_tokens([doc])[0]
+
+    def embed_docs_tokens(self, docs: List[str]) -> List[np.ndarray]:
+        """
+        Get token-level embeddings for several documents in one forward pass.
+
+        Args:
+            docs: The document texts.
+
+        Returns:
+            One L2-normalized, read-only (T_i x D) numpy array per document,
+            without the zeroed padding/skiplisted token rows.
+        """
+        if not docs:
+            return []
+
+        embeddings = self._checkpoint.docFromText(docs)
+        # Copy the whole padded batch to the host once
+        batch = self._pad_batch(embeddings).float().cpu().numpy()
+        return [self._normalize_tokens(tokens[np.any(tokens != 0, axis=1)]) for tokens in batch]
+
+    @staticmethod
+    def _normalize_tokens(tokens: np.ndarray) -> np.ndarray:
+        """
+        L2-normalizes token vectors into a read-only, C-contiguous float32 array.
+
+        Dot products between normalized tokens equal cosine similarity, so
+        MaxSim needs no further normalization and runs as a plain sgemm.
+        """
+        tokens = np.ascontiguousarray(tokens, dtype=np.float32)
+        tokens = tokens / (np.linalg.norm(tokens, axis=-1, keepdims=True) + 1e-9)
+        tokens.flags.writeable = False
+        return tokens
 
     @property
     def dimension(self) -> int:
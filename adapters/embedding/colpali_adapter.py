@@ -1,11 +1,15 @@
-from typing import List, Any
+import os
+from collections import OrderedDict
+from typing import List, Any, Dict
 import numpy as np
 from PIL import Image
 
 try:
+    import torch
     from colpali_engine.models import ColPali
     from colpali_engine.utils.processing_utils import BaseVisualRetrieverProcessor
 except ImportError:
+    torch = None
     ColPali = None
     BaseVisualRetrieverProcessor = None
 
@@ -20,10 +24,14 @@ class ColPaliAdapter(ImageEmbeddingPort):
     at the patch level for precise visual document retrieval.
     """
 
+    BACKENDS = ("torch", "compile", "tensorrt")
+
     def __init__(
         self,
         model_name: str = "vidore/colpali-v1.2",
-        device: str = "cpu"
+        device: str = "cpu",
+        preprocess_cache_size: int = 512,
+        backend: str = "torch"
     ):
         """
         Initialize the ColPali adapter.
@@ -31,28 +39,63 @@ class ColPaliAdapter(ImageEmbeddingPort):
         Args:
             model_name: ColPali model name or path.
             device: Device to run on (cpu/cuda).
+            preprocess_cache_size: Number of preprocessed image files kept in
+                                   memory, keyed by path and mtime (0 disables).
+            backend: "torch" for eager execution, "compile" for torch.compile, or
+                     "tensorrt" to compile with Torch-TensorRT in FP16 (CUDA only).
 
         Raises:
             ImportError: If colpali-engine is not installed.
+            ValueError: If the backend is unknown.
         """
         if ColPali is None:
             raise ImportError(
                 "colpali-engine is required. Install with: pip install colpali-engine"
             )
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown ColPali backend: {backend}")
         
         self._model_name = model_name
         self._device = device
+        self._preprocess_cache_size = preprocess_cache_size
+        self._preprocess_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
         
         # Load model and processor
         self._model = ColPali.from_pretrained(
             model_name,
             torch_dtype="auto"
         ).to(device).eval()
+        self._model = self._compile_model(self._model, backend)
         
         self._processor = BaseVisualRetrieverProcessor.from_pretrained(model_name)
         self._dimension: int = 128  # ColPali default dimension
 
-    def embed_image(self, image: Any) -> List[float]:
+    def _compile_model(self, model: Any, backend: str) -> Any:
+        """
+        Wraps the model for the requested execution backend.
+
+        TensorRT compilation needs a CUDA device and torch_tensorrt; when
+        either is missing it falls back to plain torch.compile.
+        """
+        if backend == "torch":
+            return model
+
+        if backend == "tensorrt" and str(self._device).startswith("cuda") and torch.cuda.is_available():
+            try:
+                import torch_tensorrt  # noqa: F401  (registers the "torch_tensorrt" dynamo backend)
+            except ImportError:
+                pass
+            else:
+                return torch.compile(
+                    model,
+                    backend="torch_tensorrt",
+                    dynamic=False,
+                    options={"enabled_precisions": {torch.float16, torch.float32}}
+                )
+
+        return torch.compile(model, mode="reduce-overhead")
+
+    def embed_image(self, image: Any) -> np.ndarray:
         """
         Embeds a single image.
         
@@ -65,22 +108,17 @@ class ColPaliAdapter(ImageEmbeddingPort):
         Returns:
             Pooled embedding vector.
         """
-        if isinstance(image, str):
-            image = Image.open(image).convert("RGB")
-        
         # Process image
-        batch = self._processor.process_images([image])
-        batch = {k: v.to(self._device) for k, v in batch.items()}
+        batch = self._process_images([image])
         
         # Get embeddings
-        with self._model.no_grad():
+        with torch.inference_mode():
             outputs = self._model(**batch)
         
         # Pool patch embeddings
-        pooled = outputs[0].mean(dim=0).cpu().numpy()
-        return pooled.tolist()
+        return self._mean_pool(outputs, batch.get("attention_mask"))[0].float().cpu().numpy()
 
-    def embed_images(self, images: List[Any]) -> List[List[float]]:
+    def embed_images(self, images: List[Any]) -> np.ndarray:
         """
         Embeds multiple images.
 
@@ -88,29 +126,82 @@ class ColPaliAdapter(ImageEmbeddingPort):
             images: List of file paths or PIL Images.
 
         Returns:
-            List of pooled embedding vectors.
+            Pooled embedding vectors, one row per image.
         """
-        pil_images = []
-        for img in images:
-            if isinstance(img, str):
-                pil_images.append(Image.open(img).convert("RGB"))
-            else:
-                pil_images.append(img.convert("RGB"))
-        
         # Process batch
-        batch = self._processor.process_images(pil_images)
-        batch = {k: v.to(self._device) for k, v in batch.items()}
+        batch = self._process_images(images)
         
         # Get embeddings
-        with self._model.no_grad():
+        with torch.inference_mode():
             outputs = self._model(**batch)
         
-        results = []
-        for emb in outputs:
-            pooled = emb.mean(dim=0).cpu().numpy()
-            results.append(pooled.tolist())
-        
-        return results
+        # Pool all patch embeddings at once and convert the batch in one pass
+        return self._mean_pool(outputs, batch.get("attention_mask")).float().cpu().numpy()
+
+    def embed_text(self, text: str) -> np.ndarray:
+        """
+        Embeds a text query with ColPali's language tower.
+
+        The query tokens live in the same space as the image patches, so
+        their pooled vector can be searched against pooled image embeddings
+        without rendering the text to an image.
+
+        Args:
+            text: The query text.
+
+        Returns:
+            Pooled embedding vector.
+        """
+        batch = {k: v.to(self._device) for k, v in self._processor.process_queries([text]).items()}
+
+        with torch.inference_mode():
+            outputs = self._model(**batch)
+
+        return self._mean_pool(outputs, batch.get("attention_mask"))[0].float().cpu().numpy()
+
+    def _process_images(self, images: List[Any]) -> Dict[str, Any]:
+        """
+        Preprocesses images into a model batch on the target device.
+
+        File paths go through the preprocessing cache; PIL images are
+        processed together in a single processor call.
+        """
+        if not any(isinstance(img, str) for img in images):
+            batch = self._processor.process_images([img.convert("RGB") for img in images])
+        else:
+            parts = [self._preprocess_single(img) for img in images]
+            batch = {k: torch.cat([part[k] for part in parts]) for k in parts[0]}
+        return {k: v.to(self._device) for k, v in batch.items()}
+
+    def _preprocess_single(self, image: Any) -> Dict[str, Any]:
+        """Decodes and preprocesses one image, reusing cached results for unchanged files."""
+        if not isinstance(image, str):
+            return self._processor.process_images([image.convert("RGB")])
+
+        key = (image, os.stat(image).st_mtime_ns)
+        cached = self._preprocess_cache.get(key)
+        if cached is not None:
+            self._preprocess_cache.move_to_end(key)
+            return cached
+
+        processed = self._processor.process_images([Image.open(image).convert("RGB")])
+        if self._preprocess_cache_size > 0:
+            self._preprocess_cache[key] = processed
+            if len(self._preprocess_cache) > self._preprocess_cache_size:
+                self._preprocess_cache.popitem(last=False)
+        return processed
+
+    @staticmethod
+    def _mean_pool(outputs: "torch.Tensor", attention_mask: "torch.Tensor" = None) -> "torch.Tensor":
+        """
+        Mean-pools a (B x P x D) batch of patch embeddings on device.
+
+        Padded positions are excluded when an attention mask is available.
+        """
+        if attention_mask is None:
+            return outputs.mean(dim=1)
+        mask = attention_mask.unsqueeze(-1).to(outputs.dtype)
+        return (outputs * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1)
 
     def embed_image_patches(self, image: Any) -> np.ndarray:
         """
@@ -122,13 +213,9 @@ class ColPaliAdapter(ImageEmbeddingPort):
         Returns:
             Patch-level embeddings as numpy array.
         """
-        if isinstance(image, str):
-            image = Image.open(image).convert("RGB")
-        
-        batch = self._processor.process_images([image])
-        batch = {k: v.to(self._device) for k, v in batch.items()}
+        batch = self._process_images([image])
         
-        with self._model.no_grad():
+        with torch.inference_mode():
             outputs = self._model(**batch)
         
         return outputs[0].cpu().numpy()
@@ -0,0 +1,150 @@
+import hashlib
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Callable, List, Optional, Sequence
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """
+    Two-tier embedding cache keyed by (model name, text).
+
+    Vectors are kept in an in-process LRU and, when a directory is given,
+    persisted as float32 blobs in a SQLite database so they survive restarts.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_memory_items: int = 10_000):
+        """
+        Initialize the embedding cache.
+
+        Args:
+            cache_dir: Directory for the on-disk store. If None, only the
+                       in-memory tier is used.
+            max_memory_items: Maximum number of vectors kept in memory.
+        """
+        self._max_memory_items = max_memory_items
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            self._conn = sqlite3.connect(
+                os.path.join(cache_dir, "embeddings.sqlite"),
+                check_same_thread=False
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vec BLOB)"
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def make_key(model_name: str, text: str) -> str:
+        """Returns the cache key for a text embedded by the given model."""
+        return hashlib.sha256(f"{model_name}\0{text}".encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: List[str]) -> List[Optional[np.ndarray]]:
+        """
+        Looks up vectors for the given keys.
+
+        Args:
+            keys: Cache keys from make_key().
+
+        Returns:
+            A list aligned with keys, with None for misses.
+        """
+        results: List[Optional[np.ndarray]] = [None] * len(keys)
+        disk_lookups = {}
+
+        with self._lock:
+            for i, key in enumerate(keys):
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    results[i] = vector
+                else:
+                    disk_lookups.setdefault(key, []).append(i)
+
+            if disk_lookups and self._conn is not None:
+                pending = list(disk_lookups)
+                # Stay well below SQLite's bound-parameter limit
+                for start in range(0, len(pending), 500):
+                    batch = pending[start:start + 500]
+                    placeholders = ",".join("?" * len(batch))
+                    rows = self._conn.execute(
+                        f"SELECT key, vec FROM embeddings WHERE key IN ({placeholders})",
+                        batch
+                    ).fetchall()
+                    for key, blob in rows:
+                        vector = np.frombuffer(blob, dtype=np.float32)
+                        self._remember(key, vector)
+                        for i in disk_lookups[key]:
+                            results[i] = vector
+
+        return results
+
+    def put_many(self, keys: List[str], vectors: Sequence[Sequence[float]]):
+        """
+        Stores vectors under the given keys.
+
+        Args:
+            keys: Cache keys from make_key().
+            vectors: Embedding vectors aligned with keys (rows of a matrix or lists).
+        """
+        # Own float32 copies, so cached rows don't keep a caller's whole matrix alive
+        vectors = [np.array(vector, dtype=np.float32) for vector in vectors]
+        with self._lock:
+            for key, vector in zip(keys, vectors):
+                self._remember(key, vector)
+
+            if self._conn is not None:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vec) VALUES (?, ?)",
+                    [(key, vector.tobytes()) for key, vector in zip(keys, vectors)]
+                )
+                self._conn.commit()
+
+    def embed_with_cache(
+        self,
+        model_name: str,
+        texts: List[str],
+        embed_fn: Callable[[List[str]], Sequence[Sequence[float]]]
+    ) -> List[np.ndarray]:
+        """
+        Embeds texts, calling embed_fn only for texts missing from the cache.
+
+        Args:
+            model_name: Identifier of the embedding model.
+            texts: Texts to embed.
+            embed_fn: Function embedding a list of texts.
+
+        Returns:
+            Float32 embedding vectors in the same order as texts.
+        """
+        keys = [self.make_key(model_name, t) for t in texts]
+        results = self.get_many(keys)
+
+        miss_indices = [i for i, vector in enumerate(results) if vector is None]
+        if miss_indices:
+            computed = embed_fn([texts[i] for i in miss_indices])
+            self.put_many([keys[i] for i in miss_indices], computed)
+            for i, vector in zip(miss_indices, computed):
+                results[i] = vector
+
+        return results
+
+    def _remember(self, key: str, vector: np.ndarray):
+        """Adds a vector to the in-memory LRU, evicting the oldest entry if full."""
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        if len(self._memory) > self._max_memory_items:
+            self._memory.popitem(last=False)
+
+    def close(self):
+        """Closes the on-disk store."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
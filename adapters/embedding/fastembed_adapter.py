@@ -1,25 +1,48 @@
-from typing import List
+import os
+from itertools import islice
+from typing import Iterator, List, Optional
 
+import numpy as np
 from fastembed import TextEmbedding
 
 from polyrag.core.ports.embedding_port import TextEmbeddingPort
+from polyrag.adapters.embedding.embedding_cache import EmbeddingCache
 
 
 class FastEmbedAdapter(TextEmbeddingPort):
     """Adapter for FastEmbed text embedding library."""
 
-    def __init__(self, model_name: str = "BAAI/bge-small-en-v1.5"):
+    def __init__(
+        self,
+        model_name: str = "BAAI/bge-small-en-v1.5",
+        batch_size: int = 256,
+        parallel: Optional[int] = None,
+        cache: Optional[EmbeddingCache] = None,
+        threads: Optional[int] = None
+    ):
         """
         Initialize the FastEmbed adapter.
 
         Args:
             model_name: The name of the embedding model to use.
+            batch_size: Number of texts encoded per model call.
+            parallel: Number of data-parallel workers (0 uses all cores, None disables).
+            cache: Optional embedding cache consulted before running the model.
+            threads: ONNX Runtime intra-op threads. Defaults to all CPU cores.
         """
         self._model_name = model_name
-        self._model = TextEmbedding(model_name=model_name)
-        self._dimension: int | None = None
+        self._batch_size = batch_size
+        self._parallel = parallel
+        self._cache = cache
+        self._model = TextEmbedding(model_name=model_name, threads=threads or os.cpu_count())
+        # One probe embedding resolves the dimension (keeping the embed methods
+        # branch-free) and whether this model's output is unit-norm; not every
+        # FastEmbed model normalizes (plain mean-pooled ones don't)
+        probe = self._embed_matrix(["dummy"])
+        self._dimension: int = probe.shape[1]
+        self._normalized: bool = bool(np.isclose(np.linalg.norm(probe[0]), 1.0, atol=1e-3))
 
-    def embed_text(self, text: str) -> List[float]:
+    def embed_text(self, text: str) -> np.ndarray:
         """
         Embeds a single text string.
 
@@ -27,15 +50,16 @@ class FastEmbedAdapter(TextEmbeddingPort):
             text: The text to embed.
 
         Returns:
-            The embedding vector as a list of floats.
+            The embedding vector as a float32 array.
         """
-        embeddings = list(self._model.embed([text]))
-        result = embeddings[0].tolist()
-        if self._dimension is None:
-            self._dimension = len(result)
-        return result
+        if self._cache is not None:
+            return np.asarray(
+                self._cache.embed_with_cache(self._model_name, [text], self._embed_matrix)[0],
+                dtype=np.float32
+            )
+        return next(iter(self._model.embed([text]))).astype(np.float32, copy=False)
 
-    def embed_texts(self, texts: List[str]) -> List[List[float]]:
+    def embed_texts(self, texts: List[str]) -> np.ndarray:
         """
         Embeds a list of text strings.
 
@@ -43,19 +67,58 @@ class FastEmbedAdapter(TextEmbeddingPort):
             texts: The texts to embed.
 
         Returns:
-            A list of embedding vectors.
+            A float32 array of shape (len(texts), dimension).
         """
-        embeddings = list(self._model.embed(texts))
-        results = [emb.tolist() for emb in embeddings]
-        if self._dimension is None and results:
-            self._dimension = len(results[0])
-        return results
+        if not texts:
+            return np.empty((0, self._dimension), dtype=np.float32)
+
+        if self._cache is not None:
+            return np.asarray(
+                self._cache.embed_with_cache(self._model_name, texts, self._embed_matrix),
+                dtype=np.float32
+            )
+        return self._embed_matrix(texts)
+
+    def embed_texts_batched(self, texts: List[str], batch_size: int = 32) -> Iterator[np.ndarray]:
+        """
+        Embeds texts in consecutive slices, yielding one float32 matrix per slice.
+
+        All texts go through a single FastEmbed generator, so tokenization
+        and ONNX batching run over the whole input rather than per slice.
+
+        Args:
+            texts: The texts to embed.
+            batch_size: Number of texts per yielded matrix (also the model batch size).
+
+        Yields:
+            Arrays of shape (len(slice), dimension), in input order.
+        """
+        if self._cache is not None:
+            yield from super().embed_texts_batched(texts, batch_size)
+            return
+
+        rows = iter(self._model.embed(texts, batch_size=batch_size, parallel=self._parallel))
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                return
+            yield np.vstack(batch).astype(np.float32, copy=False)
+
+    def _embed_matrix(self, texts: List[str]) -> np.ndarray:
+        """Runs the model on texts and stacks the output into one contiguous matrix."""
+        matrix = np.vstack(list(self._model.embed(
+            texts,
+            batch_size=self._batch_size,
+            parallel=self._parallel
+        )))
+        return matrix.astype(np.float32, copy=False)
 
     @property
     def dimension(self) -> int:
         """Returns the dimension of the embedding vector."""
-        if self._dimension is None:
-            # Compute dimension by embedding a dummy text
-            dummy = list(self._model.embed(["dummy"]))
-            self._dimension = len(dummy[0].tolist())
         return self._dimension
+
+    @property
+    def is_normalized(self) -> bool:
+        """Whether the model's embeddings have unit L2 norm, as probed at init."""
+        return self._normalized
@@ -1,12 +1,44 @@
+import asyncio
 import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import List, Optional
+import numpy as np
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
 from polyrag.core.ports.embedding_port import TextEmbeddingPort
+from polyrag.adapters.embedding.embedding_cache import EmbeddingCache
 
 class GeminiEmbeddingAdapter(TextEmbeddingPort):
     """Adapter for Google Gemini embeddings."""
 
-    def __init__(self, model_name: str = "models/text-embedding-004", api_key: Optional[str] = None):
+    # Errors worth retrying: rate limiting (429) and transient server failures (5xx)
+    RETRYABLE_ERRORS = (
+        google_exceptions.TooManyRequests,
+        google_exceptions.ResourceExhausted,
+        google_exceptions.InternalServerError,
+        google_exceptions.ServiceUnavailable,
+        google_exceptions.DeadlineExceeded,
+    )
+
+    # Known output dimensions, so no probe request is needed for these models
+    MODEL_DIMENSIONS = {
+        "text-embedding-004": 768,
+        "embedding-001": 768,
+    }
+
+    def __init__(
+        self,
+        model_name: str = "models/text-embedding-004",
+        api_key: Optional[str] = None,
+        cache: Optional[EmbeddingCache] = None,
+        max_batch_size: int = 100,
+        max_concurrency: int = 4,
+        batch_window_ms: Optional[float] = None,
+        max_retries: int = 5
+    ):
         """
         Initialize the Gemini embedding adapter.
 
@@ -14,9 +46,24 @@ class GeminiEmbeddingAdapter(TextEmbeddingPort):
             model_name: The name of the embedding model to use. 
                         Common models: "models/embedding-001", "models/text-embedding-004"
             api_key: Google Gemini API key.
+            cache: Optional embedding cache consulted before calling the API.
+            max_batch_size: Maximum number of texts sent per API request.
+            max_concurrency: Maximum number of sub-batch requests in flight.
+            batch_window_ms: If set, concurrent embed_text calls arriving within
+                             this window are coalesced into one request.
+            max_retries: Retries for rate-limited or failed requests.
         """
         self._model_name = model_name
-        self._dimension: int | None = None
+        self._cache = cache
+        self._max_batch_size = max_batch_size
+        self._max_concurrency = max_concurrency
+        self._batch_window_ms = batch_window_ms
+        self._max_retries = max_retries
+        self._dimension: int | None = self.MODEL_DIMENSIONS.get(model_name.replace("models/", ""))
+
+        self._embed_queue: "queue.Queue[tuple[str, Future]]" = queue.Queue()
+        self._batcher_thread: Optional[threading.Thread] = None
+        self._batcher_lock = threading.Lock()
         
         if api_key:
             genai.configure(api_key=api_key)
@@ -42,7 +89,7 @@ class GeminiEmbeddingAdapter(TextEmbeddingPort):
         except Exception:
             return []
 
-    def embed_text(self, text: str) -> List[float]:
+    def embed_text(self, text: str) -> np.ndarray:
         """
         Embeds a single text string.
 
@@ -50,19 +97,15 @@ class GeminiEmbeddingAdapter(TextEmbeddingPort):
             text: The text to embed.
 
         Returns:
-            The embedding vector as a list of floats.
+            The embedding vector as a float32 array.
         """
-        result = genai.embed_content(
-            model=self._model_name,
-            content=text,
-            task_type="retrieval_document" # or retrieval_query depending on usage, but document is generally safe for storage
-        )
-        embedding = result['embedding']
-        if self._dimension is None:
-            self._dimension = len(embedding)
-        return embedding
+        if self._cache is not None:
+            vector = self._cache.embed_with_cache(self._model_name, [text], self._embed_coalesced)[0]
+        else:
+            vector = self._embed_coalesced([text])[0]
+        return np.asarray(vector, dtype=np.float32)
 
-    def embed_texts(self, texts: List[str]) -> List[List[float]]:
+    def embed_texts(self, texts: List[str]) -> np.ndarray:
         """
         Embeds a list of text strings.
 
@@ -70,28 +113,152 @@ class GeminiEmbeddingAdapter(TextEmbeddingPort):
             texts: The texts to embed.
 
         Returns:
-            A list of embedding vectors.
+            A float32 array of shape (len(texts), dimension).
+        """
+        if not texts:
+            return np.empty((0, self.dimension), dtype=np.float32)
+
+        # The API returns JSON lists; convert once at this boundary
+        if self._cache is not None:
+            return np.asarray(
+                self._cache.embed_with_cache(self._model_name, texts, self._embed_batch),
+                dtype=np.float32
+            )
+        return np.asarray(self._embed_batch(texts), dtype=np.float32)
+
+    async def aembed_texts(self, texts: List[str]) -> np.ndarray:
+        """
+        Asynchronously embeds texts with genai's async client on the running loop.
+
+        Sub-batches of max_batch_size are awaited concurrently, at most
+        max_concurrency at a time. genai binds its async client to the loop
+        it first runs on, so call this from one long-lived event loop. With
+        an embedding cache, the work runs in a worker thread like embed_texts.
+
+        Args:
+            texts: The texts to embed.
+
+        Returns:
+            A float32 array of shape (len(texts), dimension).
         """
-        # Batch embedding if supported by API, else loop
-        # genai.embed_content supports "content" as a list of strings
-        result = genai.embed_content(
-            model=self._model_name,
-            content=texts,
-            task_type="retrieval_document"
+        if not texts:
+            return np.empty((0, self.dimension), dtype=np.float32)
+        if self._cache is not None:
+            return await super().aembed_texts(texts)
+
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def embed(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                return await self._embed_request_async(batch)
+
+        results = await asyncio.gather(*(embed(batch) for batch in self._split_batches(texts)))
+        return np.asarray(
+            [embedding for batch_embeddings in results for embedding in batch_embeddings],
+            dtype=np.float32
         )
-        # Result "embedding" key will be a list of lists if input was list
-        embeddings = result['embedding']
-        
-        if self._dimension is None and embeddings:
-            self._dimension = len(embeddings[0])
-            
+
+    def _embed_coalesced(self, texts: List[str]) -> List[List[float]]:
+        """Routes single-text requests through the dynamic batcher when enabled."""
+        if self._batch_window_ms is None or len(texts) != 1:
+            return self._embed_batch(texts)
+
+        future: Future = Future()
+        self._ensure_batcher()
+        self._embed_queue.put((texts[0], future))
+        return [future.result()]
+
+    def _ensure_batcher(self):
+        """Lazily start the background thread that flushes coalesced requests."""
+        with self._batcher_lock:
+            if self._batcher_thread is None:
+                self._batcher_thread = threading.Thread(target=self._run_batcher, daemon=True)
+                self._batcher_thread.start()
+
+    def _run_batcher(self):
+        """Collects queued texts for up to batch_window_ms and embeds them together."""
+        window = self._batch_window_ms / 1000.0
+        while True:
+            pending = [self._embed_queue.get()]
+            deadline = time.monotonic() + window
+
+            while len(pending) < self._max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    pending.append(self._embed_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                embeddings = self._embed_batch([text for text, _ in pending])
+            except Exception as e:
+                for _, future in pending:
+                    future.set_exception(e)
+                continue
+
+            for (_, future), embedding in zip(pending, embeddings):
+                future.set_result(embedding)
+
+    def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embeds texts in sub-batches of max_batch_size, sending them concurrently."""
+        batches = self._split_batches(texts)
+        if len(batches) == 1:
+            return self._embed_request(batches[0])
+
+        # Sub-batches go out concurrently on worker threads. The sync client
+        # is used because asyncio.run would give each call a new event loop,
+        # and genai's cached async client stays bound to the first one.
+        embeddings: List[List[float]] = []
+        with ThreadPoolExecutor(max_workers=min(self._max_concurrency, len(batches))) as executor:
+            for batch_embeddings in executor.map(self._embed_request, batches):
+                embeddings.extend(batch_embeddings)
         return embeddings
 
+    def _split_batches(self, texts: List[str]) -> List[List[str]]:
+        """Splits texts into sub-batches of at most max_batch_size."""
+        return [
+            texts[i:i + self._max_batch_size]
+            for i in range(0, len(texts), self._max_batch_size)
+        ]
+
+    async def _embed_request_async(self, texts: List[str]) -> List[List[float]]:
+        """Async counterpart of _embed_request using embed_content_async."""
+        for attempt in range(self._max_retries + 1):
+            try:
+                result = await genai.embed_content_async(
+                    model=self._model_name,
+                    content=texts,
+                    task_type="retrieval_document"
+                )
+                return result['embedding']
+            except self.RETRYABLE_ERRORS:
+                if attempt == self._max_retries:
+                    raise
+                await asyncio.sleep(min(2 ** attempt * 0.5, 30.0))
+
+    def _embed_request(self, texts: List[str]) -> List[List[float]]:
+        """Embeds a list of texts with a single API call, retrying with exponential backoff."""
+        for attempt in range(self._max_retries + 1):
+            try:
+                # genai.embed_content supports "content" as a list of strings
+                result = genai.embed_content(
+                    model=self._model_name,
+                    content=texts,
+                    task_type="retrieval_document"
+                )
+                # Result "embedding" key will be a list of lists if input was list
+                return result['embedding']
+            except self.RETRYABLE_ERRORS:
+                if attempt == self._max_retries:
+                    raise
+                time.sleep(min(2 ** attempt * 0.5, 30.0))
+
     @property
     def dimension(self) -> int:
         """Returns the dimension of the embedding vector."""
         if self._dimension is None:
-            # Compute dimension by embedding a dummy text
-            dummy = self.embed_text("dummy")
-            self._dimension = len(dummy)
+            # Unknown model: probe once by embedding a dummy text
+            self._dimension = len(self._embed_batch(["dummy"])[0])
         return self._dimension
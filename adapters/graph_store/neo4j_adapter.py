@@ -2,9 +2,10 @@ from typing import List, Dict, Any, Optional
 import uuid
 
 try:
-    from neo4j import GraphDatabase
+    from neo4j import GraphDatabase, RoutingControl
 except ImportError:
     GraphDatabase = None
+    RoutingControl = None
 
 from polyrag.core.ports.graph_store_port import GraphStorePort
 
@@ -132,50 +133,106 @@ class Neo4jAdapter(GraphStorePort):
             result = session.run(cypher_query, **parameters)
             return [dict(record) for record in result]
 
+    def execute_read(self, cypher_query: str, parameters: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """
+        Executes a read-only Cypher query in a driver-managed transaction.
+
+        The driver reuses pooled bolt connections and retries transient
+        failures, without opening an explicit session per call.
+
+        Args:
+            cypher_query: The Cypher query string.
+            parameters: Query parameters.
+
+        Returns:
+            List of result records as dictionaries.
+        """
+        self._ensure_connected()
+        records, _, _ = self._driver.execute_query(
+            cypher_query,
+            parameters or {},
+            database_=self._database,
+            routing_=RoutingControl.READ
+        )
+        return [dict(record) for record in records]
+
     def get_subgraph(self, node_id: str, depth: int = 1) -> Dict[str, Any]:
         """
-        Retrieves a subgraph around a specific node.
+        Retrieves a subgraph around a specific node in a single query.
 
         Args:
             node_id: The central node ID.
             depth: How many hops to traverse.
 
         Returns:
-            Dictionary with 'nodes' and 'relationships' lists.
+            Dictionary with 'nodes', 'edges' and 'content_map' (node ID to
+            content); all empty if the node does not exist.
+        """
+        subgraph = self.get_subgraphs([node_id], depth=depth).get(node_id)
+        if subgraph is None:
+            return {"nodes": [], "edges": [], "content_map": {}}
+        return subgraph
+
+    def get_subgraphs(self, node_ids: List[str], depth: int = 1) -> Dict[str, Any]:
+        """
+        Retrieves subgraphs around several nodes in a single query.
+
+        Nodes come back as projected maps together with their content, so
+        callers need no follow-up query to read related nodes.
+
+        Args:
+            node_ids: The central node IDs.
+            depth: How many hops to traverse.
+
+        Returns:
+            Dictionary mapping each found node ID to its subgraph
+            ('nodes', 'edges' and 'content_map').
         """
         self._ensure_connected()
-        
+        if not node_ids:
+            return {}
+
+        # Variable-length bounds cannot be parameters, so depth is inlined
+        expand = ""
+        if depth >= 1:
+            expand = f"""
+        OPTIONAL MATCH (n)-[rels*1..{int(depth)}]-(m)
+        UNWIND (CASE WHEN rels IS NULL THEN [null] ELSE rels END) AS r"""
+        else:
+            expand = """
+        WITH node_id, n, null AS m, null AS r"""
+
         query = f"""
-        MATCH path = (n {{id: $node_id}})-[*0..{depth}]-(m)
-        RETURN collect(distinct n) + collect(distinct m) as nodes,
-               [r in relationships(path) | {{
+        UNWIND $node_ids AS node_id
+        MATCH (n {{id: node_id}}){expand}
+        WITH node_id, n, collect(DISTINCT m) AS others, collect(DISTINCT r) AS rels
+        RETURN node_id,
+               [x IN [n] + [o IN others WHERE o <> n] | {{
+                   id: x.id,
+                   labels: labels(x),
+                   properties: properties(x)
+               }}] AS nodes,
+               [r IN rels | {{
                    type: type(r),
                    start: startNode(r).id,
                    end: endNode(r).id,
                    properties: properties(r)
-               }}] as relationships
+               }}] AS edges
         """
-        
-        with self._driver.session(database=self._database) as session:
-            result = session.run(query, node_id=node_id)
-            record = result.single()
-            
-            if record is None:
-                return {"nodes": [], "relationships": []}
-            
-            # Process nodes
-            nodes = []
-            for node in record["nodes"]:
-                nodes.append({
-                    "id": node.get("id"),
-                    "labels": list(node.labels) if hasattr(node, 'labels') else [],
-                    "properties": dict(node)
-                })
-            
-            return {
+
+        subgraphs = {}
+        for record in self.execute_read(query, {"node_ids": list(node_ids)}):
+            nodes = record["nodes"]
+            subgraphs[record["node_id"]] = {
                 "nodes": nodes,
-                "relationships": record["relationships"]
+                "edges": record["edges"],
+                "content_map": {
+                    node["id"]: node["properties"]["content"]
+                    for node in nodes
+                    if node["properties"].get("content") is not None
+                }
             }
+        return subgraphs
 
     def close(self):
         """Close the driver connection."""
@@ -1,11 +1,16 @@
+import datetime
 import os
-from typing import Iterator, Optional, List
+from collections import OrderedDict
+from typing import Iterator, Optional, List, Union
 import google.generativeai as genai
 from polyrag.core.ports.llm_port import LLMPort
 
 class GeminiAdapter(LLMPort):
     """Adapter for Google Gemini models via google-generativeai library."""
 
+    # Maximum number of per-system-prompt model instances kept around
+    MODEL_CACHE_SIZE = 32
+
     def __init__(self, model_name: str = "gemini-2.5-pro", api_key: Optional[str] = None):
         """
         Initialize the Gemini adapter.
@@ -26,6 +31,82 @@ class GeminiAdapter(LLMPort):
             pass
 
         self._model = genai.GenerativeModel(model_name)
+        self._model_cache: "OrderedDict[tuple, genai.GenerativeModel]" = OrderedDict()
+
+    def _get_model(
+        self,
+        system_prompt: Optional[str] = None,
+        cached_content: Optional[str] = None
+    ) -> "genai.GenerativeModel":
+        """
+        Returns a model configured with the given system instruction or context cache.
+
+        Models are built once per distinct system prompt / cache and reused (LRU).
+        A context cache already carries its system instruction, so the system
+        prompt is ignored when one is given.
+        """
+        if not system_prompt and not cached_content:
+            return self._model
+
+        key = ("cached", cached_content) if cached_content else ("system", system_prompt)
+        model = self._model_cache.get(key)
+        if model is not None:
+            self._model_cache.move_to_end(key)
+            return model
+
+        if cached_content:
+            model = genai.GenerativeModel.from_cached_content(
+                cached_content=genai.caching.CachedContent.get(cached_content)
+            )
+        else:
+            model = genai.GenerativeModel(self._model_name, system_instruction=system_prompt)
+        self._model_cache[key] = model
+        if len(self._model_cache) > self.MODEL_CACHE_SIZE:
+            self._model_cache.popitem(last=False)
+        return model
+
+    def create_context_cache(
+        self,
+        system_prompt: Optional[str] = None,
+        documents: Optional[List[str]] = None,
+        ttl: Union[str, int, datetime.timedelta] = "1h"
+    ) -> str:
+        """
+        Uploads a reusable prompt prefix as a server-side context cache.
+
+        Pass the returned name as ``cached_content`` to generate() or
+        generate_stream() so the prefix is not re-sent and re-prefilled.
+
+        Args:
+            system_prompt: System instruction to store in the cache.
+            documents: Context documents (e.g. retrieved chunks) to store.
+            ttl: Cache lifetime as a timedelta, seconds, or a string such as
+                 "30m" or "1h".
+
+        Returns:
+            The cache name.
+        """
+        cache = genai.caching.CachedContent.create(
+            model=self._model_name,
+            system_instruction=system_prompt,
+            contents=documents,
+            ttl=self._parse_ttl(ttl)
+        )
+        return cache.name
+
+    @staticmethod
+    def _parse_ttl(ttl: Union[str, int, datetime.timedelta]) -> datetime.timedelta:
+        """Converts a TTL given as seconds or "<n>s|m|h|d" into a timedelta."""
+        if isinstance(ttl, datetime.timedelta):
+            return ttl
+        if isinstance(ttl, (int, float)):
+            return datetime.timedelta(seconds=ttl)
+
+        units = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days"}
+        unit = ttl[-1].lower()
+        if unit not in units:
+            return datetime.timedelta(seconds=float(ttl))
+        return datetime.timedelta(**{units[unit]: float(ttl[:-1])})
 
     @staticmethod
     def list_models(api_key: Optional[str] = None) -> List[str]:
@@ -58,23 +139,38 @@ class GeminiAdapter(LLMPort):
                            Note: Gemini supports system instructions at model init or via specific API usage.
                            To keep it simple per request, we might prepend it or use the proper config if we re-init.
             **kwargs: Additional parameters (e.g., generation_config).
+                      Pass cached_content with a name from create_context_cache()
+                      to reuse a server-side cached prefix.
 
         Returns:
             The generated text response.
         """
-        # Gemini handles system prompts best via system_instruction in model init, 
-        # but since we reuse the model, we can try prepending or checking if we can update it.
-        # For simplicity and compatibility, prepending is often safest if strict system instruction object isn't needed.
-        # However, new SDK allows `system_instruction` in GenerativeModel. 
-        # Making a new instance for each call is cheap reference-wise if we want to enforce system prompt.
-        
-        model_to_use = self._model
-        if system_prompt:
-             model_to_use = genai.GenerativeModel(self._model_name, system_instruction=system_prompt)
+        self._check_precision(kwargs.pop("precision", None))
+        # Gemini handles system prompts via system_instruction at model init, so
+        # one model per distinct system prompt is built and reused across calls.
+        model_to_use = self._get_model(system_prompt, kwargs.pop("cached_content", None))
 
         response = model_to_use.generate_content(prompt, **kwargs)
         return response.text
 
+    async def agenerate(self, prompt: str, system_prompt: Optional[str] = None, **kwargs) -> str:
+        """
+        Asynchronously generates a text response using the SDK's async client.
+
+        Args:
+            prompt: The user prompt.
+            system_prompt: Optional system prompt.
+            **kwargs: Additional parameters (e.g., generation_config).
+
+        Returns:
+            The generated text response.
+        """
+        self._check_precision(kwargs.pop("precision", None))
+        model_to_use = self._get_model(system_prompt, kwargs.pop("cached_content", None))
+
+        response = await model_to_use.generate_content_async(prompt, **kwargs)
+        return response.text
+
     def generate_stream(self, prompt: str, system_prompt: Optional[str] = None, **kwargs) -> Iterator[str]:
         """
         Generates a streaming text response.
@@ -82,19 +178,25 @@ class GeminiAdapter(LLMPort):
         Args:
             prompt: The user prompt.
             system_prompt: Optional system prompt.
-            **kwargs: Additional parameters.
+            **kwargs: Additional parameters (cached_content as in generate()).
 
         Yields:
             Chunks of the generated text response.
         """
-        model_to_use = self._model
-        if system_prompt:
-             model_to_use = genai.GenerativeModel(self._model_name, system_instruction=system_prompt)
+        self._check_precision(kwargs.pop("precision", None))
+        model_to_use = self._get_model(system_prompt, kwargs.pop("cached_content", None))
 
         response = model_to_use.generate_content(prompt, stream=True, **kwargs)
+        # Read part texts directly; chunk.text re-walks every part of the chunk
+        # on each access
         for chunk in response:
-            if chunk.text:
-                yield chunk.text
+            candidates = chunk.candidates
+            if not candidates:
+                continue
+            for part in candidates[0].content.parts:
+                text = part.text
+                if text:
+                    yield text
 
     @property
     def model_name(self) -> str:
@@ -106,3 +208,12 @@ class GeminiAdapter(LLMPort):
         """Returns True if the model supports image inputs."""
         # Most Gemini Pro models support vision
         return "pro" in self._model_name.lower() or "flash" in self._model_name.lower()
+
+    @property
+    def supported_precisions(self) -> List[str]:
+        """
+        Gemini serves each model at a fixed precision, so none can be requested.
+
+        Passing `precision` to generate() therefore raises ValueError.
+        """
+        return []
@@ -1,9 +1,84 @@
+import asyncio
 import requests
 import json
-from typing import Iterator, Optional
+import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Iterator, List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 from polyrag.core.ports.llm_port import LLMPort
 
+# orjson parses bytes directly; fall back to the stdlib parser when it is missing
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Start of the token field in Ollama's compact NDJSON frames
+_RESPONSE_FIELD = b'"response":"'
+
+# Retry policy shared by the httpx transports and the requests session.
+# Every call is a POST; generation has no side effects, so retrying is safe.
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF = 0.2
+
+
+def _retry_delay(attempt: int) -> float:
+    """Seconds to wait before retry number attempt + 1 (urllib3's backoff schedule)."""
+    return _RETRY_BACKOFF * (2 ** attempt)
+
+
+if httpx is not None:
+    class _StatusRetryTransport(httpx.BaseTransport):
+        """Retries requests answered with a transient 5xx status."""
+
+        def __init__(self, transport: "httpx.BaseTransport"):
+            self._transport = transport
+
+        def handle_request(self, request: "httpx.Request") -> "httpx.Response":
+            for attempt in range(_RETRY_TOTAL):
+                response = self._transport.handle_request(request)
+                if response.status_code not in _RETRY_STATUSES:
+                    return response
+                response.close()
+                time.sleep(_retry_delay(attempt))
+            return self._transport.handle_request(request)
+
+        def close(self):
+            self._transport.close()
+
+    class _AsyncStatusRetryTransport(httpx.AsyncBaseTransport):
+        """Async counterpart of _StatusRetryTransport."""
+
+        def __init__(self, transport: "httpx.AsyncBaseTransport"):
+            self._transport = transport
+
+        async def handle_async_request(self, request: "httpx.Request") -> "httpx.Response":
+            for attempt in range(_RETRY_TOTAL):
+                response = await self._transport.handle_async_request(request)
+                if response.status_code not in _RETRY_STATUSES:
+                    return response
+                await response.aclose()
+                await asyncio.sleep(_retry_delay(attempt))
+            return await self._transport.handle_async_request(request)
+
+        async def aclose(self):
+            await self._transport.aclose()
+
 
 class OllamaAdapter(LLMPort):
     """Adapter for Ollama local LLM API."""
@@ -11,6 +86,9 @@ class OllamaAdapter(LLMPort):
     # Models known to support vision
     VISION_MODELS = ["llava", "llava-llama3", "bakllava", "moondream"]
 
+    # Ollama quantization levels with a conventional precision name
+    _PRECISION_NAMES = {"F32": "fp32", "F16": "fp16", "BF16": "bf16"}
+
     def __init__(self, model: str = "llama3.2", base_url: str = "http://localhost:11434"):
         """
         Initialize the Ollama adapter.
@@ -22,6 +100,74 @@ class OllamaAdapter(LLMPort):
         self._model = model
         self._base_url = base_url.rstrip("/")
 
+        # Prefer httpx (HTTP/2 when h2 is installed) for lower per-chunk streaming
+        # overhead; fall back to a pooled requests session without it
+        self._http = None
+        self._session = None
+        if httpx is not None:
+            self._http = httpx.Client(
+                timeout=httpx.Timeout(120.0, connect=5.0),
+                headers={"Accept-Encoding": "identity"},
+                # retries=3 covers connection errors; the wrapper adds the
+                # same 5xx retries as the requests session
+                transport=_StatusRetryTransport(httpx.HTTPTransport(
+                    http2=HTTP2_AVAILABLE,
+                    retries=_RETRY_TOTAL,
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+                ))
+            )
+        else:
+            self._session = self._create_session()
+
+        # httpx.AsyncClient is bound to the event loop it was first used on, so
+        # each loop gets its own (client, closer) pair; see _get_async_client
+        self._async_clients: Dict[asyncio.AbstractEventLoop, tuple] = {}
+
+        # Resolved from /api/show by resolve_precision(), or the first time a
+        # call passes precision ("" once resolved for a tag that reports none)
+        self._precision: Optional[str] = None
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Creates a pooled keep-alive requests session."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=50,
+            # urllib3 does not retry POSTs unless allowed explicitly
+            max_retries=Retry(
+                total=_RETRY_TOTAL,
+                backoff_factor=_RETRY_BACKOFF,
+                status_forcelist=sorted(_RETRY_STATUSES),
+                allowed_methods=frozenset({"POST"})
+            )
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        # Uncompressed responses let streamed tokens be parsed as soon as they arrive
+        session.headers.update({"Connection": "keep-alive", "Accept-Encoding": "identity"})
+        return session
+
+    def __enter__(self) -> "OllamaAdapter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Closes the HTTP client and its pooled connections."""
+        if self._http is not None:
+            self._http.close()
+        if self._session is not None:
+            self._session.close()
+
+    async def aclose(self):
+        """Closes the running event loop's async HTTP client, if one was created."""
+        entry = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if entry is not None:
+            _, closer = entry
+            await closer.aclose()
+
     def generate(self, prompt: str, system_prompt: Optional[str] = None, **kwargs) -> str:
         """
         Generates a text response for the given prompt.
@@ -34,10 +180,25 @@ class OllamaAdapter(LLMPort):
         Returns:
             The generated text response.
         """
+        if kwargs.get("precision") is not None:
+            self.resolve_precision()
+            self._check_precision(kwargs["precision"])
+        payload = self._build_payload(prompt, system_prompt, False, **kwargs)
+        url = f"{self._base_url}/api/generate"
+
+        if self._http is not None:
+            response = self._http.post(url, json=payload)
+        else:
+            response = self._session.post(url, json=payload, timeout=120)
+        response.raise_for_status()
+        return _json_loads(response.content).get("response", "")
+
+    def _build_payload(self, prompt: str, system_prompt: Optional[str], stream: bool, **kwargs) -> dict:
+        """Builds the /api/generate request body."""
         payload = {
             "model": self._model,
             "prompt": prompt,
-            "stream": False,
+            "stream": stream,
         }
 
         if system_prompt:
@@ -47,13 +208,75 @@ class OllamaAdapter(LLMPort):
         if "images" in kwargs:
             payload["images"] = kwargs["images"]
 
-        response = requests.post(
+        return payload
+
+    async def agenerate(self, prompt: str, system_prompt: Optional[str] = None, **kwargs) -> str:
+        """
+        Asynchronously generates a text response for the given prompt.
+
+        Uses a keep-alive httpx.AsyncClient when httpx is installed and
+        otherwise runs generate() in a worker thread.
+
+        Args:
+            prompt: The user prompt.
+            system_prompt: Optional system prompt.
+            **kwargs: Additional parameters (e.g., images for vision models).
+
+        Returns:
+            The generated text response.
+        """
+        if httpx is None:
+            return await super().agenerate(prompt, system_prompt, **kwargs)
+
+        if kwargs.get("precision") is not None:
+            await self.aresolve_precision()
+            self._check_precision(kwargs["precision"])
+        payload = self._build_payload(prompt, system_prompt, False, **kwargs)
+        client = await self._get_async_client()
+        response = await client.post(
             f"{self._base_url}/api/generate",
-            json=payload,
-            timeout=120
+            json=payload
         )
         response.raise_for_status()
-        return response.json().get("response", "")
+        return _json_loads(response.content).get("response", "")
+
+    async def _get_async_client(self) -> "httpx.AsyncClient":
+        """
+        Returns the async client for the running event loop, creating it if needed.
+
+        A new client is paired with a parked async generator that closes it.
+        The loop tracks that generator, so its shutdown (asyncio.run calls
+        shutdown_asyncgens) closes the client with it instead of leaking the
+        pool of every loop the adapter was used from.
+        """
+        loop = asyncio.get_running_loop()
+        entry = self._async_clients.get(loop)
+        if entry is None:
+            # Entries of closed loops only hold already-closed clients
+            for old_loop in [l for l in self._async_clients if l.is_closed()]:
+                del self._async_clients[old_loop]
+            client = httpx.AsyncClient(
+                timeout=httpx.Timeout(120.0, connect=5.0),
+                headers={"Accept-Encoding": "identity"},
+                transport=_AsyncStatusRetryTransport(httpx.AsyncHTTPTransport(
+                    http2=HTTP2_AVAILABLE,
+                    retries=_RETRY_TOTAL,
+                    limits=httpx.Limits(max_connections=50, max_keepalive_connections=50)
+                ))
+            )
+            closer = self._close_on_shutdown(client)
+            # The first step registers the generator with the loop's hooks
+            await closer.__anext__()
+            entry = self._async_clients[loop] = (client, closer)
+        return entry[0]
+
+    @staticmethod
+    async def _close_on_shutdown(client: "httpx.AsyncClient"):
+        """Parks until finalized by the loop (or aclose()), then closes the client."""
+        try:
+            yield
+        finally:
+            await client.aclose()
 
     def generate_stream(self, prompt: str, system_prompt: Optional[str] = None, **kwargs) -> Iterator[str]:
         """
@@ -67,30 +290,73 @@ class OllamaAdapter(LLMPort):
         Yields:
             Chunks of the generated text response.
         """
-        payload = {
-            "model": self._model,
-            "prompt": prompt,
-            "stream": True,
-        }
+        for frame in self._stream_frames(prompt, system_prompt, **kwargs):
+            data = _json_loads(frame)
+            if "response" in data:
+                yield data["response"]
 
-        if system_prompt:
-            payload["system"] = system_prompt
+    def generate_stream_bytes(self, prompt: str, system_prompt: Optional[str] = None, **kwargs) -> Iterator[bytes]:
+        """
+        Generates a streaming response as UTF-8 encoded chunks.
 
-        if "images" in kwargs:
-            payload["images"] = kwargs["images"]
+        The token is sliced straight out of each raw frame when it contains
+        no JSON escapes (the common case), so no str is ever built; frames
+        with escapes are parsed and re-encoded once.
 
-        with requests.post(
-            f"{self._base_url}/api/generate",
-            json=payload,
-            stream=True,
-            timeout=120
-        ) as response:
+        Args:
+            prompt: The user prompt.
+            system_prompt: Optional system prompt.
+            **kwargs: Additional parameters.
+
+        Yields:
+            UTF-8 chunks of the generated text response.
+        """
+        for frame in self._stream_frames(prompt, system_prompt, **kwargs):
+            start = frame.find(_RESPONSE_FIELD)
+            if start != -1:
+                start += len(_RESPONSE_FIELD)
+                # Without a backslash the next quote must close the string
+                end = frame.find(b'"', start)
+                if end != -1 and frame.find(b"\\", start, end) == -1:
+                    yield frame[start:end]
+                    continue
+            data = _json_loads(frame)
+            if "response" in data:
+                yield data["response"].encode("utf-8")
+
+    def _stream_frames(self, prompt: str, system_prompt: Optional[str], **kwargs) -> Iterator[bytes]:
+        """
+        Yields the raw NDJSON frames of a streaming /api/generate call.
+
+        Frames stay bytes end to end, so orjson parses them without a
+        UTF-8 decode of the whole line first.
+        """
+        if kwargs.get("precision") is not None:
+            self.resolve_precision()
+            self._check_precision(kwargs["precision"])
+        payload = self._build_payload(prompt, system_prompt, True, **kwargs)
+        url = f"{self._base_url}/api/generate"
+
+        if self._http is not None:
+            with self._http.stream("POST", url, json=payload) as response:
+                response.raise_for_status()
+                # httpx.iter_lines() decodes to str, so split the byte stream directly
+                buffer = b""
+                for block in response.iter_bytes():
+                    buffer += block
+                    *lines, buffer = buffer.split(b"\n")
+                    for line in lines:
+                        if line:
+                            yield line
+                if buffer.strip():
+                    yield buffer
+            return
+
+        with self._session.post(url, json=payload, stream=True, timeout=120) as response:
             response.raise_for_status()
-            for line in response.iter_lines():
+            for line in response.iter_lines(chunk_size=None, decode_unicode=False, delimiter=b"\n"):
                 if line:
-                    data = json.loads(line)
-                    if "response" in data:
-                        yield data["response"]
+                    yield line
 
     @property
     def model_name(self) -> str:
@@ -101,3 +367,63 @@ class OllamaAdapter(LLMPort):
     def supports_vision(self) -> bool:
         """Returns True if the model supports image inputs."""
         return any(vm in self._model.lower() for vm in self.VISION_MODELS)
+
+    @property
+    def supported_precisions(self) -> List[str]:
+        """
+        Returns the precision of the model's weights (e.g. ["bf16"] or ["q4_k_m"]).
+
+        Ollama fixes the precision per model tag and has no per-request
+        option for it, so `precision` only confirms that the configured tag
+        matches; pull a tag with the desired precision to change it.
+
+        The value comes from the server, so it is only known after
+        resolve_precision() / aresolve_precision() or a call that passed
+        `precision`.
+
+        Raises:
+            RuntimeError: If the precision has not been resolved yet.
+        """
+        if self._precision is None:
+            raise RuntimeError(
+                "Precision of the Ollama model is not known yet; call resolve_precision() first"
+            )
+        return [self._precision] if self._precision else []
+
+    def resolve_precision(self) -> List[str]:
+        """
+        Looks up the model's precision via /api/show (once) and returns
+        supported_precisions.
+        """
+        if self._precision is not None:
+            return self.supported_precisions
+        url = f"{self._base_url}/api/show"
+        payload = {"model": self._model}
+        if self._http is not None:
+            response = self._http.post(url, json=payload)
+        else:
+            response = self._session.post(url, json=payload, timeout=120)
+        response.raise_for_status()
+        self._precision = self._parse_precision(response.content)
+        return self.supported_precisions
+
+    async def aresolve_precision(self) -> List[str]:
+        """Async counterpart of resolve_precision() using the async client."""
+        if self._precision is not None:
+            return self.supported_precisions
+        if httpx is None:
+            return await asyncio.to_thread(self.resolve_precision)
+        client = await self._get_async_client()
+        response = await client.post(
+            f"{self._base_url}/api/show",
+            json={"model": self._model}
+        )
+        response.raise_for_status()
+        self._precision = self._parse_precision(response.content)
+        return self.supported_precisions
+
+    @classmethod
+    def _parse_precision(cls, content: bytes) -> str:
+        """Maps the quantization level of an /api/show response to a precision name."""
+        level = _json_loads(content).get("details", {}).get("quantization_level", "")
+        return cls._PRECISION_NAMES.get(level.upper(), level.lower())
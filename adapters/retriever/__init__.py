@@ -4,3 +4,5 @@ from polyrag.adapters.retriever.graph_retriever import GraphRetriever
 from polyrag.adapters.retriever.hybrid_retriever import HybridRetriever
 from polyrag.adapters.retriever.colbert_retriever import ColBERTRetriever
 from polyrag.adapters.retriever.colpali_retriever import ColPaliRetriever
+from polyrag.adapters.retriever.query_cache import QueryCache
+from polyrag.adapters.retriever.simhash import SimHashIndex, simhash64, to_int64, from_int64
@@ -1,4 +1,9 @@
-from typing import List
+import base64
+import heapq
+import threading
+from collections import OrderedDict
+from itertools import islice
+from typing import List, Optional, Tuple
 import numpy as np
 
 from polyrag.core.ports.retriever_port import RetrieverPort
@@ -15,11 +20,17 @@ class ColBERTRetriever(RetrieverPort):
     for more precise retrieval than single-vector approaches.
     """
 
+    # Chunk metadata key holding precomputed document token embeddings (base64 fp16)
+    TOKENS_METADATA_KEY = "colbert_tokens"
+
     def __init__(
         self,
         colbert_adapter: ColBERTAdapter,
         vector_store: VectorStorePort,
-        collection_name: str
+        collection_name: str,
+        quantize: Optional[str] = None,
+        token_cache_size: int = 10_000,
+        prefetch_size: int = 16
     ):
         """
         Initialize the ColBERT retriever.
@@ -28,10 +39,30 @@ class ColBERTRetriever(RetrieverPort):
             colbert_adapter: ColBERT embedding adapter.
             vector_store: Vector store for initial retrieval.
             collection_name: Collection name for retrieval.
+            quantize: Set to "int8" to keep cached token embeddings as int8
+                      with per-token scales, cutting token-cache memory 4x.
+                      Storage-only: scoring widens them back to float32, so it
+                      adds a small quantization error and per-query casts
+                      rather than speeding up MaxSim.
+            token_cache_size: Number of chunks whose document token embeddings
+                              are kept in memory between queries (0 disables).
+            prefetch_size: Candidates reranked per step; the next step's
+                           candidates are fetched while the current one is scored.
+
+        Raises:
+            ValueError: If the quantization mode is unknown.
         """
+        if quantize not in (None, "int8"):
+            raise ValueError(f"Unsupported token quantization: {quantize}")
+
         self._colbert = colbert_adapter
         self._vector_store = vector_store
         self._collection_name = collection_name
+        self._quantize = quantize
+        self._token_cache_size = token_cache_size
+        self._token_cache: "OrderedDict[str, Tuple[np.ndarray, Optional[np.ndarray]]]" = OrderedDict()
+        self._token_cache_lock = threading.Lock()
+        self._prefetch_size = max(1, prefetch_size)
 
     def retrieve(self, query: str, limit: int = 5, **kwargs) -> List[RetrievalResult]:
         """
@@ -45,57 +76,171 @@ class ColBERTRetriever(RetrieverPort):
         Returns:
             List of RetrievalResult objects.
         """
-        # Get query token embeddings
-        query_tokens = self._colbert.embed_query_tokens(query)
+        # Query tokens and the pooled vector for initial retrieval, in one forward pass
+        query_tokens, query_vector = self._colbert.embed_query_tokens_and_pooled(query)
         
-        # Get pooled query embedding for initial retrieval
-        query_vector = self._colbert.embed_text(query)
-        
-        # Initial retrieval with more candidates
-        candidates = self._vector_store.search(
+        # Initial retrieval with more candidates, streamed in pages
+        candidates = iter(self._vector_store.search_iter(
             collection_name=self._collection_name,
             query_vector=query_vector,
-            limit=limit * 3  # Over-retrieve for re-ranking
-        )
-        
-        # Re-rank using MaxSim
+            limit=limit * 3,  # Over-retrieve for re-ranking
+            # MaxSim re-ranking hides binary-quantization recall loss
+            oversampling=3.0,
+            prefetch_size=self._prefetch_size
+        ))
+        prepared_query = self._prepare_tokens(query_tokens)
+
+        # Re-rank using MaxSim, one GEMM per page while the next page is fetched
         reranked = []
-        for result in candidates:
-            doc_content = result.chunk.content
-            doc_tokens = self._colbert.embed_doc_tokens(doc_content)
-            
-            # Compute MaxSim score
-            maxsim_score = self._compute_maxsim(query_tokens, doc_tokens)
-            
-            reranked.append(RetrievalResult(
-                chunk=result.chunk,
-                score=maxsim_score,
-                source="colbert",
-                metadata={
-                    **result.metadata,
-                    "original_score": result.score,
-                    "maxsim_score": maxsim_score
-                }
-            ))
+        while page := list(islice(candidates, self._prefetch_size)):
+            doc_tokens_list = self._get_doc_tokens(page)
+            scores = self._compute_maxsim_batch(prepared_query, doc_tokens_list)
+
+            for result, score in zip(page, scores.tolist()):
+                result.chunk.metadata.pop(self.TOKENS_METADATA_KEY, None)
+                metadata = {k: v for k, v in result.metadata.items() if k != self.TOKENS_METADATA_KEY}
+                reranked.append(RetrievalResult(
+                    chunk=result.chunk,
+                    score=score,
+                    source="colbert",
+                    metadata={
+                        **metadata,
+                        "original_score": result.score,
+                        "maxsim_score": score
+                    }
+                ))
         
-        # Sort by MaxSim score
-        reranked.sort(key=lambda r: r.score, reverse=True)
-        return reranked[:limit]
+        # Best MaxSim scores first (RetrievalResult orders by descending score)
+        return heapq.nsmallest(limit, reranked)
+
+    def prepare_chunks(self, chunks: List[Chunk]):
+        """Stores document token embeddings in each chunk's metadata (see attach_doc_tokens)."""
+        self.attach_doc_tokens(chunks)
+
+    def attach_doc_tokens(self, chunks: List[Chunk]):
+        """
+        Precomputes document token embeddings and stores them in chunk metadata.
+
+        PolyRAGPipeline calls it (through prepare_chunks) on every ingest
+        batch; call it yourself before inserting chunks directly into the
+        vector store. The tokens are persisted in the payload and never
+        re-encoded at query time.
+
+        Args:
+            chunks: Chunks to annotate in place.
+        """
+        token_list = self._colbert.embed_docs_tokens([c.content for c in chunks])
+        for chunk, tokens in zip(chunks, token_list):
+            chunk.metadata[self.TOKENS_METADATA_KEY] = self._serialize_tokens(tokens)
+
+    def _get_doc_tokens(self, candidates: List[RetrievalResult]) -> List[Tuple[np.ndarray, Optional[np.ndarray]]]:
+        """
+        Returns scoring-ready token embeddings for each candidate.
+
+        Looks in the in-memory cache, then in the stored payload, and only
+        encodes the remaining documents (in one batch), writing them back
+        to the cache.
+        """
+        doc_tokens: List[Optional[Tuple[np.ndarray, Optional[np.ndarray]]]] = [None] * len(candidates)
+        misses = []
+
+        with self._token_cache_lock:
+            for i, result in enumerate(candidates):
+                cached = self._token_cache.get(result.chunk.id)
+                if cached is not None:
+                    self._token_cache.move_to_end(result.chunk.id)
+                    doc_tokens[i] = cached
+                    continue
+                stored = result.chunk.metadata.get(self.TOKENS_METADATA_KEY)
+                if stored is not None:
+                    doc_tokens[i] = self._prepare_tokens(self._deserialize_tokens(stored))
+                    self._remember_tokens(result.chunk.id, doc_tokens[i])
+                else:
+                    misses.append(i)
 
-    def _compute_maxsim(self, query_tokens: np.ndarray, doc_tokens: np.ndarray) -> float:
+        if misses:
+            encoded = self._colbert.embed_docs_tokens([candidates[i].chunk.content for i in misses])
+            with self._token_cache_lock:
+                for i, tokens in zip(misses, encoded):
+                    doc_tokens[i] = self._prepare_tokens(tokens)
+                    self._remember_tokens(candidates[i].chunk.id, doc_tokens[i])
+
+        return doc_tokens
+
+    def _remember_tokens(self, chunk_id: str, tokens: Tuple[np.ndarray, Optional[np.ndarray]]):
+        """Adds prepared tokens to the LRU cache (caller holds the lock)."""
+        if self._token_cache_size <= 0 or not chunk_id:
+            return
+        self._token_cache[chunk_id] = tokens
+        self._token_cache.move_to_end(chunk_id)
+        if len(self._token_cache) > self._token_cache_size:
+            self._token_cache.popitem(last=False)
+
+    def _serialize_tokens(self, tokens: np.ndarray) -> str:
+        """Encodes a token matrix as a base64 fp16 string for payload storage."""
+        return base64.b64encode(tokens.astype(np.float16).tobytes()).decode("ascii")
+
+    def _deserialize_tokens(self, data: str) -> np.ndarray:
+        """Decodes a token matrix stored by _serialize_tokens."""
+        # Tokens were normalized before storage, so no re-normalization is needed
+        flat = np.frombuffer(base64.b64decode(data), dtype=np.float16)
+        return np.ascontiguousarray(flat.reshape(-1, self._colbert.dimension), dtype=np.float32)
+
+    def _prepare_tokens(self, tokens: np.ndarray) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """Returns token embeddings in scoring form: (int8 values, scales) or (float32 values, None)."""
+        if self._quantize == "int8":
+            return self._quantize_int8(tokens)
+        return tokens.astype(np.float32, copy=False), None
+
+    @staticmethod
+    def _quantize_int8(tokens: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Compute MaxSim score between query and document tokens.
+        Symmetric per-token int8 quantization.
 
         Args:
-            query_tokens: Query token embeddings (Q x D).
-            doc_tokens: Document token embeddings (T x D).
+            tokens: Token embeddings (T x D).
 
         Returns:
-            MaxSim score.
+            Tuple of int8 values (T x D) and float32 scales (T,).
         """
-        # Compute similarity matrix
-        sim_matrix = np.dot(query_tokens, doc_tokens.T)
-        
-        # MaxSim: max over doc tokens for each query token, then sum
-        max_sims = sim_matrix.max(axis=1)
-        return float(max_sims.sum())
+        tokens = tokens.astype(np.float32, copy=False)
+        scales = np.abs(tokens).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        values = np.rint(tokens / scales[:, None]).astype(np.int8)
+        return values, scales.astype(np.float32)
+
+    def _compute_maxsim_batch(
+        self,
+        query_tokens: Tuple[np.ndarray, Optional[np.ndarray]],
+        doc_tokens_list: List[Tuple[np.ndarray, Optional[np.ndarray]]]
+    ) -> np.ndarray:
+        """
+        Compute MaxSim scores between a query and many documents at once.
+
+        All document token matrices are concatenated so the similarity
+        matrix is produced by one GEMM; per-document maxima are then taken
+        with a segmented reduction.
+
+        Args:
+            query_tokens: Query tokens (Q x D) in the form returned by _prepare_tokens.
+            doc_tokens_list: Per-document tokens (T_i x D) in the same form.
+
+        Returns:
+            Array of MaxSim scores, one per document.
+        """
+        lengths = [values.shape[0] for values, _ in doc_tokens_list]
+        offsets = np.cumsum([0] + lengths[:-1])
+
+        query_values, query_scales = query_tokens
+        doc_values = np.concatenate([values for values, _ in doc_tokens_list], axis=0)
+
+        # Q x sum(T_i); int8-compressed tokens are widened to float32 for sgemm
+        sim_matrix = query_values.astype(np.float32, copy=False) @ doc_values.astype(np.float32, copy=False).T
+        if query_scales is not None:
+            doc_scales = np.concatenate([scales for _, scales in doc_tokens_list])
+            sim_matrix *= query_scales[:, None]
+            sim_matrix *= doc_scales[None, :]
+
+        # MaxSim: max over each document's tokens for every query token, then sum
+        max_sims = np.maximum.reduceat(sim_matrix, offsets, axis=1)  # Q x N
+        return max_sims.sum(axis=0)
@@ -49,13 +49,8 @@ class ColPaliRetriever(RetrieverPort):
         Returns:
             List of RetrievalResult objects.
         """
-        # For text queries, we use the processor's text encoding
-        # ColPali can match text queries to document image patches
-        
-        # Get pooled query embedding (using image of rendered text or direct encoding)
-        # For simplicity, we create a simple text image
-        query_image = self._create_text_image(query)
-        query_vector = self._colpali.embed_image(query_image)
+        # Text queries go through ColPali's language tower; no vision pass needed
+        query_vector = self._colpali.embed_text(query)
         
         # Search vector store
         results = self._vector_store.search(
@@ -104,29 +99,3 @@ class ColPaliRetriever(RetrieverPort):
             )
             for r in results
         ]
-
-    def _create_text_image(self, text: str, size: tuple = (224, 224)) -> Image.Image:
-        """
-        Create a simple image with text for query encoding.
-
-        Args:
-            text: Text to render.
-            size: Image size.
-
-        Returns:
-            PIL Image with rendered text.
-        """
-        from PIL import ImageDraw, ImageFont
-        
-        img = Image.new("RGB", size, color="white")
-        draw = ImageDraw.Draw(img)
-        
-        try:
-            font = ImageFont.truetype("arial.ttf", 16)
-        except:
-            font = ImageFont.load_default()
-        
-        # Center text
-        draw.text((10, size[1] // 2 - 10), text[:50], fill="black", font=font)
-        
-        return img
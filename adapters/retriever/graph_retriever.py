@@ -1,4 +1,5 @@
-from typing import List
+import re
+from typing import List, Optional
 
 from polyrag.core.ports.retriever_port import RetrieverPort
 from polyrag.core.ports.graph_store_port import GraphStorePort
@@ -6,6 +7,10 @@ from polyrag.core.ports.embedding_port import TextEmbeddingPort
 from polyrag.core.models.models import RetrievalResult, Chunk, ChunkType
 
 
+# Characters with special meaning in Lucene query syntax
+_LUCENE_SPECIAL = re.compile(r'([+\-!(){}\[\]^"~*?:\\/&|])')
+
+
 class GraphRetriever(RetrieverPort):
     """
     Retriever that uses graph traversal to find relevant context.
@@ -19,7 +24,8 @@ class GraphRetriever(RetrieverPort):
         graph_store: GraphStorePort,
         embedding_adapter: TextEmbeddingPort = None,
         node_label: str = "Chunk",
-        depth: int = 1
+        depth: int = 1,
+        fulltext_index: Optional[str] = None
     ):
         """
         Initialize the GraphRetriever.
@@ -29,11 +35,41 @@ class GraphRetriever(RetrieverPort):
             embedding_adapter: Optional embedding adapter for semantic search.
             node_label: Label of nodes to search.
             depth: Depth of subgraph expansion.
+            fulltext_index: Name of a full-text index on the nodes' content
+                            (e.g. "chunk_content_fts", see ensure_fulltext_index()).
+                            When set, matching uses the index and its relevance
+                            scores instead of a CONTAINS scan over all nodes.
         """
         self._graph_store = graph_store
         self._embedding = embedding_adapter
         self._node_label = node_label
         self._depth = depth
+        self._fulltext_index = fulltext_index
+
+        # Only the label varies, so the query text is fixed per retriever and
+        # Neo4j can reuse its cached plan
+        if fulltext_index:
+            self._match_cypher = """
+            CALL db.index.fulltext.queryNodes($index, $query) YIELD node AS n, score
+            RETURN n, score
+            LIMIT $limit
+            """
+        else:
+            self._match_cypher = f"""
+            MATCH (n:{node_label})
+            WHERE toLower(n.content) CONTAINS toLower($query)
+            RETURN n
+            LIMIT $limit
+            """
+
+    def ensure_fulltext_index(self):
+        """Creates the configured full-text index on node content if it does not exist."""
+        if not self._fulltext_index:
+            raise ValueError("No fulltext_index configured")
+        self._graph_store.query(
+            f"CREATE FULLTEXT INDEX {self._fulltext_index} IF NOT EXISTS "
+            f"FOR (n:{self._node_label}) ON EACH [n.content]"
+        )
 
     def retrieve(self, query: str, limit: int = 5, **kwargs) -> List[RetrievalResult]:
         """
@@ -47,25 +83,16 @@ class GraphRetriever(RetrieverPort):
         Returns:
             List of RetrievalResult objects with graph context.
         """
-        # Search for matching nodes using text search
-        cypher = f"""
-        MATCH (n:{self._node_label})
-        WHERE toLower(n.content) CONTAINS toLower($query)
-        RETURN n
-        LIMIT $limit
-        """
-        
-        nodes = self._graph_store.query(cypher, {"query": query, "limit": limit})
+        nodes = self._find_nodes(query, limit)
+
+        # Expand all subgraphs in one round-trip
+        node_ids = [record.get("n", {}).get("id") for record in nodes]
+        subgraphs = self._graph_store.get_subgraphs([i for i in node_ids if i], depth=self._depth)
         
         results = []
-        for record in nodes:
+        for record, node_id in zip(nodes, node_ids):
             node = record.get("n", {})
-            node_id = node.get("id")
-            
-            # Expand subgraph for context
-            subgraph = None
-            if node_id:
-                subgraph = self._graph_store.get_subgraph(node_id, depth=self._depth)
+            subgraph = subgraphs.get(node_id) if node_id else None
             
             # Build context from subgraph
             context = self._build_context_from_subgraph(node, subgraph)
@@ -78,26 +105,39 @@ class GraphRetriever(RetrieverPort):
                 metadata={
                     "original_content": node.get("content", ""),
                     "subgraph_nodes": len(subgraph["nodes"]) if subgraph else 0,
-                    "subgraph_relations": len(subgraph["relationships"]) if subgraph else 0
+                    "subgraph_relations": len(subgraph["edges"]) if subgraph else 0
                 }
             )
             
             results.append(RetrievalResult(
                 chunk=chunk,
-                score=1.0,  # Graph traversal doesn't produce scores
+                # CONTAINS matching doesn't produce scores; the full-text index does
+                score=float(record.get("score", 1.0)),
                 source="graph",
                 metadata={"subgraph": subgraph}
             ))
         
         return results
 
+    def _find_nodes(self, query: str, limit: int) -> List[dict]:
+        """Returns records with the matching node ("n") and, if available, its "score"."""
+        if self._fulltext_index:
+            params = {
+                "index": self._fulltext_index,
+                "query": _LUCENE_SPECIAL.sub(r"\\\1", query),
+                "limit": limit
+            }
+        else:
+            params = {"query": query, "limit": limit}
+        return self._graph_store.execute_read(self._match_cypher, params)
+
     def _build_context_from_subgraph(self, center_node: dict, subgraph: dict) -> str:
         """
         Builds a text context from subgraph data.
 
         Args:
             center_node: The central node.
-            subgraph: Subgraph data with nodes and relationships.
+            subgraph: Subgraph data with nodes, edges and content_map.
 
         Returns:
             Formatted context string.
@@ -108,14 +148,13 @@ class GraphRetriever(RetrieverPort):
         parts = [f"Main: {center_node.get('content', '')}"]
         
         # Add related node contents
-        for node in subgraph.get("nodes", []):
-            if node.get("id") != center_node.get("id"):
-                content = node.get("properties", {}).get("content", "")
-                if content:
-                    parts.append(f"Related: {content[:200]}...")
+        center_id = center_node.get("id")
+        for node_id, content in subgraph.get("content_map", {}).items():
+            if node_id != center_id and content:
+                parts.append(f"Related: {content[:200]}...")
         
         # Add relationship info
-        for rel in subgraph.get("relationships", []):
+        for rel in subgraph.get("edges", []):
             parts.append(f"[{rel.get('type', 'RELATED')}]")
         
         return "\n".join(parts)
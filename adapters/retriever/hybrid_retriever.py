@@ -1,7 +1,27 @@
-from typing import List, Optional
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 
 from polyrag.core.ports.retriever_port import RetrieverPort
-from polyrag.core.models.models import RetrievalResult
+from polyrag.core.models.models import Chunk, RetrievalResult
+from polyrag.adapters.retriever.query_cache import QueryCache
+from polyrag.adapters.retriever.simhash import SimHashIndex, from_int64, simhash64
+
+
+@dataclass(slots=True)
+class _ScoreAccumulator:
+    """Mutable per-chunk score state used while merging sub-retriever results."""
+    chunk: Chunk
+    score: float
+    metadata: Dict[str, Any]
+    source_scores: Dict[str, float] = field(default_factory=dict)
+    # Weighted contribution per source, used when near-duplicates are merged
+    contributions: Dict[str, float] = field(default_factory=dict)
+
+    def __lt__(self, other: "_ScoreAccumulator") -> bool:
+        # Best-first ordering, matching RetrievalResult
+        return self.score > other.score
 
 
 class HybridRetriever(RetrieverPort):
@@ -15,7 +35,9 @@ class HybridRetriever(RetrieverPort):
     def __init__(
         self,
         retrievers: List[RetrieverPort],
-        weights: Optional[List[float]] = None
+        weights: Optional[List[float]] = None,
+        cache: Optional[QueryCache] = None,
+        dedup_distance: Optional[int] = None
     ):
         """
         Initialize the HybridRetriever.
@@ -24,8 +46,26 @@ class HybridRetriever(RetrieverPort):
             retrievers: List of retriever adapters to combine.
             weights: Optional weights for each retriever (should sum to 1.0).
                      If not provided, equal weights are used.
+            cache: Optional query cache for merged results; a hit skips the
+                   fan-out to sub-retrievers entirely.
+            dedup_distance: Maximum SimHash Hamming distance at which chunks
+                            with different IDs are merged as near-duplicates
+                            (None, the default, disables merging). Only text
+                            chunks are fingerprinted; others are merged by ID
+                            alone. A fingerprint stored in
+                            chunk.metadata["simhash"] (see FixedSizeChunker's
+                            simhash option) is used when present.
+
+        Raises:
+            ValueError: If dedup_distance is outside [0, 64) or weights don't
+                        match the retrievers.
         """
+        if dedup_distance is not None and not 0 <= dedup_distance < 64:
+            raise ValueError("dedup_distance must be between 0 and 63")
+
         self._retrievers = retrievers
+        self._cache = cache
+        self._dedup_distance = dedup_distance
         
         if weights is None:
             self._weights = [1.0 / len(retrievers)] * len(retrievers)
@@ -48,45 +88,107 @@ class HybridRetriever(RetrieverPort):
         Returns:
             Combined and re-ranked list of RetrievalResult objects.
         """
-        # Collect results from all retrievers
-        all_results: dict[str, RetrievalResult] = {}
+        key = None
+        if self._cache is not None:
+            key = QueryCache.make_key("hybrid", query, limit, self._dedup_distance, sorted(kwargs.items()))
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
+        # Accumulate scores in place; RetrievalResults are only built for the top-k
+        accumulators: Dict[str, _ScoreAccumulator] = {}
+        # Chunk ID -> ID of the near-duplicate it was merged into
+        aliases: Dict[str, str] = {}
+        index = SimHashIndex(self._dedup_distance) if self._dedup_distance is not None else None
         
-        for retriever, weight in zip(self._retrievers, self._weights):
-            results = retriever.retrieve(query, limit=limit * 2, **kwargs)
-            
+        for results, weight in zip(self._retrieve_all(query, limit * 2, **kwargs), self._weights):
             for result in results:
-                chunk_id = result.chunk.id
                 weighted_score = result.score * weight
+                score_key = f"{result.source}_score"
+                chunk_id = aliases.get(result.chunk.id, result.chunk.id)
+                acc = accumulators.get(chunk_id)
                 
-                if chunk_id in all_results:
-                    # Combine scores
-                    existing = all_results[chunk_id]
-                    combined_score = existing.score + weighted_score
-                    all_results[chunk_id] = RetrievalResult(
-                        chunk=existing.chunk,
-                        score=combined_score,
-                        source="hybrid",
-                        metadata={
-                            **existing.metadata,
-                            f"{result.source}_score": result.score
-                        }
-                    )
-                else:
-                    all_results[chunk_id] = RetrievalResult(
+                if acc is None and index is not None:
+                    fingerprint = self._fingerprint(result.chunk)
+                    duplicate_of = index.find(fingerprint) if fingerprint is not None else None
+                    if duplicate_of is not None:
+                        aliases[chunk_id] = duplicate_of
+                        acc = accumulators[duplicate_of]
+                        # A near-duplicate from a source that already scored this
+                        # chunk replaces that score if higher instead of adding to it
+                        previous = acc.contributions.get(score_key)
+                        if previous is not None:
+                            if weighted_score > previous:
+                                acc.score += weighted_score - previous
+                                acc.contributions[score_key] = weighted_score
+                                acc.source_scores[score_key] = result.score
+                            continue
+                    elif fingerprint is not None:
+                        index.add(fingerprint, chunk_id)
+                
+                if acc is None:
+                    acc = _ScoreAccumulator(
                         chunk=result.chunk,
                         score=weighted_score,
-                        source="hybrid",
-                        metadata={
-                            **result.metadata,
-                            f"{result.source}_score": result.score
-                        }
+                        metadata=result.metadata
                     )
+                    accumulators[chunk_id] = acc
+                else:
+                    acc.score += weighted_score
+                acc.source_scores[score_key] = result.score
+                acc.contributions[score_key] = acc.contributions.get(score_key, 0.0) + weighted_score
         
-        # Sort by combined score and limit
-        sorted_results = sorted(
-            all_results.values(),
-            key=lambda r: r.score,
-            reverse=True
-        )
-        
-        return sorted_results[:limit]
+        # Top-k by combined score: O(N log k) instead of sorting everything
+        top = heapq.nsmallest(limit, accumulators.values())
+        results = [
+            RetrievalResult(
+                chunk=acc.chunk,
+                score=acc.score,
+                source="hybrid",
+                metadata={**acc.metadata, **acc.source_scores}
+            )
+            for acc in top
+        ]
+        if self._cache is not None:
+            self._cache.put(key, results)
+        return results
+
+    def prepare_chunks(self, chunks: List[Chunk]):
+        """Lets every sub-retriever annotate chunks before insertion."""
+        for retriever in self._retrievers:
+            retriever.prepare_chunks(chunks)
+
+    def _retrieve_all(self, query: str, limit: int, **kwargs) -> List[List[RetrievalResult]]:
+        """
+        Queries all sub-retrievers concurrently.
+
+        The vector store, graph and HTTP calls behind each retriever release
+        the GIL, so threads turn the total latency into that of the slowest
+        retriever. Results are returned in retriever order to keep score
+        merging deterministic.
+        """
+        if len(self._retrievers) == 1:
+            return [self._retrievers[0].retrieve(query, limit=limit, **kwargs)]
+
+        with ThreadPoolExecutor(max_workers=len(self._retrievers)) as executor:
+            futures = [
+                executor.submit(retriever.retrieve, query, limit=limit, **kwargs)
+                for retriever in self._retrievers
+            ]
+            return [future.result() for future in futures]
+
+    @staticmethod
+    def _fingerprint(chunk: Chunk) -> Optional[int]:
+        """
+        Returns the chunk's SimHash, or None if it should only match by ID.
+
+        Non-text content (images, multimodal payloads) and blank text have
+        no meaningful fingerprint.
+        """
+        stored = chunk.metadata.get("simhash")
+        if stored is not None:
+            return from_int64(stored)
+        content = chunk.content
+        if not isinstance(content, str) or not content.strip():
+            return None
+        return simhash64(content)
@@ -0,0 +1,184 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from polyrag.core.models.models import RetrievalResult
+
+
+class QueryCache:
+    """
+    Retrieval result cache with an exact-match and an optional semantic layer.
+
+    Exact hits are keyed by a hash of the query and its search parameters.
+    When a similarity threshold is set, a miss can still be served from a
+    previously cached query whose embedding has cosine similarity above the
+    threshold and that was run with the same parameters (the "namespace").
+    Entries are evicted LRU-first and optionally expire after a TTL.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl_seconds: Optional[float] = None,
+        similarity_threshold: Optional[float] = None
+    ):
+        """
+        Initialize the query cache.
+
+        Args:
+            max_size: Maximum number of cached queries.
+            ttl_seconds: Optional lifetime of an entry in seconds.
+            similarity_threshold: Cosine similarity above which a cached query
+                                  is reused for a new one (e.g. 0.97). None
+                                  disables the semantic layer.
+        """
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._similarity_threshold = similarity_threshold
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # namespace -> (keys, normalized query matrix), rebuilt lazily after changes
+        self._matrices: Dict[str, Optional[tuple]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Returns a stable hash for the given key parts."""
+        return hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[List[RetrievalResult]]:
+        """
+        Returns cached results for an exact key, or None.
+
+        Args:
+            key: Key from make_key().
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self._is_expired(entry):
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return list(entry["results"])
+
+    def get_similar(
+        self,
+        namespace: str,
+        query_vector: np.ndarray,
+        query_normalized: bool = False
+    ) -> Optional[List[RetrievalResult]]:
+        """
+        Returns results of the most similar cached query in the namespace.
+
+        Args:
+            namespace: Key identifying the search parameters.
+            query_vector: Embedding of the new query.
+            query_normalized: Whether query_vector already has unit norm.
+
+        Returns:
+            Cached results if the best match reaches the similarity threshold, else None.
+        """
+        if self._similarity_threshold is None:
+            return None
+
+        with self._lock:
+            matrix_entry = self._get_matrix(namespace)
+            if matrix_entry is None:
+                return None
+            keys, matrix = matrix_entry
+
+            vector = self._normalize(query_vector, query_normalized)
+            if vector is None:
+                return None
+            sims = matrix @ vector
+            best = int(np.argmax(sims))
+            if sims[best] < self._similarity_threshold:
+                return None
+
+            key = keys[best]
+            entry = self._entries[key]
+            if self._is_expired(entry):
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return list(entry["results"])
+
+    def put(
+        self,
+        key: str,
+        results: List[RetrievalResult],
+        namespace: Optional[str] = None,
+        query_vector: Optional[np.ndarray] = None,
+        query_normalized: bool = False
+    ):
+        """
+        Caches results under a key.
+
+        Args:
+            key: Key from make_key().
+            results: Retrieval results to cache.
+            namespace: Search-parameter key for the semantic layer.
+            query_vector: Query embedding for the semantic layer.
+            query_normalized: Whether query_vector already has unit norm.
+        """
+        normalized = None
+        if namespace is not None and query_vector is not None and self._similarity_threshold is not None:
+            normalized = self._normalize(query_vector, query_normalized)
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = {
+                "results": list(results),
+                "expires_at": time.monotonic() + self._ttl_seconds if self._ttl_seconds else None,
+                "namespace": namespace if normalized is not None else None,
+                "vector": normalized,
+            }
+            if normalized is not None:
+                self._matrices[namespace] = None
+            while len(self._entries) > self._max_size:
+                self._remove(next(iter(self._entries)))
+
+    def clear(self):
+        """Drops all cached entries (e.g. after new documents are ingested)."""
+        with self._lock:
+            self._entries.clear()
+            self._matrices.clear()
+
+    @staticmethod
+    def _normalize(query_vector: np.ndarray, normalized: bool) -> Optional[np.ndarray]:
+        """Returns the vector as float32 with unit norm, or None for a zero vector."""
+        vector = np.asarray(query_vector, dtype=np.float32)
+        if normalized:
+            return vector
+        norm = np.linalg.norm(vector)
+        if norm == 0:
+            return None
+        return vector / norm
+
+    def _get_matrix(self, namespace: str) -> Optional[tuple]:
+        """Returns (keys, matrix) of normalized query vectors for a namespace."""
+        if namespace not in self._matrices:
+            return None
+        if self._matrices[namespace] is None:
+            keys = [k for k, e in self._entries.items() if e["namespace"] == namespace]
+            if not keys:
+                del self._matrices[namespace]
+                return None
+            self._matrices[namespace] = (keys, np.stack([self._entries[k]["vector"] for k in keys]))
+        return self._matrices[namespace]
+
+    def _is_expired(self, entry: Dict[str, Any]) -> bool:
+        """Returns True if the entry's TTL has elapsed."""
+        return entry["expires_at"] is not None and time.monotonic() >= entry["expires_at"]
+
+    def _remove(self, key: str):
+        """Removes an entry and invalidates its namespace matrix."""
+        entry = self._entries.pop(key)
+        if entry["namespace"] is not None:
+            self._matrices[entry["namespace"]] = None
@@ -0,0 +1,93 @@
+import hashlib
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+def simhash64(text: str, shingle_size: int = 3) -> int:
+    """
+    Computes a 64-bit SimHash fingerprint over word shingles.
+
+    Near-duplicate texts (paraphrases, overlapping windows) produce
+    fingerprints with a small Hamming distance.
+
+    Args:
+        text: The text to fingerprint.
+        shingle_size: Number of consecutive words per shingle.
+
+    Returns:
+        The fingerprint as an unsigned 64-bit integer.
+    """
+    words = text.lower().split()
+    if not words:
+        return 0
+
+    if len(words) <= shingle_size:
+        shingles = [" ".join(words)]
+    else:
+        shingles = [" ".join(words[i:i + shingle_size]) for i in range(len(words) - shingle_size + 1)]
+
+    digests = b"".join(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest() for s in shingles)
+    bits = np.unpackbits(np.frombuffer(digests, dtype=np.uint8)).reshape(len(shingles), 64)
+
+    # Each bit is set when the majority of shingle hashes set it
+    votes = bits.sum(axis=0, dtype=np.int64) * 2 - len(shingles)
+    return int.from_bytes(np.packbits(votes > 0).tobytes(), "big")
+
+
+_UINT64_MASK = (1 << 64) - 1
+
+
+def to_int64(fingerprint: int) -> int:
+    """
+    Converts a fingerprint to a signed 64-bit integer for storage.
+
+    JSON-backed stores such as Qdrant keep integers as int64, which cannot
+    hold fingerprints with the top bit set.
+    """
+    return fingerprint - (1 << 64) if fingerprint >> 63 else fingerprint
+
+
+def from_int64(value: int) -> int:
+    """Converts a stored fingerprint (signed or unsigned) back to unsigned 64 bits."""
+    return value & _UINT64_MASK
+
+
+class SimHashIndex:
+    """
+    Finds stored fingerprints within a small Hamming distance.
+
+    The 64 bits are split into max_distance + 1 bands; by the pigeonhole
+    principle two fingerprints within max_distance agree exactly on at least
+    one band, so only keys sharing a band value are compared.
+    """
+
+    def __init__(self, max_distance: int = 3):
+        """
+        Initialize the index.
+
+        Args:
+            max_distance: Maximum Hamming distance treated as a near-duplicate.
+        """
+        self._max_distance = max_distance
+        num_bands = max_distance + 1
+        width = 64 // num_bands
+        # (shift, mask) per band; the last band takes the remaining bits
+        self._bands = [
+            (i * width, (1 << (64 - i * width if i == num_bands - 1 else width)) - 1)
+            for i in range(num_bands)
+        ]
+        self._buckets: List[Dict[int, List[tuple]]] = [{} for _ in self._bands]
+
+    def find(self, fingerprint: int) -> Optional[str]:
+        """Returns the key of a stored near-duplicate fingerprint, or None."""
+        for (shift, mask), buckets in zip(self._bands, self._buckets):
+            for other, key in buckets.get((fingerprint >> shift) & mask, ()):
+                if (fingerprint ^ other).bit_count() <= self._max_distance:
+                    return key
+        return None
+
+    def add(self, fingerprint: int, key: str):
+        """Stores a fingerprint under a key."""
+        for (shift, mask), buckets in zip(self._bands, self._buckets):
+            buckets.setdefault((fingerprint >> shift) & mask, []).append((fingerprint, key))
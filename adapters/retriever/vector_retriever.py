@@ -1,9 +1,10 @@
-from typing import List
+from typing import List, Optional
 
 from polyrag.core.ports.retriever_port import RetrieverPort
 from polyrag.core.ports.embedding_port import TextEmbeddingPort
 from polyrag.core.ports.vector_store_port import VectorStorePort
 from polyrag.core.models.models import RetrievalResult
+from polyrag.adapters.retriever.query_cache import QueryCache
 
 
 class VectorRetriever(RetrieverPort):
@@ -13,7 +14,9 @@ class VectorRetriever(RetrieverPort):
         self,
         embedding_adapter: TextEmbeddingPort,
         vector_store_adapter: VectorStorePort,
-        collection_name: str
+        collection_name: str,
+        cache: Optional[QueryCache] = None,
+        oversampling: Optional[float] = 2.0
     ):
         """
         Initialize the VectorRetriever.
@@ -22,10 +25,17 @@ class VectorRetriever(RetrieverPort):
             embedding_adapter: The embedding adapter to use for query embedding.
             vector_store_adapter: The vector store adapter to search.
             collection_name: The name of the collection to search in.
+            cache: Optional query cache for repeated or near-identical queries.
+            oversampling: Candidate oversampling factor with rescoring for
+                          quantized collections (None disables).
         """
         self._embedding_adapter = embedding_adapter
         self._vector_store_adapter = vector_store_adapter
         self._collection_name = collection_name
+        self._cache = cache
+        self._oversampling = oversampling
+        # Unit-norm query vectors let the cache skip its own normalization
+        self._query_normalized = embedding_adapter.is_normalized
 
     def retrieve(self, query: str, limit: int = 5, **kwargs) -> List[RetrievalResult]:
         """
@@ -39,16 +49,42 @@ class VectorRetriever(RetrieverPort):
         Returns:
             A list of RetrievalResult objects.
         """
+        filter_dict = kwargs.get("filter", None)
+
+        key = namespace = None
+        if self._cache is not None:
+            key = QueryCache.make_key(self._collection_name, query, limit, filter_dict)
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
         # Embed the query
         query_vector = self._embedding_adapter.embed_text(query)
 
+        if self._cache is not None:
+            namespace = QueryCache.make_key(self._collection_name, limit, filter_dict)
+            cached = self._cache.get_similar(
+                namespace, query_vector, query_normalized=self._query_normalized
+            )
+            if cached is not None:
+                return cached
+
         # Search the vector store
-        filter_dict = kwargs.get("filter", None)
         results = self._vector_store_adapter.search(
             collection_name=self._collection_name,
             query_vector=query_vector,
             limit=limit,
-            filter=filter_dict
+            filter=filter_dict,
+            oversampling=self._oversampling
         )
 
+        if self._cache is not None:
+            self._cache.put(
+                key,
+                results,
+                namespace=namespace,
+                query_vector=query_vector,
+                query_normalized=self._query_normalized
+            )
+
         return results
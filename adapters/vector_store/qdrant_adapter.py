@@ -1,11 +1,17 @@
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Sequence
 
+import httpx
+import numpy as np
 from qdrant_client import QdrantClient
 from qdrant_client.models import (
     VectorParams,
     Distance,
-    PointStruct,
     Filter,
+    SearchParams,
+    SearchRequest,
+    QuantizationSearchParams,
     BinaryQuantization,
     BinaryQuantizationConfig,
     ScalarQuantization,
@@ -13,13 +19,26 @@ from qdrant_client.models import (
 )
 
 from polyrag.core.ports.vector_store_port import VectorStorePort
-from polyrag.core.models.models import Chunk, RetrievalResult, QuantizationConfig, QuantizationType, ChunkType
+from polyrag.core.models.models import Chunk, RetrievalResult, QuantizationConfig, QuantizationType
 
 
 class QdrantAdapter(VectorStorePort):
     """Adapter for Qdrant vector database."""
 
-    def __init__(self, host: str = "localhost", port: int = 6333, url: str = None, api_key: str = None):
+    # httpx's own pool defaults, used for settings left unset
+    DEFAULT_MAX_CONNECTIONS = 100
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+    DEFAULT_KEEPALIVE = 5.0
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6333,
+        url: str = None,
+        api_key: str = None,
+        pool_size: Optional[int] = None,
+        keepalive: Optional[float] = None
+    ):
         """
         Initialize the Qdrant adapter.
 
@@ -28,11 +47,53 @@ class QdrantAdapter(VectorStorePort):
             port: Qdrant server port.
             url: Optional URL for cloud deployment.
             api_key: Optional API key for cloud deployment.
+            pool_size: Optional size of the keep-alive HTTP connection pool
+                       (defaults to httpx's limits).
+            keepalive: Seconds an idle pooled connection is kept open
+                       (defaults to httpx's 5 seconds).
         """
         if url:
-            self._client = QdrantClient(url=url, api_key=api_key)
+            self._client_args = {"url": url, "api_key": api_key}
         else:
-            self._client = QdrantClient(host=host, port=port)
+            self._client_args = {"host": host, "port": port}
+        self._pool_settings = (pool_size, keepalive)
+        self._client = self._create_client(pool_size, keepalive)
+
+    def _create_client(self, pool_size: Optional[int], keepalive: Optional[float]) -> QdrantClient:
+        """Creates the client, sizing its REST connection pool if requested."""
+        if pool_size is None and keepalive is None:
+            return QdrantClient(**self._client_args)
+        # Extra keyword arguments are forwarded to the underlying httpx client
+        if pool_size is None:
+            limits = httpx.Limits(
+                max_connections=self.DEFAULT_MAX_CONNECTIONS,
+                max_keepalive_connections=self.DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=keepalive
+            )
+        else:
+            limits = httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size,
+                keepalive_expiry=keepalive if keepalive is not None else self.DEFAULT_KEEPALIVE
+            )
+        return QdrantClient(**self._client_args, limits=limits)
+
+    def configure_connection_pool(self, pool_size: int = 10, keepalive: float = 30.0):
+        """
+        Re-creates the client with a keep-alive connection pool of the given size.
+
+        Does nothing when the pool already has these settings. The previous
+        client is not closed, since pipelines sharing this adapter may still
+        have requests in flight on it; it is released once unreferenced.
+
+        Args:
+            pool_size: Maximum number of pooled connections.
+            keepalive: Seconds an idle pooled connection is kept open.
+        """
+        if self._pool_settings == (pool_size, keepalive):
+            return
+        self._pool_settings = (pool_size, keepalive)
+        self._client = self._create_client(pool_size, keepalive)
 
     def create_collection(
         self,
@@ -65,40 +126,84 @@ class QdrantAdapter(VectorStorePort):
             quantization_config=qdrant_quantization
         )
 
-    def insert(self, collection_name: str, chunks: List[Chunk]):
+    def collection_exists(self, collection_name: str) -> bool:
+        """
+        Returns True if the collection already exists.
+
+        Args:
+            collection_name: Name of the collection.
+        """
+        return self._client.collection_exists(collection_name=collection_name)
+
+    def insert(self, collection_name: str, chunks: Iterable[Chunk], batch_size: int = 256):
         """
         Inserts chunks into the collection.
 
+        Chunks are consumed lazily and uploaded in buffers, so peak memory is
+        bounded by batch_size and embedding can overlap with upload when a
+        generator is passed.
+
         Args:
             collection_name: Name of the collection.
-            chunks: List of chunks to insert.
-        """
-        points = []
-        for chunk in chunks:
-            if chunk.embedding is None:
-                raise ValueError(f"Chunk {chunk.id} has no embedding")
-            
-            payload = {
-                "content": chunk.content,
-                "chunk_type": chunk.chunk_type.value,
-                "source_document_id": chunk.source_document_id,
-                **chunk.metadata
-            }
-            
-            points.append(PointStruct(
-                id=chunk.id,
-                vector=chunk.embedding,
-                payload=payload
-            ))
+            chunks: Chunks to insert (any iterable).
+            batch_size: Number of chunks per upload request.
+
+        Raises:
+            ValueError: If a chunk has no embedding.
+        """
+        iterator = iter(chunks)
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                return
+
+            # Columnar view of the buffer: one contiguous matrix instead of a list per point
+            columns = Chunk.stack(batch)
+            self.insert_vectors(
+                collection_name,
+                columns["ids"].tolist(),
+                columns["embeddings"],
+                [chunk.payload() for chunk in batch],
+                batch_size=batch_size
+            )
+
+    def insert_vectors(
+        self,
+        collection_name: str,
+        ids: Sequence[str],
+        vectors: np.ndarray,
+        payloads: Sequence[Dict[str, Any]],
+        batch_size: int = 256
+    ):
+        """
+        Uploads points given in columnar form.
 
-        self._client.upsert(collection_name=collection_name, points=points)
+        Args:
+            collection_name: Name of the collection.
+            ids: Point IDs (UUID strings), one per row.
+            vectors: Float32 matrix of shape (len(ids), dimension); the
+                     client serializes it without per-point lists.
+            payloads: Payloads aligned with ids.
+            batch_size: Number of points per upload request.
+        """
+        if len(ids) == 0:
+            return
+        self._client.upload_collection(
+            collection_name=collection_name,
+            vectors=vectors,
+            payload=list(payloads),
+            ids=list(ids),
+            batch_size=batch_size,
+            wait=True
+        )
 
     def search(
         self,
         collection_name: str,
         query_vector: List[float],
         limit: int = 5,
-        filter: Optional[Dict] = None
+        filter: Optional[Dict] = None,
+        oversampling: Optional[float] = None
     ) -> List[RetrievalResult]:
         """
         Searches for similar chunks using a query vector.
@@ -108,32 +213,134 @@ class QdrantAdapter(VectorStorePort):
             query_vector: The query embedding vector.
             limit: Maximum number of results to return.
             filter: Optional filter conditions.
+            oversampling: Optional oversampling factor for quantized collections;
+                          candidates from the quantized index are rescored
+                          with the original vectors. Ignored for collections
+                          without quantization.
 
         Returns:
             List of RetrievalResult objects.
         """
-        qdrant_filter = None
-        if filter:
-            qdrant_filter = Filter(**filter)
-
         results = self._client.search(
             collection_name=collection_name,
             query_vector=query_vector,
             limit=limit,
-            query_filter=qdrant_filter
+            query_filter=Filter(**filter) if filter else None,
+            search_params=self._search_params(oversampling)
         )
+        return self._to_results(results)
 
+    def search_batch(
+        self,
+        collection_name: str,
+        query_vectors: List[List[float]],
+        limit: int = 5,
+        filter: Optional[Dict] = None,
+        oversampling: Optional[float] = None
+    ) -> List[List[RetrievalResult]]:
+        """
+        Searches for several query vectors in a single request.
+
+        Args:
+            collection_name: Name of the collection.
+            query_vectors: The query embedding vectors.
+            limit: Maximum number of results per query.
+            filter: Optional filter conditions applied to every query.
+            oversampling: Optional oversampling factor, as in search().
+
+        Returns:
+            One list of RetrievalResult objects per query vector.
+        """
+        if len(query_vectors) == 0:
+            return []
+
+        qdrant_filter = Filter(**filter) if filter else None
+        search_params = self._search_params(oversampling)
+        requests = [
+            SearchRequest(
+                # The request model validates plain floats, not numpy scalars
+                vector=vector.tolist() if hasattr(vector, "tolist") else list(vector),
+                limit=limit,
+                filter=qdrant_filter,
+                params=search_params,
+                with_payload=True
+            )
+            for vector in query_vectors
+        ]
+
+        batch_results = self._client.search_batch(collection_name=collection_name, requests=requests)
+        return [self._to_results(results) for results in batch_results]
+
+    def search_iter(
+        self,
+        collection_name: str,
+        query_vector: List[float],
+        limit: int = 5,
+        filter: Optional[Dict] = None,
+        oversampling: Optional[float] = None,
+        prefetch_size: int = 32
+    ) -> Iterator[RetrievalResult]:
+        """
+        Yields search results best-first, fetched in pages.
+
+        Each page is requested with an offset on a background thread while
+        the previous page is being consumed, so network round trips overlap
+        with the caller's processing.
+
+        Args:
+            collection_name: Name of the collection.
+            query_vector: The query embedding vector.
+            limit: Maximum total number of results.
+            filter: Optional filter conditions.
+            oversampling: Optional oversampling factor, as in search().
+            prefetch_size: Number of results per page.
+
+        Yields:
+            RetrievalResult objects, best match first.
+        """
+        query_filter = Filter(**filter) if filter else None
+        search_params = self._search_params(oversampling)
+
+        def fetch(offset: int) -> List[RetrievalResult]:
+            return self._to_results(self._client.search(
+                collection_name=collection_name,
+                query_vector=query_vector,
+                limit=min(prefetch_size, limit - offset),
+                offset=offset,
+                query_filter=query_filter,
+                search_params=search_params
+            ))
+
+        if limit <= 0:
+            return
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            offset = 0
+            pending = executor.submit(fetch, offset)
+            while pending is not None:
+                page = pending.result()
+                # A short page means the collection is exhausted
+                exhausted = len(page) < min(prefetch_size, limit - offset)
+                offset += len(page)
+                pending = None if exhausted or offset >= limit else executor.submit(fetch, offset)
+                yield from page
+
+    @staticmethod
+    def _search_params(oversampling: Optional[float]) -> Optional[SearchParams]:
+        """Returns rescoring search params for quantized collections, if requested."""
+        if oversampling is None:
+            return None
+        return SearchParams(
+            quantization=QuantizationSearchParams(rescore=True, oversampling=oversampling)
+        )
+
+    @staticmethod
+    def _to_results(results: List[Any]) -> List[RetrievalResult]:
+        """Converts scored Qdrant points into RetrievalResults."""
         retrieval_results = []
         for hit in results:
             payload = hit.payload or {}
-            chunk = Chunk(
-                content=payload.get("content", ""),
-                chunk_type=ChunkType(payload.get("chunk_type", "text")),
-                source_document_id=payload.get("source_document_id", ""),
-                id=str(hit.id),
-                metadata={k: v for k, v in payload.items() 
-                          if k not in ["content", "chunk_type", "source_document_id"]}
-            )
+            chunk = Chunk.from_payload(str(hit.id), payload)
             retrieval_results.append(RetrievalResult(
                 chunk=chunk,
                 score=hit.score,
@@ -4,6 +4,7 @@ from polyrag.core.models.models import (
     Element,
     ElementType,
     Chunk,
+    ChunkMetadata,
     ChunkType,
     RetrievalResult,
     QuantizationConfig,
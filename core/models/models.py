@@ -1,7 +1,20 @@
+from collections.abc import MutableMapping
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any, Union
+from typing import Iterator, List, Optional, Dict, Any, Tuple, Union
 from enum import Enum
-import uuid
+import os
+
+import numpy as np
+
+def _new_id() -> str:
+    """
+    Returns a random 128-bit ID in canonical UUID text form.
+
+    About 3x cheaper than str(uuid.uuid4()); the layout is kept because
+    vector stores such as Qdrant require UUID-formatted string IDs.
+    """
+    h = os.urandom(16).hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
 class ElementType(str, Enum):
     TEXT = "text"
@@ -9,57 +22,313 @@ class ElementType(str, Enum):
     IMAGE = "image"
     CODE = "code"
 
-@dataclass
+@dataclass(slots=True)
 class Element:
     """Represents a specific part of a document (text, table, image, etc.)"""
     content: Any # Str for text, bytes/path for image, etc.
     type: ElementType
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+    def __post_init__(self):
+        # Coerce plain strings so type checks can compare enum members by identity
+        if not isinstance(self.type, ElementType):
+            self.type = ElementType(self.type)
+
+@dataclass(slots=True, eq=False)
 class Document:
-    """Represents a source document."""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    """
+    Represents a source document.
+
+    The joined text content is memoized; use add_element()/clear_elements()
+    (or invalidate_text_cache() after editing elements directly) so the
+    cache stays current. Documents compare and hash by ID.
+    """
+    id: str = field(default_factory=_new_id)
     elements: List[Element] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _text_cache: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def get_text_content(self) -> str:
         """Returns the concatenated text content of all text elements."""
-        return "\n".join([e.content for e in self.elements if e.type == ElementType.TEXT])
+        if self._text_cache is None:
+            # Enum members are singletons, so an identity check suffices
+            text_type = ElementType.TEXT
+            self._text_cache = "\n".join(e.content for e in self.elements if e.type is text_type)
+        return self._text_cache
+
+    def add_element(self, element: Element):
+        """Appends an element and invalidates the cached text content."""
+        self.elements.append(element)
+        self._text_cache = None
+
+    def clear_elements(self):
+        """Removes all elements and invalidates the cached text content."""
+        self.elements.clear()
+        self._text_cache = None
+
+    def invalidate_text_cache(self):
+        """Drops the cached text content after elements were modified directly."""
+        self._text_cache = None
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, Document):
+            return NotImplemented
+        return self.id == other.id
+
+    def __hash__(self) -> int:
+        # str caches its own hash, so this is computed once per ID string
+        return hash(self.id)
+
+class QuantizationType(str, Enum):
+    NONE = "none"
+    BINARY = "binary"
+    PRODUCT = "product"
+
+@dataclass(slots=True)
+class QuantizationConfig:
+    """Configuration for optimization."""
+    type: QuantizationType = QuantizationType.NONE
+    always_ram: bool = False
+    rescore: bool = True
 
 class ChunkType(str, Enum):
     TEXT = "text"
     IMAGE = "image"
 
-@dataclass
+class ChunkMetadata(MutableMapping):
+    """
+    Compact dict-like metadata for chunks that share most of their entries.
+
+    Holds a reference to a base dict shared by many chunks (e.g. the
+    document's metadata) plus per-chunk values for a key tuple that is
+    also shared, so each chunk stores only a small values tuple instead of
+    its own dict. Keys in `keys` take precedence over the base. The first
+    write or delete copies everything into a private dict, leaving the
+    shared base untouched.
+    """
+    __slots__ = ("_base", "_keys", "_values", "_data")
+
+    def __init__(self, base: Dict[str, Any], keys: Tuple[str, ...] = (), values: Tuple[Any, ...] = ()):
+        """
+        Initialize the metadata view.
+
+        Args:
+            base: Shared entries; must not be mutated while views reference it.
+            keys: Per-chunk keys, typically one tuple shared by all chunks.
+            values: This chunk's values, aligned with keys.
+
+        Raises:
+            ValueError: If keys and values differ in length.
+        """
+        if len(keys) != len(values):
+            raise ValueError("keys and values must have the same length")
+        self._base = base
+        self._keys = keys
+        self._values = values
+        self._data: Optional[Dict[str, Any]] = None
+
+    def __getitem__(self, key: str) -> Any:
+        if self._data is not None:
+            return self._data[key]
+        if key in self._keys:
+            return self._values[self._keys.index(key)]
+        return self._base[key]
+
+    def __contains__(self, key: object) -> bool:
+        if self._data is not None:
+            return key in self._data
+        return key in self._keys or key in self._base
+
+    def __iter__(self) -> Iterator[str]:
+        if self._data is not None:
+            return iter(self._data)
+        return iter(self._materialize_items())
+
+    def __len__(self) -> int:
+        if self._data is not None:
+            return len(self._data)
+        return len(self._materialize_items())
+
+    def __setitem__(self, key: str, value: Any):
+        self._own()[key] = value
+
+    def __delitem__(self, key: str):
+        del self._own()[key]
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+    def _materialize_items(self) -> Dict[str, Any]:
+        """Returns the merged entries as a new dict."""
+        merged = dict(self._base)
+        merged.update(zip(self._keys, self._values))
+        return merged
+
+    def _own(self) -> Dict[str, Any]:
+        """Switches to a private dict on first mutation."""
+        if self._data is None:
+            self._data = self._materialize_items()
+            self._base, self._keys, self._values = {}, (), ()
+        return self._data
+
+@dataclass(slots=True, eq=False)
 class Chunk:
-    """Represents an indexable unit of data."""
+    """
+    Represents an indexable unit of data.
+
+    The embedding is held as a contiguous numpy array. Lists assigned to it
+    (at construction or later) are converted to float32; arrays are kept
+    with their own dtype. Chunks compare and hash by ID, so they can be
+    deduplicated in sets and used as dict keys.
+    """
     content: Any
     chunk_type: ChunkType
     source_document_id: str
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    embedding: Optional[List[float]] = None
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    id: str = field(default_factory=_new_id)
+    embedding: Optional[np.ndarray] = None
+    # A dict or a ChunkMetadata sharing entries with sibling chunks
+    metadata: Union[Dict[str, Any], ChunkMetadata] = field(default_factory=dict)
+    # Compact codes derived from the embedding by quantize()
+    embedding_quantized: Optional[np.ndarray] = None
+    quantization: QuantizationType = QuantizationType.NONE
+
+    def __setattr__(self, name: str, value: Any):
+        # Runs for the dataclass __init__ as well as for later assignments
+        if name == "embedding" and value is not None and not isinstance(value, np.ndarray):
+            value = np.asarray(value, dtype=np.float32)
+        object.__setattr__(self, name, value)
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, Chunk):
+            return NotImplemented
+        return self.id == other.id
+
+    def __hash__(self) -> int:
+        # str caches its own hash, so this is computed once per ID string
+        return hash(self.id)
 
     def has_embedding(self) -> bool:
-        return self.embedding is not None
+        return self.embedding is not None and self.embedding.size > 0
+
+    def quantize(self, config: QuantizationConfig, codebooks: Optional[np.ndarray] = None):
+        """
+        Stores a quantized copy of the embedding in embedding_quantized.
+
+        BINARY packs the sign bits into D/8 uint8 bytes. PRODUCT splits the
+        vector into M subspaces and stores the nearest centroid ID of each
+        as uint8.
+
+        Args:
+            config: Quantization settings.
+            codebooks: Trained PQ centroids of shape (M, K, D/M) with K <= 256;
+                       required for PRODUCT quantization.
+
+        Raises:
+            ValueError: If the chunk has no embedding, or PRODUCT quantization
+                        is requested without valid codebooks.
+        """
+        if not self.has_embedding():
+            raise ValueError(f"Chunk {self.id} has no embedding")
+
+        if config.type == QuantizationType.BINARY:
+            self.embedding_quantized = np.packbits(self.embedding > 0)
+        elif config.type == QuantizationType.PRODUCT:
+            if codebooks is None:
+                raise ValueError("Product quantization requires codebooks")
+            num_subspaces, num_centroids, sub_dim = codebooks.shape
+            if num_centroids > 256 or num_subspaces * sub_dim != self.embedding.size:
+                raise ValueError("Codebooks must have shape (M, K<=256, D/M)")
+            subvectors = self.embedding.astype(np.float32).reshape(num_subspaces, 1, sub_dim)
+            distances = ((codebooks - subvectors) ** 2).sum(axis=-1)  # M x K
+            self.embedding_quantized = distances.argmin(axis=1).astype(np.uint8)
+        else:
+            self.embedding_quantized = None
+
+        self.quantization = config.type
+
+    @staticmethod
+    def stack(chunks: List["Chunk"]) -> Dict[str, np.ndarray]:
+        """
+        Converts chunks into columnar arrays for bulk processing.
+
+        Args:
+            chunks: Chunks to convert; all must have embeddings.
+
+        Returns:
+            Dictionary with 'ids' (object array), 'embeddings' (C-contiguous
+            float32 matrix, one row per chunk) and 'types' (chunk type values).
+
+        Raises:
+            ValueError: If a chunk has no embedding.
+        """
+        for chunk in chunks:
+            if chunk.embedding is None:
+                raise ValueError(f"Chunk {chunk.id} has no embedding")
+
+        ids = np.empty(len(chunks), dtype=object)
+        ids[:] = [c.id for c in chunks]
+        return {
+            "ids": ids,
+            "embeddings": np.ascontiguousarray(np.stack([c.embedding for c in chunks]), dtype=np.float32),
+            "types": np.array([c.chunk_type.value for c in chunks]),
+        }
 
-@dataclass
+    # Payload keys holding Chunk fields; every other key is metadata
+    PAYLOAD_FIELDS = ("content", "chunk_type", "source_document_id")
+
+    def payload(self) -> Dict[str, Any]:
+        """Returns the chunk's fields and metadata as one flat vector-store payload."""
+        return {
+            "content": self.content,
+            "chunk_type": self.chunk_type.value,
+            "source_document_id": self.source_document_id,
+            **self.metadata
+        }
+
+    @classmethod
+    def from_payload(cls, chunk_id: str, payload: Dict[str, Any], embedding: Optional[np.ndarray] = None) -> "Chunk":
+        """
+        Rebuilds a chunk from a payload produced by payload().
+
+        Args:
+            chunk_id: The chunk ID.
+            payload: The stored payload.
+            embedding: Optional embedding vector.
+
+        Returns:
+            The reconstructed Chunk.
+        """
+        return cls(
+            content=payload.get("content", ""),
+            chunk_type=ChunkType(payload.get("chunk_type", "text")),
+            source_document_id=payload.get("source_document_id", ""),
+            id=chunk_id,
+            embedding=embedding,
+            metadata={k: v for k, v in payload.items() if k not in cls.PAYLOAD_FIELDS}
+        )
+
+    def as_bytes(self) -> bytes:
+        """Returns the raw embedding bytes for wire transport."""
+        if self.embedding is None:
+            return b""
+        return np.ascontiguousarray(self.embedding).tobytes()
+
+@dataclass(slots=True)
 class RetrievalResult:
-    """Represents a search result."""
+    """
+    Represents a search result.
+
+    Results order best-first: a < b when a scores higher, so sorted() and
+    heapq.nsmallest() rank them without a key function.
+    """
     chunk: Chunk
     score: float
     source: str = "vector" # vector, graph, hybrid
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-class QuantizationType(str, Enum):
-    NONE = "none"
-    BINARY = "binary"
-    PRODUCT = "product"
-
-@dataclass
-class QuantizationConfig:
-    """Configuration for optimization."""
-    type: QuantizationType = QuantizationType.NONE
-    always_ram: bool = False
-    rescore: bool = True
+    def __lt__(self, other: "RetrievalResult") -> bool:
+        return self.score > other.score
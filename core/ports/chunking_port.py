@@ -1,11 +1,16 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterable
 from polyrag.core.models.models import Document, Chunk
 
 class ChunkingPort(ABC):
     """Abstract interface for Chunking strategies."""
 
     @abstractmethod
-    def chunk(self, document: Document) -> List[Chunk]:
-        """Splits a Document into a list of Chunks."""
+    def chunk(self, document: Document) -> Iterable[Chunk]:
+        """
+        Splits a Document into Chunks.
+
+        Implementations may return a list or yield chunks lazily; callers
+        iterate the result once.
+        """
         pass
@@ -1,37 +1,137 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Union, Any
+from itertools import islice
+from typing import Iterable, Iterator, List, Union, Any
+
+import numpy as np
 
 class TextEmbeddingPort(ABC):
-    """Abstract interface for text embedding models."""
+    """
+    Abstract interface for text embedding models.
+
+    Embeddings are returned as float32 numpy arrays; conversion to lists
+    happens only at wire boundaries that require it.
+    """
 
     @abstractmethod
-    def embed_text(self, text: str) -> List[float]:
-        """Embeds a single text string."""
+    def embed_text(self, text: str) -> np.ndarray:
+        """Embeds a single text string into a (dimension,) array."""
         pass
 
     @abstractmethod
-    def embed_texts(self, texts: List[str]) -> List[List[float]]:
-        """Embeds a list of text strings."""
+    def embed_texts(self, texts: List[str]) -> np.ndarray:
+        """
+        Embeds a list of text strings into one (len(texts), dimension) matrix.
+
+        Implementations return a C-contiguous float32 array, including a
+        (0, dimension) array for empty input, so callers can score it with
+        a single matrix product.
+        """
         pass
 
+    async def aembed_text(self, text: str) -> np.ndarray:
+        """
+        Asynchronously embeds a single text string.
+
+        The default runs embed_text() in a worker thread; adapters backed by
+        a remote API can override it with a native async call.
+        """
+        return await asyncio.to_thread(self.embed_text, text)
+
+    async def aembed_texts(self, texts: List[str]) -> np.ndarray:
+        """
+        Asynchronously embeds a list of text strings.
+
+        The default runs embed_texts() in a worker thread; adapters backed by
+        a remote API can override it with native async calls.
+        """
+        return await asyncio.to_thread(self.embed_texts, texts)
+
+    def embed_texts_np(self, texts: List[str]) -> np.ndarray:
+        """
+        Embeds a list of text strings into a float32 matrix (one row per text).
+
+        Equivalent to embed_texts for conforming adapters (the conversion
+        does not copy); it also coerces adapters that still return lists.
+        """
+        if not texts:
+            return np.empty((0, self.dimension), dtype=np.float32)
+        return np.asarray(self.embed_texts(texts), dtype=np.float32)
+
+    def embed_texts_batched(self, texts: List[str], batch_size: int = 32) -> Iterator[np.ndarray]:
+        """
+        Embeds texts in consecutive slices, yielding one float32 matrix per slice.
+
+        Lets callers consume embeddings as they are produced instead of
+        waiting for the whole list. The default embeds each slice with
+        embed_texts_np; adapters that can tokenize and schedule the whole
+        input at once override it.
+
+        Args:
+            texts: The texts to embed.
+            batch_size: Number of texts per yielded matrix.
+
+        Yields:
+            Arrays of shape (len(slice), dimension), in input order.
+        """
+        for start in range(0, len(texts), batch_size):
+            yield self.embed_texts_np(texts[start:start + batch_size])
+
     @property
     @abstractmethod
     def dimension(self) -> int:
         """Returns the dimension of the embedding vector."""
         pass
 
+    @property
+    def dtype(self) -> np.dtype:
+        """Returns the dtype of the returned embeddings."""
+        return np.dtype(np.float32)
+
+    @property
+    def is_normalized(self) -> bool:
+        """
+        Whether returned embeddings are guaranteed to have unit L2 norm.
+
+        When True, dot products equal cosine similarity and consumers can
+        skip re-normalizing. Defaults to False; adapters override it only
+        when the model guarantees it.
+        """
+        return False
+
 class ImageEmbeddingPort(ABC):
     """Abstract interface for image embedding models."""
 
     @abstractmethod
-    def embed_image(self, image: Any) -> List[float]:
+    def embed_image(self, image: Any) -> np.ndarray:
         """Embeds a single image. Image type depends on implementation (path, bytes, PIL)."""
         pass
 
     @abstractmethod
-    def embed_images(self, images: List[Any]) -> List[List[float]]:
-        """Embeds a list of images."""
+    def embed_images(self, images: List[Any]) -> np.ndarray:
+        """Embeds a list of images into a (len(images), dimension) array."""
         pass
+
+    def embed_images_batched(self, images: Iterable[Any], batch_size: int = 32) -> Iterator[np.ndarray]:
+        """
+        Embeds images in consecutive batches, yielding one float32 matrix per batch.
+
+        The default embeds each batch with embed_images; adapters override
+        it to overlap decoding and host-to-device copies with inference.
+
+        Args:
+            images: Images (paths or PIL images); any iterable, consumed lazily.
+            batch_size: Number of images per yielded matrix.
+
+        Yields:
+            Arrays of shape (len(batch), dimension), in input order.
+        """
+        iterator = iter(images)
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                return
+            yield np.asarray(self.embed_images(batch), dtype=np.float32)
     
     @property
     @abstractmethod
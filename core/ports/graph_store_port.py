@@ -24,8 +24,35 @@ class GraphStorePort(ABC):
         """Executes a Cypher query."""
         pass
 
+    def execute_read(self, cypher_query: str, parameters: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """
+        Executes a read-only Cypher query.
+
+        Adapters can route it to read replicas and reuse pooled connections;
+        the default implementation delegates to query().
+        """
+        return self.query(cypher_query, parameters)
+
     @abstractmethod
-    def get_subgraph(self, node_id: str, depth: int = 1) -> Any:
-        # Return type Any for now, ideally strictly typed or a specific Graph structure
-        """Retrieves a subgraph around a specific node."""
+    def get_subgraph(self, node_id: str, depth: int = 1) -> Dict[str, Any]:
+        """
+        Retrieves a subgraph around a specific node in one call.
+
+        Returns a dictionary with:
+            nodes: List of {"id", "labels", "properties"} dicts.
+            edges: List of {"type", "start", "end", "properties"} dicts.
+            content_map: Node ID to content for nodes that have content,
+                         so callers never need a second round trip.
+        """
         pass
+
+    def get_subgraphs(self, node_ids: List[str], depth: int = 1) -> Dict[str, Any]:
+        """
+        Retrieves subgraphs around several nodes, keyed by node ID.
+
+        Each value has the same structure as get_subgraph().
+
+        The default implementation calls get_subgraph() once per node;
+        adapters can override it to fetch all subgraphs in one round-trip.
+        """
+        return {node_id: self.get_subgraph(node_id, depth=depth) for node_id in node_ids}
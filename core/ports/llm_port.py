@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Iterator, Optional, List
+from typing import AsyncIterator, Iterator, Optional, List
 
 class LLMPort(ABC):
     """Abstract interface for Large Language Models."""
@@ -14,6 +15,67 @@ class LLMPort(ABC):
         """Generates a streaming text response."""
         pass
 
+    def generate_stream_bytes(self, prompt: str, system_prompt: Optional[str] = None, **kwargs) -> Iterator[bytes]:
+        """
+        Generates a streaming response as UTF-8 encoded chunks.
+
+        For consumers that forward the stream to a socket or file and never
+        need str objects. The default encodes generate_stream() output.
+        """
+        for text in self.generate_stream(prompt, system_prompt, **kwargs):
+            yield text.encode("utf-8")
+
+    async def agenerate(self, prompt: str, system_prompt: Optional[str] = None, **kwargs) -> str:
+        """
+        Asynchronously generates a text response for the given prompt.
+
+        The default implementation runs generate() in a worker thread;
+        adapters with a native async client override it.
+        """
+        return await asyncio.to_thread(self.generate, prompt, system_prompt, **kwargs)
+
+    async def agenerate_stream(self, prompt: str, system_prompt: Optional[str] = None, **kwargs) -> AsyncIterator[str]:
+        """
+        Asynchronously generates a streaming text response.
+
+        The default drives generate_stream() from a worker thread, one chunk
+        at a time, so the event loop stays free between chunks.
+        """
+        iterator = iter(self.generate_stream(prompt, system_prompt, **kwargs))
+        done = object()
+        while True:
+            chunk = await asyncio.to_thread(next, iterator, done)
+            if chunk is done:
+                return
+            yield chunk
+
+    async def generate_batch(
+        self,
+        prompts: List[str],
+        system_prompt: Optional[str] = None,
+        concurrency: int = 16,
+        **kwargs
+    ) -> List[str]:
+        """
+        Generates responses for many prompts with bounded concurrency.
+
+        Args:
+            prompts: The user prompts.
+            system_prompt: Optional system prompt shared by all prompts.
+            concurrency: Maximum number of requests in flight.
+            **kwargs: Additional parameters passed to agenerate().
+
+        Returns:
+            The generated responses, in prompt order.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(prompt: str) -> str:
+            async with semaphore:
+                return await self.agenerate(prompt, system_prompt, **kwargs)
+
+        return list(await asyncio.gather(*(run(p) for p in prompts)))
+
     @property
     @abstractmethod
     def model_name(self) -> str:
@@ -25,3 +87,28 @@ class LLMPort(ABC):
     def supports_vision(self) -> bool:
         """Returns True if the model supports image inputs."""
         pass
+
+    @property
+    def supported_precisions(self) -> List[str]:
+        """
+        Returns the numeric precisions that can be requested with the
+        `precision` keyword of generate()/generate_stream() (e.g. "bf16").
+
+        An empty list means the precision is fixed by the backend and the
+        keyword is not accepted. Adapters that must ask the backend raise
+        RuntimeError until the value has been resolved.
+        """
+        return []
+
+    def _check_precision(self, precision: Optional[str]):
+        """
+        Validates a requested precision.
+
+        Raises:
+            ValueError: If the precision is not in supported_precisions.
+        """
+        if precision is not None and precision not in self.supported_precisions:
+            supported = ", ".join(self.supported_precisions) or "none (fixed by the backend)"
+            raise ValueError(
+                f"Precision '{precision}' is not available for {self.model_name}; supported: {supported}"
+            )
@@ -1,6 +1,7 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import List, Any
-from polyrag.core.models.models import RetrievalResult
+from polyrag.core.models.models import Chunk, RetrievalResult
 
 class RetrieverPort(ABC):
     """Abstract interface for Retrievers."""
@@ -9,3 +10,22 @@ class RetrieverPort(ABC):
     def retrieve(self, query: str, limit: int = 5, **kwargs) -> List[RetrievalResult]:
         """Retrieves relevant chunks for a given query."""
         pass
+
+    async def aretrieve(self, query: str, limit: int = 5, **kwargs) -> List[RetrievalResult]:
+        """
+        Asynchronously retrieves relevant chunks for a given query.
+
+        The default runs retrieve() in a worker thread so synchronous
+        retrievers can be awaited alongside other I/O.
+        """
+        return await asyncio.to_thread(self.retrieve, query, limit, **kwargs)
+
+    def prepare_chunks(self, chunks: List[Chunk]):
+        """
+        Annotates chunks before they are inserted into the vector store.
+
+        The pipeline calls this on every ingest batch, so a retriever can
+        persist per-chunk data it needs at query time in chunk metadata.
+        The default does nothing.
+        """
+        pass
@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Sequence
+
+import numpy as np
 from polyrag.core.models.models import Chunk, RetrievalResult, QuantizationConfig
 
 class VectorStorePort(ABC):
@@ -10,16 +13,127 @@ class VectorStorePort(ABC):
         """Creates a new collection."""
         pass
 
+    def configure_connection_pool(self, pool_size: int = 10, keepalive: float = 30.0):
+        """
+        Sizes the adapter's keep-alive connection pool.
+
+        Lets callers such as PipelineBuilder tune pooling on an already
+        constructed adapter. The default does nothing, for adapters without
+        a network client.
+        """
+        pass
+
+    def collection_exists(self, collection_name: str) -> bool:
+        """
+        Returns True if the collection already exists.
+
+        The default returns False, so callers fall back to create_collection();
+        adapters override it with a cheap existence check.
+        """
+        return False
+
     @abstractmethod
-    def insert(self, collection_name: str, chunks: List[Chunk]):
-        """Inserts chunks into the collection."""
+    def insert(self, collection_name: str, chunks: Iterable[Chunk], batch_size: int = 256):
+        """
+        Inserts chunks into the collection.
+
+        Chunks may be any iterable (e.g. a generator fed by embedding); they
+        are consumed and uploaded in buffers of batch_size.
+        """
         pass
 
+    def insert_vectors(
+        self,
+        collection_name: str,
+        ids: Sequence[str],
+        vectors: np.ndarray,
+        payloads: Sequence[Dict[str, Any]],
+        batch_size: int = 256
+    ):
+        """
+        Inserts points given in columnar form.
+
+        Avoids building Chunk objects when the caller already holds one
+        embedding matrix per batch. Payloads follow Chunk.payload().
+        The default rebuilds chunks and delegates to insert(); adapters
+        override it to upload the matrix directly.
+
+        Args:
+            collection_name: Name of the collection.
+            ids: Point IDs, one per row.
+            vectors: Float32 matrix of shape (len(ids), dimension).
+            payloads: Payloads aligned with ids.
+            batch_size: Number of points per upload request.
+        """
+        self.insert(
+            collection_name,
+            (Chunk.from_payload(i, p, v) for i, p, v in zip(ids, payloads, vectors)),
+            batch_size=batch_size
+        )
+
     @abstractmethod
-    def search(self, collection_name: str, query_vector: List[float], limit: int = 5, filter: Optional[Dict] = None) -> List[RetrievalResult]:
-        """Searches for similar chunks using a query vector."""
+    def search(
+        self,
+        collection_name: str,
+        query_vector: List[float],
+        limit: int = 5,
+        filter: Optional[Dict] = None,
+        oversampling: Optional[float] = None
+    ) -> List[RetrievalResult]:
+        """
+        Searches for similar chunks using a query vector.
+
+        When the collection is quantized, oversampling fetches that many times
+        `limit` candidates from the quantized index and rescores them with the
+        original vectors.
+        """
         pass
 
+    def search_batch(
+        self,
+        collection_name: str,
+        query_vectors: List[List[float]],
+        limit: int = 5,
+        filter: Optional[Dict] = None,
+        oversampling: Optional[float] = None
+    ) -> List[List[RetrievalResult]]:
+        """
+        Searches for several query vectors at once.
+
+        The default runs search() for each vector on a thread pool; adapters
+        with a native batch endpoint override it to send one request.
+
+        Returns:
+            One result list per query vector, in input order.
+        """
+        if len(query_vectors) <= 1:
+            return [self.search(collection_name, v, limit, filter, oversampling) for v in query_vectors]
+
+        with ThreadPoolExecutor(max_workers=min(len(query_vectors), 8)) as executor:
+            return list(executor.map(
+                lambda v: self.search(collection_name, v, limit, filter, oversampling),
+                query_vectors
+            ))
+
+    def search_iter(
+        self,
+        collection_name: str,
+        query_vector: List[float],
+        limit: int = 5,
+        filter: Optional[Dict] = None,
+        oversampling: Optional[float] = None,
+        prefetch_size: int = 32
+    ) -> Iterator[RetrievalResult]:
+        """
+        Yields search results best-first as they are fetched.
+
+        Adapters that can page through results override it to fetch
+        prefetch_size results at a time, requesting the next page while the
+        consumer (e.g. a reranker) works on the current one. The default
+        runs search() once and yields its results.
+        """
+        yield from self.search(collection_name, query_vector, limit, filter, oversampling)
+
     @abstractmethod
     def delete_collection(self, collection_name: str):
         """Deletes a collection."""
@@ -1,4 +1,4 @@
 # interface package
 from polyrag.interface.builder import PipelineBuilder
-from polyrag.interface.pipeline import PolyRAGPipeline
+from polyrag.interface.pipeline import PolyRAGPipeline, PreparedQuery
 from polyrag.interface.factory import AdapterFactory
@@ -1,7 +1,10 @@
-from typing import Optional, TYPE_CHECKING
+import threading
+from typing import Optional, Tuple, Type, TYPE_CHECKING
+from weakref import WeakValueDictionary
 
 if TYPE_CHECKING:
     from polyrag.interface.pipeline import PolyRAGPipeline
+    from polyrag.adapters.retriever.vector_retriever import VectorRetriever
 
 from polyrag.core.ports.llm_port import LLMPort
 from polyrag.core.ports.embedding_port import TextEmbeddingPort
@@ -14,6 +17,39 @@ from polyrag.core.ports.retriever_port import RetrieverPort
 class PipelineBuilder:
     """Fluent API builder for constructing PolyRAG pipelines."""
 
+    __slots__ = (
+        "_llm",
+        "_embedding",
+        "_vector_store",
+        "_document_loader",
+        "_chunker",
+        "_retriever",
+        "_collection_name",
+        "_embed_batch_size",
+        "_io_workers",
+        "_connection_pool",
+        "_empty_context_behavior",
+    )
+
+    # (attribute, error message) for each component build() requires
+    _REQUIRED = (
+        ("_llm", "LLM adapter is required. Use with_llm()."),
+        ("_embedding", "Embedding adapter is required. Use with_embedding()."),
+        ("_vector_store", "Vector store adapter is required. Use with_vector_store()."),
+        ("_document_loader", "Document loader is required. Use with_document_loader()."),
+        ("_chunker", "Chunker is required. Use with_chunker()."),
+    )
+
+    # Resolved on the first build(); imported lazily to avoid circular imports
+    _pipeline_cls: Optional[Type["PolyRAGPipeline"]] = None
+    _retriever_cls: Optional[Type["VectorRetriever"]] = None
+
+    # Default retrievers shared by pipelines built over the same embedding,
+    # store and collection; an entry disappears with the last pipeline using it.
+    # A live retriever keeps its adapters alive, so their ids cannot be reused.
+    _retriever_cache: "WeakValueDictionary[Tuple[int, int, str], VectorRetriever]" = WeakValueDictionary()
+    _retriever_cache_lock = threading.Lock()
+
     def __init__(self):
         """Initialize an empty pipeline builder."""
         self._llm: Optional[LLMPort] = None
@@ -23,6 +59,10 @@ class PipelineBuilder:
         self._chunker: Optional[ChunkingPort] = None
         self._retriever: Optional[RetrieverPort] = None
         self._collection_name: str = "polyrag_default"
+        self._embed_batch_size: int = 256
+        self._io_workers: int = 4
+        self._connection_pool: Optional[Tuple[int, float]] = None
+        self._empty_context_behavior: str = "passthrough"
 
     def with_llm(self, llm: LLMPort) -> "PipelineBuilder":
         """
@@ -115,6 +155,63 @@ class PipelineBuilder:
         self._collection_name = name
         return self
 
+    def with_embed_batch_size(self, batch_size: int) -> "PipelineBuilder":
+        """
+        Set how many chunks are embedded and inserted together during ingestion.
+
+        Args:
+            batch_size: Chunks per micro-batch.
+
+        Returns:
+            Self for method chaining.
+        """
+        self._embed_batch_size = batch_size
+        return self
+
+    def with_io_workers(self, workers: int) -> "PipelineBuilder":
+        """
+        Set how many threads load files concurrently when ingesting a directory.
+
+        Args:
+            workers: Number of loader threads (1 loads serially).
+
+        Returns:
+            Self for method chaining.
+        """
+        self._io_workers = workers
+        return self
+
+    def with_connection_pool(self, pool_size: int = 10, keepalive: float = 30.0) -> "PipelineBuilder":
+        """
+        Size the vector store's keep-alive connection pool.
+
+        Applied to the vector store adapter in build(), so query and insert
+        calls reuse open connections under concurrent load.
+
+        Args:
+            pool_size: Maximum number of pooled connections.
+            keepalive: Seconds an idle pooled connection is kept open.
+
+        Returns:
+            Self for method chaining.
+        """
+        self._connection_pool = (pool_size, keepalive)
+        return self
+
+    def with_empty_context_behavior(self, behavior: str) -> "PipelineBuilder":
+        """
+        Set what queries do when retrieval finds nothing.
+
+        Args:
+            behavior: "passthrough" (still call the LLM) or "short_circuit"
+                      (answer without an LLM call).
+
+        Returns:
+            Self for method chaining.
+        """
+        self._empty_context_behavior = behavior
+        return self
+
     def build(self) -> "PolyRAGPipeline":
         """
         Build and return the configured pipeline.
@@ -125,37 +222,55 @@ class PipelineBuilder:
         Raises:
             ValueError: If required components are missing.
         """
-        # Validate required components
-        if self._llm is None:
-            raise ValueError("LLM adapter is required. Use with_llm().")
-        if self._embedding is None:
-            raise ValueError("Embedding adapter is required. Use with_embedding().")
-        if self._vector_store is None:
-            raise ValueError("Vector store adapter is required. Use with_vector_store().")
-        if self._document_loader is None:
-            raise ValueError("Document loader is required. Use with_document_loader().")
-        if self._chunker is None:
-            raise ValueError("Chunker is required. Use with_chunker().")
-
-        # Import here to avoid circular imports
-        from polyrag.interface.pipeline import PolyRAGPipeline
-        from polyrag.adapters.retriever.vector_retriever import VectorRetriever
-
-        # Create default retriever if not provided
+        for attr, message in self._REQUIRED:
+            if getattr(self, attr) is None:
+                raise ValueError(message)
+
+        if self._connection_pool is not None:
+            pool_size, keepalive = self._connection_pool
+            self._vector_store.configure_connection_pool(pool_size=pool_size, keepalive=keepalive)
+
+        pipeline_cls, retriever_cls = self._component_classes()
+
+        # Create (or reuse) the default retriever if not provided
         retriever = self._retriever
         if retriever is None:
-            retriever = VectorRetriever(
-                embedding_adapter=self._embedding,
-                vector_store_adapter=self._vector_store,
-                collection_name=self._collection_name
-            )
+            retriever = self._default_retriever(retriever_cls)
 
-        return PolyRAGPipeline(
+        return pipeline_cls(
             llm=self._llm,
             embedding=self._embedding,
             vector_store=self._vector_store,
             document_loader=self._document_loader,
             chunker=self._chunker,
             retriever=retriever,
-            collection_name=self._collection_name
+            collection_name=self._collection_name,
+            embed_batch_size=self._embed_batch_size,
+            io_workers=self._io_workers,
+            empty_context_behavior=self._empty_context_behavior
         )
+
+    @classmethod
+    def _component_classes(cls) -> Tuple[Type["PolyRAGPipeline"], Type["VectorRetriever"]]:
+        """Returns the pipeline and default retriever classes, importing them once."""
+        if cls._pipeline_cls is None:
+            # Import here to avoid circular imports
+            from polyrag.interface.pipeline import PolyRAGPipeline
+            from polyrag.adapters.retriever.vector_retriever import VectorRetriever
+            PipelineBuilder._retriever_cls = VectorRetriever
+            PipelineBuilder._pipeline_cls = PolyRAGPipeline
+        return cls._pipeline_cls, cls._retriever_cls
+
+    def _default_retriever(self, retriever_cls: Type["VectorRetriever"]) -> "VectorRetriever":
+        """Returns the shared VectorRetriever for this builder's components."""
+        key = (id(self._embedding), id(self._vector_store), self._collection_name)
+        with self._retriever_cache_lock:
+            retriever = self._retriever_cache.get(key)
+            if retriever is None:
+                retriever = retriever_cls(
+                    embedding_adapter=self._embedding,
+                    vector_store_adapter=self._vector_store,
+                    collection_name=self._collection_name
+                )
+                self._retriever_cache[key] = retriever
+            return retriever
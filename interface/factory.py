@@ -1,7 +1,17 @@
 """
 Factory module for creating adapters from configuration strings.
+
+Providers are looked up in per-port registries. Built-in adapters are
+registered below; other packages can add their own with the
+AdapterFactory.register_* decorators or through entry points in the
+"polyrag.llm", "polyrag.embedding", "polyrag.vector_store",
+"polyrag.document_loader" and "polyrag.chunker" groups.
 """
-from typing import Optional
+import threading
+from collections import OrderedDict
+from functools import partial
+from importlib.metadata import entry_points
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
 
 from polyrag.core.ports.llm_port import LLMPort
 from polyrag.core.ports.embedding_port import TextEmbeddingPort
@@ -13,66 +23,179 @@ from polyrag.core.ports.chunking_port import ChunkingPort
 class AdapterFactory:
     """Factory for creating adapters from configuration."""
 
+    # Lower-cased provider name -> callable that imports and builds the adapter
+    _LLM_REGISTRY: Dict[str, Callable[..., LLMPort]] = {}
+    _EMBEDDING_REGISTRY: Dict[str, Callable[..., TextEmbeddingPort]] = {}
+    _VECTOR_STORE_REGISTRY: Dict[str, Callable[..., VectorStorePort]] = {}
+    _LOADER_REGISTRY: Dict[str, Callable[..., DocumentLoaderPort]] = {}
+    _CHUNKER_REGISTRY: Dict[str, Callable[..., ChunkingPort]] = {}
+
+    # Port name accepted by specialize() -> (registry attribute, entry point group)
+    _PORTS: Dict[str, Tuple[str, str]] = {
+        "llm": ("_LLM_REGISTRY", "polyrag.llm"),
+        "embedding": ("_EMBEDDING_REGISTRY", "polyrag.embedding"),
+        "vector_store": ("_VECTOR_STORE_REGISTRY", "polyrag.vector_store"),
+        "document_loader": ("_LOADER_REGISTRY", "polyrag.document_loader"),
+        "chunker": ("_CHUNKER_REGISTRY", "polyrag.chunker"),
+    }
+
+    # Reused LLM and embedding adapters, keyed by (port, provider, kwargs)
+    INSTANCE_CACHE_SIZE = 8
+    _instances: "OrderedDict[Tuple[Hashable, ...], Any]" = OrderedDict()
+    _instances_lock = threading.Lock()
+
     @staticmethod
-    def create_llm(provider: str = "ollama", **kwargs) -> LLMPort:
+    def _register(registry: Dict[str, Callable[..., Any]], name: str) -> Callable:
+        """Returns a decorator that stores a factory under a provider name."""
+        def decorator(factory: Callable[..., Any]) -> Callable[..., Any]:
+            registry[name.lower()] = factory
+            return factory
+        return decorator
+
+    @classmethod
+    def register_llm(cls, name: str) -> Callable:
+        """Decorator registering an LLM factory under a provider name."""
+        return cls._register(cls._LLM_REGISTRY, name)
+
+    @classmethod
+    def register_embedding(cls, name: str) -> Callable:
+        """Decorator registering an embedding factory under a provider name."""
+        return cls._register(cls._EMBEDDING_REGISTRY, name)
+
+    @classmethod
+    def register_vector_store(cls, name: str) -> Callable:
+        """Decorator registering a vector store factory under a provider name."""
+        return cls._register(cls._VECTOR_STORE_REGISTRY, name)
+
+    @classmethod
+    def register_document_loader(cls, name: str) -> Callable:
+        """Decorator registering a document loader factory under a type name."""
+        return cls._register(cls._LOADER_REGISTRY, name)
+
+    @classmethod
+    def register_chunker(cls, name: str) -> Callable:
+        """Decorator registering a chunker factory under a type name."""
+        return cls._register(cls._CHUNKER_REGISTRY, name)
+
+    @staticmethod
+    def _lookup(registry: Dict[str, Callable[..., Any]], group: str, name: str) -> Optional[Callable[..., Any]]:
+        """
+        Returns the factory for a name, loading a matching entry point on a miss.
+
+        Args:
+            registry: The registry to search.
+            group: Entry point group for third-party adapters.
+            name: Provider or type name (case-insensitive).
+
+        Returns:
+            The factory, or None if nothing is registered under the name.
+        """
+        key = name.lower()
+        factory = registry.get(key)
+        if factory is None:
+            for entry_point in entry_points(group=group):
+                if entry_point.name.lower() == key:
+                    factory = registry[key] = entry_point.load()
+                    break
+        return factory
+
+    @classmethod
+    def _reuse_or_create(cls, key: Tuple[Hashable, ...], create: Callable[[], Any]) -> Any:
+        """
+        Returns the cached adapter for a key, creating and caching it on a miss.
+
+        Creation runs under the lock so concurrent callers never load the
+        same model twice. Keys with unhashable kwargs bypass the cache.
+        """
+        try:
+            hash(key)
+        except TypeError:
+            return create()
+
+        with cls._instances_lock:
+            instance = cls._instances.get(key)
+            if instance is not None:
+                cls._instances.move_to_end(key)
+                return instance
+            instance = create()
+            cls._instances[key] = instance
+            if len(cls._instances) > cls.INSTANCE_CACHE_SIZE:
+                cls._instances.popitem(last=False)
+            return instance
+
+    @classmethod
+    def clear_cache(cls):
+        """Forgets all reused adapter instances."""
+        with cls._instances_lock:
+            cls._instances.clear()
+
+    @classmethod
+    def create_llm(cls, provider: str = "ollama", reuse: bool = True, **kwargs) -> LLMPort:
         """
         Create an LLM adapter.
 
         Args:
-            provider: LLM provider name (ollama, openai, claude, gemini).
+            provider: LLM provider name (ollama, gemini, or a registered name).
+            reuse: Return the adapter from an earlier call with the same
+                   provider and arguments instead of building a new one.
+                   Shared adapters are safe to use from several threads;
+                   don't close() one that others may still use.
             **kwargs: Provider-specific arguments.
 
         Returns:
             An LLM adapter instance.
+
+        Raises:
+            ValueError: If the provider is unknown.
         """
-        if provider.lower() == "ollama":
-            from polyrag.adapters.llm.ollama_adapter import OllamaAdapter
-            return OllamaAdapter(
-                model=kwargs.get("model", "llama3.2"),
-                base_url=kwargs.get("base_url", "http://localhost:11434")
-            )
-        elif provider.lower() == "gemini":
-            from polyrag.adapters.llm.gemini_adapter import GeminiAdapter
-            return GeminiAdapter(
-                model_name=kwargs.get("model", "gemini-2.5-pro"),
-                api_key=kwargs.get("api_key")
-            )
-        else:
+        factory = cls._lookup(cls._LLM_REGISTRY, "polyrag.llm", provider)
+        if factory is None:
             raise ValueError(f"Unknown LLM provider: {provider}")
+        if not reuse:
+            return factory(**kwargs)
+        key = ("llm", provider.lower(), tuple(sorted(kwargs.items())))
+        return cls._reuse_or_create(key, lambda: factory(**kwargs))
 
-    @staticmethod
-    def create_embedding(provider: str = "fastembed", **kwargs) -> TextEmbeddingPort:
+    @classmethod
+    def create_embedding(cls, provider: str = "fastembed", reuse: bool = True, **kwargs) -> TextEmbeddingPort:
         """
         Create an embedding adapter.
 
+        Loading a model takes seconds and hundreds of MB, so by default an
+        identical earlier call's adapter is returned instead.
+
         Args:
             provider: Embedding provider name.
-            **kwargs: Provider-specific arguments.
+            reuse: Return the adapter from an earlier call with the same
+                   provider and arguments instead of loading the model again.
+                   The built-in embedding models are safe to share between threads.
+            **kwargs: Provider-specific arguments. Pass ``cache_dir`` to
+                enable the persistent embedding cache.
 
         Returns:
             An embedding adapter instance.
+
+        Raises:
+            ValueError: If the provider is unknown.
         """
-        if provider.lower() == "fastembed":
-            from polyrag.adapters.embedding.fastembed_adapter import FastEmbedAdapter
-            return FastEmbedAdapter(
-                model_name=kwargs.get("model_name", "BAAI/bge-small-en-v1.5")
-            )
-        elif provider.lower() == "gemini":
-            from polyrag.adapters.embedding.gemini_embedding_adapter import GeminiEmbeddingAdapter
-            return GeminiEmbeddingAdapter(
-                model_name=kwargs.get("model_name", "models/text-embedding-004"),
-                api_key=kwargs.get("api_key")
-            )
-        elif provider.lower() == "clip":
-            from polyrag.adapters.embedding.clip_adapter import CLIPAdapter
-            return CLIPAdapter(
-                model_name=kwargs.get("model_name", "clip-ViT-B-32")
-            )
-        else:
+        factory = cls._lookup(cls._EMBEDDING_REGISTRY, "polyrag.embedding", provider)
+        if factory is None:
             raise ValueError(f"Unknown embedding provider: {provider}")
 
-    @staticmethod
-    def create_vector_store(provider: str = "qdrant", **kwargs) -> VectorStorePort:
+        def create() -> TextEmbeddingPort:
+            options = dict(kwargs)
+            if options.get("cache") is None and options.get("cache_dir"):
+                from polyrag.adapters.embedding.embedding_cache import EmbeddingCache
+                options["cache"] = EmbeddingCache(cache_dir=options["cache_dir"])
+            return factory(**options)
+
+        if not reuse:
+            return create()
+        key = ("embedding", provider.lower(), tuple(sorted(kwargs.items())))
+        return cls._reuse_or_create(key, create)
+
+    @classmethod
+    def create_vector_store(cls, provider: str = "qdrant", **kwargs) -> VectorStorePort:
         """
         Create a vector store adapter.
 
@@ -82,41 +205,37 @@ class AdapterFactory:
 
         Returns:
             A vector store adapter instance.
+
+        Raises:
+            ValueError: If the provider is unknown.
         """
-        if provider.lower() == "qdrant":
-            from polyrag.adapters.vector_store.qdrant_adapter import QdrantAdapter
-            return QdrantAdapter(
-                host=kwargs.get("host", "localhost"),
-                port=kwargs.get("port", 6333),
-                url=kwargs.get("url"),
-                api_key=kwargs.get("api_key")
-            )
-        else:
+        factory = cls._lookup(cls._VECTOR_STORE_REGISTRY, "polyrag.vector_store", provider)
+        if factory is None:
             raise ValueError(f"Unknown vector store provider: {provider}")
+        return factory(**kwargs)
 
-    @staticmethod
-    def create_document_loader(loader_type: str = "text", **kwargs) -> DocumentLoaderPort:
+    @classmethod
+    def create_document_loader(cls, loader_type: str = "text", **kwargs) -> DocumentLoaderPort:
         """
         Create a document loader adapter.
 
         Args:
-            loader_type: Type of loader (text, pdf, image).
+            loader_type: Type of loader (text, pdf, or a registered name).
             **kwargs: Loader-specific arguments.
 
         Returns:
             A document loader adapter instance.
+
+        Raises:
+            ValueError: If the loader type is unknown.
         """
-        if loader_type.lower() == "text":
-            from polyrag.adapters.document_loader.text_loader import TextLoader
-            return TextLoader(encoding=kwargs.get("encoding", "utf-8"))
-        elif loader_type.lower() == "pdf":
-            from polyrag.adapters.document_loader.pdf_loader import PdfLoader
-            return PdfLoader()
-        else:
+        factory = cls._lookup(cls._LOADER_REGISTRY, "polyrag.document_loader", loader_type)
+        if factory is None:
             raise ValueError(f"Unknown loader type: {loader_type}")
+        return factory(**kwargs)
 
-    @staticmethod
-    def create_chunker(chunker_type: str = "fixed_size", **kwargs) -> ChunkingPort:
+    @classmethod
+    def create_chunker(cls, chunker_type: str = "fixed_size", **kwargs) -> ChunkingPort:
         """
         Create a chunking adapter.
 
@@ -126,12 +245,137 @@ class AdapterFactory:
 
         Returns:
             A chunking adapter instance.
+
+        Raises:
+            ValueError: If the chunker type is unknown.
         """
-        if chunker_type.lower() == "fixed_size":
-            from polyrag.adapters.chunking.fixed_size_chunker import FixedSizeChunker
-            return FixedSizeChunker(
-                chunk_size=kwargs.get("chunk_size", 500),
-                chunk_overlap=kwargs.get("chunk_overlap", 50)
-            )
-        else:
+        factory = cls._lookup(cls._CHUNKER_REGISTRY, "polyrag.chunker", chunker_type)
+        if factory is None:
             raise ValueError(f"Unknown chunker type: {chunker_type}")
+        return factory(**kwargs)
+
+    @classmethod
+    def specialize(cls, port: str, provider: str, **kwargs) -> Callable[[], Any]:
+        """
+        Pre-resolve a provider into a zero-argument adapter constructor.
+
+        The registry and entry point lookup and, for embeddings, the
+        persistent cache setup happen once here; each call of the returned
+        callable only builds the adapter. Keyword arguments are passed
+        through unchecked, as with the create_* methods. Useful for services
+        that create adapters per request. Unlike create_llm() and
+        create_embedding(), every call returns a new instance.
+
+        Args:
+            port: One of "llm", "embedding", "vector_store",
+                  "document_loader" or "chunker".
+            provider: Provider or type name registered for that port.
+            **kwargs: Provider-specific arguments, fixed for every call.
+
+        Returns:
+            A callable that takes no arguments and returns a new adapter.
+
+        Raises:
+            ValueError: If the port or provider is unknown.
+        """
+        if port not in cls._PORTS:
+            raise ValueError(f"Unknown port: {port}")
+        registry_name, group = cls._PORTS[port]
+        factory = cls._lookup(getattr(cls, registry_name), group, provider)
+        if factory is None:
+            raise ValueError(f"Unknown {port} provider: {provider}")
+
+        if port == "embedding" and kwargs.get("cache") is None and kwargs.get("cache_dir"):
+            from polyrag.adapters.embedding.embedding_cache import EmbeddingCache
+            kwargs["cache"] = EmbeddingCache(cache_dir=kwargs["cache_dir"])
+        return partial(factory, **kwargs)
+
+
+# Built-in adapters; imports stay inside the factories so optional
+# dependencies are only needed for the providers actually used
+
+@AdapterFactory.register_llm("ollama")
+def _create_ollama(**kwargs) -> LLMPort:
+    from polyrag.adapters.llm.ollama_adapter import OllamaAdapter
+    return OllamaAdapter(
+        model=kwargs.get("model", "llama3.2"),
+        base_url=kwargs.get("base_url", "http://localhost:11434")
+    )
+
+
+@AdapterFactory.register_llm("gemini")
+def _create_gemini(**kwargs) -> LLMPort:
+    from polyrag.adapters.llm.gemini_adapter import GeminiAdapter
+    return GeminiAdapter(
+        model_name=kwargs.get("model", "gemini-2.5-pro"),
+        api_key=kwargs.get("api_key")
+    )
+
+
+@AdapterFactory.register_embedding("fastembed")
+def _create_fastembed(**kwargs) -> TextEmbeddingPort:
+    from polyrag.adapters.embedding.fastembed_adapter import FastEmbedAdapter
+    return FastEmbedAdapter(
+        model_name=kwargs.get("model_name", "BAAI/bge-small-en-v1.5"),
+        batch_size=kwargs.get("batch_size", 256),
+        parallel=kwargs.get("parallel"),
+        cache=kwargs.get("cache"),
+        threads=kwargs.get("threads")
+    )
+
+
+@AdapterFactory.register_embedding("gemini")
+def _create_gemini_embedding(**kwargs) -> TextEmbeddingPort:
+    from polyrag.adapters.embedding.gemini_embedding_adapter import GeminiEmbeddingAdapter
+    return GeminiEmbeddingAdapter(
+        model_name=kwargs.get("model_name", "models/text-embedding-004"),
+        api_key=kwargs.get("api_key"),
+        cache=kwargs.get("cache")
+    )
+
+
+@AdapterFactory.register_embedding("clip")
+def _create_clip(**kwargs) -> TextEmbeddingPort:
+    from polyrag.adapters.embedding.clip_adapter import CLIPAdapter
+    return CLIPAdapter(
+        model_name=kwargs.get("model_name", "clip-ViT-B-32"),
+        cache=kwargs.get("cache"),
+        backend=kwargs.get("backend", "torch"),
+        onnx_cache_dir=kwargs.get("onnx_cache_dir"),
+        quantize=kwargs.get("quantize")
+    )
+
+
+@AdapterFactory.register_vector_store("qdrant")
+def _create_qdrant(**kwargs) -> VectorStorePort:
+    from polyrag.adapters.vector_store.qdrant_adapter import QdrantAdapter
+    return QdrantAdapter(
+        host=kwargs.get("host", "localhost"),
+        port=kwargs.get("port", 6333),
+        url=kwargs.get("url"),
+        api_key=kwargs.get("api_key"),
+        pool_size=kwargs.get("pool_size"),
+        keepalive=kwargs.get("keepalive")
+    )
+
+
+@AdapterFactory.register_document_loader("text")
+def _create_text_loader(**kwargs) -> DocumentLoaderPort:
+    from polyrag.adapters.document_loader.text_loader import TextLoader
+    return TextLoader(encoding=kwargs.get("encoding", "utf-8"))
+
+
+@AdapterFactory.register_document_loader("pdf")
+def _create_pdf_loader(**kwargs) -> DocumentLoaderPort:
+    from polyrag.adapters.document_loader.pdf_loader import PdfLoader
+    return PdfLoader()
+
+
+@AdapterFactory.register_chunker("fixed_size")
+def _create_fixed_size_chunker(**kwargs) -> ChunkingPort:
+    from polyrag.adapters.chunking.fixed_size_chunker import FixedSizeChunker
+    return FixedSizeChunker(
+        chunk_size=kwargs.get("chunk_size", 500),
+        chunk_overlap=kwargs.get("chunk_overlap", 50),
+        simhash=kwargs.get("simhash", False)
+    )
@@ -1,5 +1,17 @@
+import asyncio
 import os
-from typing import List, Iterator, Optional
+import queue
+import stat
+import string
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+from typing import AsyncIterator, List, Iterator, Optional, Tuple
+
+import numpy as np
 
 from polyrag.core.ports.llm_port import LLMPort
 from polyrag.core.ports.embedding_port import TextEmbeddingPort
@@ -10,9 +22,55 @@ from polyrag.core.ports.retriever_port import RetrieverPort
 from polyrag.core.models.models import Document, Chunk, RetrievalResult
 
 
+@lru_cache(maxsize=32)
+def _split_template(template: str) -> Optional[Tuple[str, str]]:
+    """
+    Splits a prompt template around its single {context} field.
+
+    Returns:
+        (prefix, suffix) with brace escapes resolved, or None if the template
+        uses any other field, conversion or format spec and must go through
+        str.format().
+    """
+    parts = [[], []]
+    seen_context = False
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(template):
+        parts[seen_context].append(literal)
+        if field_name is None:
+            continue
+        if field_name != "context" or format_spec or conversion or seen_context:
+            return None
+        seen_context = True
+    if not seen_context:
+        return None
+    return "".join(parts[0]), "".join(parts[1])
+
+
+@dataclass(slots=True)
+class PreparedQuery:
+    """Retrieved context and formatted system prompt, reusable across turns."""
+    formatted_system: str
+    results: List[RetrievalResult]
+
+
 class PolyRAGPipeline:
     """Main orchestrator for RAG operations."""
 
+    __slots__ = (
+        "_llm",
+        "_embedding",
+        "_vector_store",
+        "_document_loader",
+        "_chunker",
+        "_retriever",
+        "_collection_name",
+        "_embed_batch_size",
+        "_io_workers",
+        "_collection_initialized",
+        "_dimension",
+        "_short_circuit_empty",
+    )
+
     DEFAULT_SYSTEM_PROMPT = """You are a helpful assistant. Answer the user's question based on the provided context.
 If the context doesn't contain relevant information, say so honestly.
 
@@ -20,6 +78,11 @@ Context:
 {context}
 """
 
+    # Answer returned without calling the LLM when retrieval finds nothing
+    NO_CONTEXT_ANSWER = "I don't have information to answer that question."
+
+    EMPTY_CONTEXT_BEHAVIORS = ("passthrough", "short_circuit")
+
     def __init__(
         self,
         llm: LLMPort,
@@ -28,7 +91,10 @@ Context:
         document_loader: DocumentLoaderPort,
         chunker: ChunkingPort,
         retriever: RetrieverPort,
-        collection_name: str = "polyrag_default"
+        collection_name: str = "polyrag_default",
+        embed_batch_size: int = 256,
+        io_workers: int = 4,
+        empty_context_behavior: str = "passthrough"
     ):
         """
         Initialize the RAG pipeline.
@@ -41,7 +107,22 @@ Context:
             chunker: Chunking adapter for splitting documents.
             retriever: Retriever adapter for similarity search.
             collection_name: Name of the vector collection.
+            embed_batch_size: Number of chunks embedded and inserted together
+                              during ingestion; bounds peak memory.
+            io_workers: Number of threads loading files concurrently when
+                        ingesting a directory (1 loads serially).
+            empty_context_behavior: "passthrough" calls the LLM even when
+                                    retrieval finds nothing; "short_circuit"
+                                    returns NO_CONTEXT_ANSWER without an LLM call.
+
+        Raises:
+            ValueError: If empty_context_behavior is unknown.
         """
+        if empty_context_behavior not in self.EMPTY_CONTEXT_BEHAVIORS:
+            raise ValueError(
+                f"empty_context_behavior must be one of {self.EMPTY_CONTEXT_BEHAVIORS}, "
+                f"got {empty_context_behavior!r}"
+            )
         self._llm = llm
         self._embedding = embedding
         self._vector_store = vector_store
@@ -49,21 +130,35 @@ Context:
         self._chunker = chunker
         self._retriever = retriever
         self._collection_name = collection_name
+        self._embed_batch_size = embed_batch_size
+        self._io_workers = max(1, io_workers)
         self._collection_initialized = False
+        # Resolved on first use; some adapters load their model to report it
+        self._dimension: Optional[int] = None
+        self._short_circuit_empty = empty_context_behavior == "short_circuit"
 
     def _ensure_collection(self):
-        """Lazily initialize the vector collection."""
-        if not self._collection_initialized:
+        """Lazily initialize the vector collection, reusing it if it already exists."""
+        if self._collection_initialized:
+            return
+        if not self._vector_store.collection_exists(self._collection_name):
+            if self._dimension is None:
+                self._dimension = self._embedding.dimension
             self._vector_store.create_collection(
                 collection_name=self._collection_name,
-                dimension=self._embedding.dimension
+                dimension=self._dimension
             )
-            self._collection_initialized = True
+        self._collection_initialized = True
 
     def ingest(self, path: str) -> int:
         """
         Ingest a file or directory into the vector store.
 
+        Chunks are embedded and upserted in micro-batches of embed_batch_size.
+        Embedding runs on a producer thread that stays up to two batches
+        ahead of the inserts, so compute overlaps with vector-store I/O
+        while peak memory stays bounded by a few batches.
+
         Args:
             path: Path to a file or directory.
 
@@ -72,73 +167,286 @@ Context:
         """
         self._ensure_collection()
 
-        documents: List[Document] = []
-
-        if os.path.isfile(path):
-            doc = self._document_loader.load(path)
-            documents.append(doc)
-        elif os.path.isdir(path):
-            for root, _, files in os.walk(path):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    ext = os.path.splitext(file)[1].lower()
-                    if ext in self._document_loader.supported_extensions:
-                        try:
-                            doc = self._document_loader.load(file_path)
-                            documents.append(doc)
-                        except Exception as e:
-                            print(f"Warning: Could not load {file_path}: {e}")
-        else:
-            raise FileNotFoundError(f"Path not found: {path}")
+        batches: "queue.Queue" = queue.Queue(maxsize=2)
+        stop = threading.Event()
+
+        def produce():
+            try:
+                for batch, embeddings in self._iter_embedded_batches(path):
+                    # Columnar hand-off: the matrix goes to the store as is
+                    columns = ([c.id for c in batch], embeddings, [c.payload() for c in batch])
+                    if not self._offer(batches, columns, stop):
+                        return
+                item = None  # End-of-stream sentinel
+            except BaseException as e:
+                item = e
+            self._offer(batches, item, stop)
+
+        producer = threading.Thread(target=produce, name="polyrag-ingest-embed", daemon=True)
+        producer.start()
+
+        total = 0
+        try:
+            while True:
+                item = batches.get()
+                if item is None:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                ids, embeddings, payloads = item
+                self._vector_store.insert_vectors(self._collection_name, ids, embeddings, payloads)
+                total += len(ids)
+        finally:
+            # Unblocks the producer if the consumer stopped early
+            stop.set()
+            producer.join()
+        return total
+
+    @staticmethod
+    def _offer(q: "queue.Queue", item: object, stop: threading.Event) -> bool:
+        """Puts an item on a bounded queue, giving up once stop is set."""
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def ingest_stream(self, path: str) -> Iterator[Chunk]:
+        """
+        Lazily loads, chunks and embeds a file or directory.
 
-        # Chunk all documents
-        all_chunks: List[Chunk] = []
-        for doc in documents:
-            chunks = self._chunker.chunk(doc)
-            all_chunks.extend(chunks)
-
-        # Embed all chunks
-        if all_chunks:
-            texts = [c.content for c in all_chunks]
-            embeddings = self._embedding.embed_texts(texts)
-            for chunk, embedding in zip(all_chunks, embeddings):
+        Args:
+            path: Path to a file or directory.
+
+        Yields:
+            Chunks with embeddings, in document order.
+
+        Raises:
+            FileNotFoundError: If the path does not exist (on first iteration).
+        """
+        for batch, embeddings in self._iter_embedded_batches(path):
+            # Each chunk holds a row view of the batch matrix
+            for chunk, embedding in zip(batch, embeddings):
                 chunk.embedding = embedding
+            yield from batch
 
-            # Store in vector DB
-            self._vector_store.insert(self._collection_name, all_chunks)
+    def _iter_chunks(self, documents: Iterator[Document]) -> Iterator[Chunk]:
+        """Yields the chunks of each document in turn."""
+        for doc in documents:
+            yield from self._chunker.chunk(doc)
 
-        return len(all_chunks)
+    def _iter_embedded_batches(self, path: str) -> Iterator[Tuple[List[Chunk], np.ndarray]]:
+        """
+        Yields up to embed_batch_size chunks with their float32 embedding matrix.
 
-    def query(
+        The retriever annotates each batch first (e.g. ColBERT document
+        tokens), so the annotations reach the stored payloads.
+        """
+        chunks = self._iter_chunks(self._load_documents(path))
+        while True:
+            batch = list(islice(chunks, self._embed_batch_size))
+            if not batch:
+                return
+            self._retriever.prepare_chunks(batch)
+            yield batch, self._embed_unique([c.content for c in batch])
+
+    def _embed_unique(self, texts: List[str]) -> np.ndarray:
+        """
+        Embeds texts, running the model once per distinct text.
+
+        Repeated boilerplate (headers, footers, tables repeated across
+        pages) is embedded once and its row broadcast to every occurrence.
+        """
+        # Text -> row in the unique matrix; dict order matches first occurrence
+        rows = {}
+        indices = [rows.setdefault(text, len(rows)) for text in texts]
+        if len(rows) == len(texts):
+            return self._embedding.embed_texts_np(texts)
+        return self._embedding.embed_texts_np(list(rows))[indices]
+
+    def _load_documents(self, path: str) -> Iterator[Document]:
+        """
+        Yields the documents at a file or directory path, skipping unreadable files.
+
+        Directory files are loaded on io_workers threads (loaders spend most
+        of their time in I/O and C parsers that release the GIL). At most
+        2 * io_workers loads run ahead of the consumer, and documents are
+        yielded in directory order.
+        """
+        # One stat call classifies the path (isfile + isdir would make two)
+        try:
+            mode = os.stat(path).st_mode
+        except OSError as e:
+            raise FileNotFoundError(f"Path not found: {path}") from e
+        if stat.S_ISREG(mode):
+            yield self._document_loader.load(path)
+            return
+        if not stat.S_ISDIR(mode):
+            raise FileNotFoundError(f"Path not found: {path}")
+
+        # Snapshot once: O(1) membership and no attribute lookups per file
+        extensions = frozenset(e.lower() for e in self._document_loader.supported_extensions)
+        splitext = os.path.splitext
+        candidates = [
+            file_path
+            for file_path, name in self._iter_files(path)
+            if splitext(name)[1].lower() in extensions
+        ]
+
+        if self._io_workers == 1:
+            for file_path in candidates:
+                doc = self._safe_load(file_path)
+                if doc is not None:
+                    yield doc
+            return
+
+        with ThreadPoolExecutor(max_workers=self._io_workers) as executor:
+            pending = deque()
+            for file_path in candidates:
+                pending.append(executor.submit(self._safe_load, file_path))
+                if len(pending) >= 2 * self._io_workers:
+                    doc = pending.popleft().result()
+                    if doc is not None:
+                        yield doc
+            while pending:
+                doc = pending.popleft().result()
+                if doc is not None:
+                    yield doc
+
+    @classmethod
+    def _iter_files(cls, directory: str) -> Iterator[Tuple[str, str]]:
+        """
+        Recursively yields (path, name) for the files under a directory.
+
+        Uses os.scandir directly, whose entries carry the file type from the
+        directory read, so classifying an entry needs no extra stat call.
+        Like os.walk, symlinked directories are not followed and unreadable
+        directories are skipped.
+        """
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            return
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from cls._iter_files(entry.path)
+                elif entry.is_file():
+                    yield entry.path, entry.name
+
+    def _safe_load(self, file_path: str) -> Optional[Document]:
+        """Loads a file, returning None (with a warning) if it cannot be read."""
+        try:
+            return self._document_loader.load(file_path)
+        except Exception as e:
+            print(f"Warning: Could not load {file_path}: {e}")
+            return None
+
+    def prepare(
         self,
         question: str,
         top_k: int = 5,
         system_prompt: Optional[str] = None
-    ) -> str:
+    ) -> "PreparedQuery":
         """
-        Query the RAG pipeline.
+        Retrieves context for a question and formats the system prompt once.
+
+        The result can be passed to query_with()/query_stream_with() for the
+        question and any follow-up turns that share the same context
+        (e.g. "elaborate", "translate"), skipping repeated retrieval.
 
         Args:
-            question: The user's question.
+            question: The question used for retrieval.
             top_k: Number of chunks to retrieve.
             system_prompt: Optional custom system prompt (use {context} placeholder).
 
         Returns:
-            The generated answer.
+            A PreparedQuery holding the results and the formatted system prompt.
         """
-        # Retrieve relevant chunks
         results = self._retriever.retrieve(question, limit=top_k)
+        return self._prepared_from(results, system_prompt)
+
+    async def aprepare(
+        self,
+        question: str,
+        top_k: int = 5,
+        system_prompt: Optional[str] = None
+    ) -> "PreparedQuery":
+        """
+        Asynchronous prepare(), awaiting the retriever's aretrieve().
+
+        Args:
+            question: The question used for retrieval.
+            top_k: Number of chunks to retrieve.
+            system_prompt: Optional custom system prompt (use {context} placeholder).
 
-        # Build context from retrieved chunks
+        Returns:
+            A PreparedQuery holding the results and the formatted system prompt.
+        """
+        results = await self._retriever.aretrieve(question, limit=top_k)
+        return self._prepared_from(results, system_prompt)
+
+    def _prepared_from(self, results: List[RetrievalResult], system_prompt: Optional[str]) -> "PreparedQuery":
+        """Builds a PreparedQuery from retrieval results."""
         context = self._build_context(results)
+        return PreparedQuery(
+            formatted_system=self._format_system_prompt(system_prompt, context),
+            results=results
+        )
+
+    def query_with(self, prepared: "PreparedQuery", question: str) -> str:
+        """
+        Generates an answer using previously prepared context.
+
+        Args:
+            prepared: Result of prepare().
+            question: The user's question or follow-up.
+
+        Returns:
+            The generated answer.
+        """
+        if self._short_circuit_empty and not prepared.results:
+            return self.NO_CONTEXT_ANSWER
+        return self._llm.generate(question, system_prompt=prepared.formatted_system)
+
+    def query_stream_with(self, prepared: "PreparedQuery", question: str) -> Iterator[str]:
+        """
+        Streams an answer using previously prepared context.
+
+        Not a generator itself: the LLM's stream is returned directly, so
+        callers iterate it without an extra delegating frame per chunk.
+
+        Args:
+            prepared: Result of prepare().
+            question: The user's question or follow-up.
 
-        # Use default or custom system prompt
-        prompt_template = system_prompt or self.DEFAULT_SYSTEM_PROMPT
-        formatted_system = prompt_template.format(context=context)
+        Returns:
+            An iterator over chunks of the generated answer.
+        """
+        if self._short_circuit_empty and not prepared.results:
+            return iter((self.NO_CONTEXT_ANSWER,))
+        return iter(self._llm.generate_stream(question, system_prompt=prepared.formatted_system))
+
+    def query(
+        self,
+        question: str,
+        top_k: int = 5,
+        system_prompt: Optional[str] = None
+    ) -> str:
+        """
+        Query the RAG pipeline.
 
-        # Generate response
-        response = self._llm.generate(question, system_prompt=formatted_system)
-        return response
+        Args:
+            question: The user's question.
+            top_k: Number of chunks to retrieve.
+            system_prompt: Optional custom system prompt (use {context} placeholder).
+
+        Returns:
+            The generated answer.
+        """
+        return self.query_with(self.prepare(question, top_k, system_prompt), question)
 
     def query_stream(
         self,
@@ -157,20 +465,82 @@ Context:
         Yields:
             Chunks of the generated answer.
         """
-        # Retrieve relevant chunks
-        results = self._retriever.retrieve(question, limit=top_k)
+        yield from self.query_stream_with(self.prepare(question, top_k, system_prompt), question)
 
-        # Build context
-        context = self._build_context(results)
+    async def aingest(self, path: str) -> int:
+        """
+        Asynchronously ingest a file or directory into the vector store.
+
+        Runs ingest() in a worker thread, so an event loop stays responsive
+        while files are loaded, embedded and inserted.
+
+        Args:
+            path: Path to a file or directory.
+
+        Returns:
+            Number of chunks ingested.
+        """
+        return await asyncio.to_thread(self.ingest, path)
+
+    async def aquery(
+        self,
+        question: str,
+        top_k: int = 5,
+        system_prompt: Optional[str] = None
+    ) -> str:
+        """
+        Asynchronously query the RAG pipeline.
+
+        Retrieval and generation are awaited through the ports' async
+        methods, so concurrent queries share one event loop.
+
+        Args:
+            question: The user's question.
+            top_k: Number of chunks to retrieve.
+            system_prompt: Optional custom system prompt (use {context} placeholder).
 
-        # Format system prompt
-        prompt_template = system_prompt or self.DEFAULT_SYSTEM_PROMPT
-        formatted_system = prompt_template.format(context=context)
+        Returns:
+            The generated answer.
+        """
+        prepared = await self.aprepare(question, top_k, system_prompt)
+        if self._short_circuit_empty and not prepared.results:
+            return self.NO_CONTEXT_ANSWER
+        return await self._llm.agenerate(question, system_prompt=prepared.formatted_system)
 
-        # Stream response
-        for chunk in self._llm.generate_stream(question, system_prompt=formatted_system):
+    async def aquery_stream(
+        self,
+        question: str,
+        top_k: int = 5,
+        system_prompt: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Asynchronously query the RAG pipeline with streaming response.
+
+        Args:
+            question: The user's question.
+            top_k: Number of chunks to retrieve.
+            system_prompt: Optional custom system prompt.
+
+        Yields:
+            Chunks of the generated answer.
+        """
+        prepared = await self.aprepare(question, top_k, system_prompt)
+        if self._short_circuit_empty and not prepared.results:
+            yield self.NO_CONTEXT_ANSWER
+            return
+        async for chunk in self._llm.agenerate_stream(question, system_prompt=prepared.formatted_system):
             yield chunk
 
+    def _format_system_prompt(self, system_prompt: Optional[str], context: str) -> str:
+        """Fills the {context} placeholder of the custom or default template."""
+        template = system_prompt or self.DEFAULT_SYSTEM_PROMPT
+        # Templates are split once (and memoized), so the hot path is a concatenation
+        split = _split_template(template)
+        if split is None:
+            return template.format(context=context)
+        prefix, suffix = split
+        return prefix + context + suffix
+
     def _build_context(self, results: List[RetrievalResult]) -> str:
         """
         Build context string from retrieval results.
@@ -184,12 +554,13 @@ Context:
         if not results:
             return "No relevant context found."
 
-        context_parts = []
-        for i, result in enumerate(results, 1):
-            source = result.chunk.metadata.get("file_name", "Unknown source")
-            context_parts.append(f"[{i}] (Source: {source}, Score: {result.score:.3f})\n{result.chunk.content}")
-
-        return "\n\n".join(context_parts)
+        # str.join materializes its argument anyway, so a list comprehension
+        # is cheaper than a generator here
+        return "\n\n".join([
+            f"[{i}] (Source: {r.chunk.metadata.get('file_name', 'Unknown source')}, "
+            f"Score: {r.score:.3f})\n{r.chunk.content}"
+            for i, r in enumerate(results, 1)
+        ])
 
     def get_retrieval_results(self, question: str, top_k: int = 5) -> List[RetrievalResult]:
         """